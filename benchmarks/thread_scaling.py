@@ -0,0 +1,108 @@
+"""
+Benchmark of how well webcolors' conversion functions scale across threads.
+
+Runs a fixed workload of conversions in each of 1, 2, 4, ... up to N threads at once
+(each thread doing the same amount of work), and reports the wall-clock time, the
+speedup over a single thread, and the scaling efficiency (speedup divided by the number
+of threads). On a standard build of Python, the global interpreter lock keeps the
+speedup near 1. On a free-threaded build, the speedup should grow close to linearly
+with the number of threads, up to the number of available cores.
+
+Run with::
+
+    python benchmarks/thread_scaling.py [--threads N] [--repeat R]
+
+or, to compare standard and free-threaded builds, via ``nox``::
+
+    python -m nox --session benchmark_threads
+
+"""
+
+# SPDX-License-Identifier: BSD-3-Clause
+
+import argparse
+import concurrent.futures
+import os
+import sys
+import threading
+import time
+
+import webcolors
+
+HEX_VALUES = [f"#{value:06x}" for value in range(0, 0xFFFFFF, 0xFFFFFF // 500)]
+NAMES = webcolors.names(webcolors.CSS3)
+LEGACY_VALUES = ["chucknorris", "Window", "#fff", " navy ", "#abcdefgh", "crap"]
+
+
+def workload(repeat: int) -> None:
+    """
+    Run a representative mix of conversions ``repeat`` times.
+
+    """
+    for _ in range(repeat):
+        for hex_value in HEX_VALUES:
+            rgb = webcolors.hex_to_rgb(hex_value)
+            webcolors.rgb_to_hex(rgb)
+            webcolors.rgb_to_rgb_percent(rgb)
+            webcolors.rgb_to_hsl(rgb)
+        for name in NAMES:
+            webcolors.rgb_to_name(webcolors.name_to_rgb(name))
+        for value in LEGACY_VALUES:
+            webcolors.html5_parse_legacy_color(value)
+        webcolors.k_nearest_names((12, 200, 34), k=3)
+
+
+def run(threads: int, repeat: int) -> float:
+    """
+    Run the workload in the given number of threads at once, and return the elapsed
+    wall-clock time in seconds.
+
+    """
+    barrier = threading.Barrier(threads + 1)
+
+    def task() -> None:
+        barrier.wait()
+        workload(repeat)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
+        futures = [executor.submit(task) for _ in range(threads)]
+        barrier.wait()
+        start = time.perf_counter()
+        for future in futures:
+            future.result()
+        return time.perf_counter() - start
+
+
+def main() -> None:
+    """
+    Run the benchmark and print a report.
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--threads", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version}")
+    print(f"GIL enabled: {is_gil_enabled}; CPUs: {os.cpu_count()}")
+
+    # Warm up, so that lazily-built lookup structures are not part of the timing.
+    workload(1)
+    baseline = run(1, args.repeat)
+    print(f"{'threads':>8} {'seconds':>9} {'speedup':>8} {'efficiency':>11}")
+    threads = 1
+    while threads <= args.threads:
+        elapsed = baseline if threads == 1 else run(threads, args.repeat)
+        # Each thread does the full workload, so perfect scaling keeps the elapsed time
+        # equal to the single-thread time.
+        speedup = threads * baseline / elapsed
+        print(
+            f"{threads:>8} {elapsed:>9.3f} {speedup:>8.2f} "
+            f"{speedup / threads:>10.0%}"
+        )
+        threads *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -19,7 +19,7 @@ import typing
 import nox
 
 nox.options.default_venv_backend = "venv"
-nox.options.keywords = "not release"
+nox.options.keywords = "not release and not benchmarks"
 nox.options.reuse_existing_virtualenvs = True
 
 PACKAGE_NAME = "webcolors"
@@ -130,6 +130,27 @@ def tests_full_colors(session: nox.Session) -> None:
     clean()
 
 
+# Benchmarks.
+# -----------------------------------------------------------------------------------
+
+
+@nox.session(python=["3.13", "3.13t"], tags=["benchmarks"])
+def benchmark_threads(session: nox.Session) -> None:
+    """
+    Report how well the conversion functions scale across threads, on both standard
+    and free-threaded builds of Python.
+
+    """
+    session.install(".")
+    session.run(
+        f"python{session.python}",
+        "-I",
+        "benchmarks/thread_scaling.py",
+        *session.posargs,
+    )
+    clean()
+
+
 # Tasks which test the package's documentation.
 # -----------------------------------------------------------------------------------
 
@@ -235,6 +256,7 @@ def format_black(session: nox.Session) -> None:
         "black",
         "--check",
         "--diff",
+        "benchmarks/",
         "src/",
         "tests/",
         "docs/",
@@ -257,6 +279,7 @@ def format_isort(session: nox.Session) -> None:
         "isort",
         "--check-only",
         "--diff",
+        "benchmarks/",
         "src/",
         "tests/",
         "docs/",
@@ -302,6 +325,7 @@ def lint_flake8(session: nox.Session) -> None:
         f"python{session.python}",
         "-Im",
         "flake8",
+        "benchmarks/",
         "src/",
         "tests/",
         "docs/",
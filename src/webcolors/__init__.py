@@ -9,6 +9,37 @@ supported formats, conventions and conversions.
 
 # SPDX-License-Identifier: BSD-3-Clause
 
+from ._batch import (
+    factorize,
+    hex_buffers_to_packed,
+    hex_buffers_to_rgb,
+    hex_record_file_to_rgb,
+    hex_records_to_rgb,
+    hex_to_name_batch,
+    hex_to_packed_array,
+    hex_to_rgb_batch,
+    hex_to_rgb_columns,
+    map_factorized,
+    map_unique,
+    name_to_hex_batch,
+)
+from ._colorspaces import (
+    hsl_to_rgb,
+    hsl_to_rgb_array,
+    hwb_to_rgb,
+    hwb_to_rgb_array,
+    rgb_to_hsl,
+    rgb_to_hsl_array,
+    rgb_to_hwb,
+    rgb_to_hwb_array,
+)
+from ._contrast import (
+    contrast_ratio,
+    contrast_ratio_array,
+    names_with_contrast,
+    relative_luminance,
+    relative_luminance_array,
+)
 from ._conversion import (
     hex_to_name,
     hex_to_rgb,
@@ -23,18 +54,79 @@ from ._conversion import (
     rgb_to_name,
     rgb_to_rgb_percent,
 )
-from ._definitions import CSS2, CSS3, CSS21, HTML4, names
+from ._definitions import (
+    CSS2,
+    CSS3,
+    CSS21,
+    HTML4,
+    hex_to_name_mapping,
+    name_to_hex_mapping,
+    names,
+    names_tuple,
+)
 from ._html5 import (
     html5_parse_legacy_color,
     html5_parse_simple_color,
     html5_serialize_simple_color,
 )
+from ._interpolation import interpolate
+from ._lookup import complete_names, suggest_names
+from ._nearest import (
+    NameHistogram,
+    distance_matrix,
+    k_nearest_names,
+    k_nearest_names_batch,
+    rgb_buffer_to_name_indexes,
+)
 from ._normalization import (
     normalize_hex,
     normalize_integer_triplet,
     normalize_percent_triplet,
 )
-from ._types import HTML5SimpleColor, IntegerRGB, IntTuple, PercentRGB, PercentTuple
+from ._parallel import hex_to_packed_parallel, hex_to_rgb_parallel
+from ._pipeline import ColorPipeline, pipeline
+from ._shared import (
+    SharedLegacyColorCache,
+    SharedPaletteIndex,
+    build_legacy_color_cache,
+    build_palette_index,
+)
+from ._snapping import snap_hex, snap_packed, snap_rgb, snap_rgb_buffer
+from ._storage import (
+    ColorFile,
+    color_file_to_hex_file,
+    hex_file_to_color_file,
+    read_color_file,
+    write_color_file,
+)
+from ._streaming import convert_stream, hex_to_rgb_stream
+from ._terminal import (
+    rgb_buffer_to_xterm16,
+    rgb_buffer_to_xterm256,
+    rgb_to_xterm16,
+    rgb_to_xterm256,
+    xterm_buffer_to_rgb,
+    xterm_to_hex,
+    xterm_to_rgb,
+)
+from ._types import (
+    HSL,
+    HWB,
+    BatchResult,
+    ColorBuffers,
+    ConversionErrors,
+    DecodedRecords,
+    Factorized,
+    HSLTuple,
+    HTML5SimpleColor,
+    HWBTuple,
+    IntegerRGB,
+    IntTuple,
+    NameCount,
+    NameDistance,
+    PercentRGB,
+    PercentTuple,
+)
 
 __all__ = [
     "HTML4",
@@ -48,12 +140,74 @@ __all__ = [
     "hex_to_rgb",
     "hex_to_rgb_percent",
     "names",
+    "names_tuple",
+    "name_to_hex_mapping",
+    "hex_to_name_mapping",
+    "complete_names",
+    "suggest_names",
     "rgb_to_hex",
     "rgb_to_name",
     "rgb_to_rgb_percent",
     "rgb_percent_to_hex",
     "rgb_percent_to_name",
     "rgb_percent_to_rgb",
+    "rgb_to_hsl",
+    "rgb_to_hsl_array",
+    "rgb_to_hwb",
+    "rgb_to_hwb_array",
+    "hsl_to_rgb",
+    "hsl_to_rgb_array",
+    "hwb_to_rgb",
+    "hwb_to_rgb_array",
+    "relative_luminance",
+    "relative_luminance_array",
+    "contrast_ratio",
+    "contrast_ratio_array",
+    "names_with_contrast",
+    "interpolate",
+    "hex_to_packed_array",
+    "hex_to_rgb_columns",
+    "hex_to_rgb_batch",
+    "name_to_hex_batch",
+    "hex_to_name_batch",
+    "factorize",
+    "map_factorized",
+    "map_unique",
+    "hex_to_rgb_parallel",
+    "hex_to_packed_parallel",
+    "hex_buffers_to_rgb",
+    "hex_buffers_to_packed",
+    "hex_records_to_rgb",
+    "hex_record_file_to_rgb",
+    "rgb_buffer_to_name_indexes",
+    "NameHistogram",
+    "distance_matrix",
+    "k_nearest_names",
+    "k_nearest_names_batch",
+    "SharedPaletteIndex",
+    "build_palette_index",
+    "SharedLegacyColorCache",
+    "build_legacy_color_cache",
+    "snap_rgb",
+    "snap_hex",
+    "snap_packed",
+    "snap_rgb_buffer",
+    "write_color_file",
+    "read_color_file",
+    "ColorFile",
+    "hex_file_to_color_file",
+    "color_file_to_hex_file",
+    "convert_stream",
+    "hex_to_rgb_stream",
+    "pipeline",
+    "ColorPipeline",
+    "rgb_to_xterm256",
+    "rgb_to_xterm16",
+    "xterm_to_hex",
+    "xterm_to_rgb",
+    "rgb_buffer_to_xterm256",
+    "rgb_buffer_to_xterm16",
+    "xterm_buffer_to_rgb",
     "html5_parse_simple_color",
     "html5_parse_legacy_color",
     "html5_serialize_simple_color",
@@ -63,6 +217,17 @@ __all__ = [
     "IntegerRGB",
     "PercentRGB",
     "HTML5SimpleColor",
+    "HSL",
+    "HWB",
+    "NameCount",
+    "NameDistance",
+    "ColorBuffers",
+    "DecodedRecords",
+    "BatchResult",
+    "ConversionErrors",
+    "Factorized",
     "IntTuple",
     "PercentTuple",
+    "HSLTuple",
+    "HWBTuple",
 ]
@@ -0,0 +1,803 @@
+"""
+Conversion of whole columns of color values at once.
+
+"""
+
+# SPDX-License-Identifier: BSD-3-Clause
+
+import itertools
+import mmap
+import os
+import string
+import sys
+import typing
+from array import array
+
+from ._definitions import (
+    _HEX_COLOR_RE,
+    CSS3,
+    _get_cased_name_to_hex_map,
+    _get_hex_to_name_map,
+)
+from ._normalization import normalize_hex
+from ._types import (
+    BatchResult,
+    ColorBuffers,
+    ConversionErrors,
+    DecodedRecords,
+    Factorized,
+    IntegerRGB,
+)
+
+T = typing.TypeVar("T")
+
+# The key standing in for values which are not strings, when some value is unhashable.
+_NOT_A_STRING = object()
+
+
+def _convert_unique(
+    hex_values: typing.Iterable[str], encode: typing.Callable[[int], bytes]
+) -> bytes:
+    """
+    Internal helper converting each of an iterable of hexadecimal color values to its
+    packed integer value, encoding that as bytes with ``encode``, and returning the
+    concatenation of the results.
+
+    Each distinct value is only normalized and converted once; repeated values are
+    looked up, and the results are joined without a Python-level loop.
+
+    :raises ValueError: when any of the values is not a valid hexadecimal color value.
+
+    """
+    values = list(hex_values)
+    unique = dict.fromkeys(values)
+    for hex_value in unique:
+        unique[hex_value] = encode(int(normalize_hex(hex_value)[1:], 16))
+    return b"".join(map(unique.__getitem__, values))
+
+
+def hex_to_packed_array(hex_values: typing.Iterable[str]) -> array:
+    """
+    Convert each of an iterable of hexadecimal color values to a packed integer, of
+    the form ``red << 16 | green << 8 | blue``, returning an :class:`array.array` of
+    unsigned 32-bit integers (typecode ``"I"``).
+
+    Each value is normalized as by :func:`normalize_hex` before being converted, but
+    each distinct value is only converted once, so columns with few distinct colors
+    convert much faster than by calling :func:`hex_to_rgb` per value. The result
+    supports the buffer protocol, so it can be wrapped without copying by, for
+    example, :func:`numpy.frombuffer` to form a column of a :mod:`pandas` data frame.
+    Since webcolors does not depend on :mod:`pandas`, it registers no accessor on
+    series; the documentation shows how to register one which converts through this
+    function.
+
+    Examples:
+
+    .. doctest::
+
+        >>> hex_to_packed_array(["#fff", "#000080", "#fff"])
+        array('I', [16777215, 128, 16777215])
+
+    :param hex_values: The hexadecimal color values to convert.
+    :raises ValueError: when any of the values is not a valid hexadecimal color value.
+
+    """
+    packed = array("I")
+    packed.frombytes(
+        _convert_unique(hex_values, lambda value: value.to_bytes(4, sys.byteorder))
+    )
+    return packed
+
+
+def hex_to_rgb_columns(
+    hex_values: typing.Iterable[str],
+) -> typing.Tuple[array, array, array]:
+    """
+    Convert each of an iterable of hexadecimal color values to an ``rgb()`` triplet,
+    returning the red, green and blue components of the triplets as three separate
+    :class:`array.array` columns of unsigned bytes (typecode ``"B"``).
+
+    As with :func:`hex_to_packed_array`, each value is normalized before being
+    converted, each distinct value is only converted once, and the columns can be
+    used without copying by anything which supports the buffer protocol.
+
+    Examples:
+
+    .. doctest::
+
+        >>> red, green, blue = hex_to_rgb_columns(["#fff", "#000080", "#daa520"])
+        >>> red
+        array('B', [255, 0, 218])
+        >>> blue
+        array('B', [255, 128, 32])
+
+    :param hex_values: The hexadecimal color values to convert.
+    :raises ValueError: when any of the values is not a valid hexadecimal color value.
+
+    """
+    triplets = _convert_unique(hex_values, lambda value: value.to_bytes(3, "big"))
+    return (
+        array("B", triplets[0::3]),
+        array("B", triplets[1::3]),
+        array("B", triplets[2::3]),
+    )
+
+
+# Conversion of columns with few distinct values, by any conversion function.
+# --------------------------------------------------------------------------------
+
+
+def _as_list(values: typing.Iterable[T]) -> typing.List[T]:
+    """
+    Internal helper returning the values of an iterable as a :class:`list`.
+
+    Arrays with a ``tolist()`` method -- such as NumPy arrays, :mod:`pandas` series and
+    :class:`array.array` -- are converted by it, which builds every value as a Python
+    object at once, rather than a NumPy scalar per value when iterated over.
+
+    """
+    if callable(tolist := getattr(values, "tolist", None)):
+        return tolist()
+    return list(values)
+
+
+def factorize(values: typing.Iterable[typing.Hashable]) -> Factorized:
+    """
+    Factorize an iterable of values into its distinct values, in order of first
+    appearance, and the position among those of each value.
+
+    Real-world columns of colors usually hold a few hundred distinct values over
+    millions of rows; once factorized, each distinct value need only be converted
+    once, with :func:`map_factorized`. The factorization is built by dictionary
+    operations which run without a Python-level loop, and the codes support the
+    buffer protocol, so they can be wrapped without copying by, for example,
+    :func:`numpy.frombuffer`.
+
+    NumPy is not required: a NumPy array or :mod:`pandas` series is read with its
+    ``tolist()`` method, which is about twice as fast as iterating over it. Where
+    NumPy or :mod:`pandas` is at hand, :func:`numpy.unique` with
+    ``return_inverse=True`` or :func:`pandas.factorize` give a factorization which
+    :func:`map_factorized` accepts as well.
+
+    Examples:
+
+    .. doctest::
+
+        >>> factorize(["#fff", "navy", "#fff", "#fff"])
+        Factorized(uniques=['#fff', 'navy'], codes=array('I', [0, 1, 0, 0]))
+
+    :param values: The values to factorize, which must be hashable.
+
+    """
+    values = _as_list(values)
+    positions = dict(zip(dict.fromkeys(values), itertools.count()))
+    return Factorized(list(positions), array("I", map(positions.__getitem__, values)))
+
+
+def map_factorized(
+    function: typing.Callable[[typing.Any], T],
+    uniques: typing.Iterable[typing.Any],
+    codes: typing.Iterable[int],
+) -> typing.List[T]:
+    """
+    Convert each distinct value of a factorized column with ``function``, and scatter
+    the results back to the rows of the column, returning a :class:`list` with one
+    result per code.
+
+    The factorization may come from :func:`factorize`, or from elsewhere -- such as
+    :func:`pandas.factorize`, :func:`numpy.unique` with ``return_inverse=True``, or
+    the categories and codes of a categorical column -- since the codes may be any
+    iterable of integers. NumPy arrays of uniques or codes are read with their
+    ``tolist()`` method, as for :func:`factorize`. Exceptions raised by ``function``
+    propagate.
+
+    Examples:
+
+    .. doctest::
+
+        >>> map_factorized(name_to_hex, ["navy", "Goldenrod"], [0, 1, 1, 0])
+        ['#000080', '#daa520', '#daa520', '#000080']
+
+    :param function: The function converting a single value, such as
+       :func:`hex_to_rgb`, :func:`name_to_hex` or :func:`html5_parse_legacy_color`.
+    :param uniques: The distinct values of the column.
+    :param codes: The position among ``uniques`` of the value of each row.
+    :raises IndexError: when a code is not the position of a distinct value.
+
+    """
+    return list(
+        map(list(map(function, _as_list(uniques))).__getitem__, _as_list(codes))
+    )
+
+
+def map_unique(
+    function: typing.Callable[[typing.Any], T],
+    values: typing.Iterable[typing.Hashable],
+) -> typing.List[T]:
+    """
+    Convert each of an iterable of values with ``function``, calling it only once per
+    distinct value, and return a :class:`list` of the results in the order of the
+    values.
+
+    This gives the same results as ``list(map(function, values))``, but when values
+    repeat -- as they do in most real-world columns of colors -- most of them are
+    converted by a dictionary lookup rather than a call of ``function``. To convert
+    with a conversion taking further arguments, such as a ``spec``, pass a
+    :func:`functools.partial`. NumPy arrays and :mod:`pandas` series are read with
+    their ``tolist()`` method, as for :func:`factorize`. Exceptions raised by
+    ``function`` propagate.
+
+    Examples:
+
+    .. doctest::
+
+        >>> map_unique(html5_parse_legacy_color, ["black", "chucknorris", "black"])
+        [HTML5SimpleColor(red=0, green=0, blue=0),
+         HTML5SimpleColor(red=192, green=0, blue=0),
+         HTML5SimpleColor(red=0, green=0, blue=0)]
+
+    :param function: The function converting a single value, such as
+       :func:`hex_to_rgb`, :func:`name_to_hex` or :func:`html5_parse_legacy_color`.
+    :param values: The values to convert, which must be hashable.
+
+    """
+    values = _as_list(values)
+    unique = dict.fromkeys(values)
+    results = dict(zip(unique, map(function, unique)))
+    return list(map(results.__getitem__, values))
+
+
+# Conversion of columns which may hold invalid values, collecting errors.
+# --------------------------------------------------------------------------------
+
+
+def _convert_collecting(
+    values: typing.Iterable[typing.Any],
+    convert: typing.Callable[[str], typing.Any],
+    spec: typing.Optional[str] = None,
+) -> BatchResult:
+    """
+    Internal helper converting each of an iterable of values with ``convert``, which
+    returns either the converted value or, for a value which cannot be converted, the
+    :class:`int` code of the error.
+
+    Each distinct value is only converted once, and the results are gathered, and the
+    failures found, without a Python-level loop over every value. Values which are not
+    strings, including unhashable values, are never passed to ``convert``, but fail
+    with the code :attr:`~ConversionErrors.NOT_A_STRING`.
+
+    """
+    values = list(values)
+    try:
+        keys = values
+        unique = dict.fromkeys(keys)
+    except TypeError:
+        # Some value is unhashable, and so is not a string; every value which is not a
+        # string is looked up by a single stand-in key instead.
+        keys = [value if isinstance(value, str) else _NOT_A_STRING for value in values]
+        unique = dict.fromkeys(keys)
+    results = dict.fromkeys(unique, ConversionErrors.NOT_A_STRING)
+    strings = [value for value in unique if isinstance(value, str)]
+    results.update(zip(strings, map(convert, strings)))
+    failed = {key: code for key, code in results.items() if isinstance(code, int)}
+    for key in failed:
+        results[key] = None
+    converted = list(map(results.__getitem__, keys))
+    indexes = array("Q")
+    if failed:
+        # Failed values, and only those, convert to None.
+        index = converted.index(None)
+        while True:
+            indexes.append(index)
+            try:
+                index = converted.index(None, index + 1)
+            except ValueError:
+                break
+    return BatchResult(
+        converted,
+        ConversionErrors(
+            indexes,
+            bytes(failed[keys[index]] for index in indexes),
+            [values[index] for index in indexes],
+            spec,
+        ),
+    )
+
+
+def _hex_to_rgb_or_code(hex_value: str) -> typing.Union[IntegerRGB, int]:
+    """
+    Internal helper converting a hexadecimal color value to an integer ``rgb()``
+    triplet, or returning the code of the error if it is invalid.
+
+    """
+    if (match := _HEX_COLOR_RE.match(hex_value)) is None:
+        return ConversionErrors.INVALID_HEX
+    # The digits are parsed straight from the match, rather than normalizing the value
+    # and so matching it again.
+    hex_digits = match.group(1)
+    if len(hex_digits) == 3:
+        hex_digits = "".join(2 * s for s in hex_digits)
+    int_value = int(hex_digits, 16)
+    return IntegerRGB._make((int_value >> 16, int_value >> 8 & 0xFF, int_value & 0xFF))
+
+
+def hex_to_rgb_batch(hex_values: typing.Iterable[str]) -> BatchResult:
+    """
+    Convert each of an iterable of hexadecimal color values to an integer ``rgb()``
+    triplet, as :func:`hex_to_rgb` does, without raising an exception for invalid
+    values.
+
+    Every valid value is converted, in one pass over the batch, and each invalid value
+    is recorded in the result's :attr:`~BatchResult.errors` by its position and an
+    error code; the messages of the errors are only formatted when asked for, so
+    batches with many invalid values cost no more to convert than batches without.
+    As with :func:`hex_to_packed_array`, each distinct value is only converted once.
+    Values which are not strings -- such as :data:`None`, or the NaN which marks a
+    missing value in :mod:`pandas` -- are recorded as errors too, with the code
+    :attr:`~ConversionErrors.NOT_A_STRING`, so no value of the batch raises an
+    exception.
+
+    Examples:
+
+    .. doctest::
+
+        >>> result = hex_to_rgb_batch(["#fff", "#nope", "#000080"])
+        >>> result.values
+        [IntegerRGB(red=255, green=255, blue=255), None,
+         IntegerRGB(red=0, green=0, blue=128)]
+        >>> list(result.errors.messages())
+        [(1, '"#nope" is not a valid hexadecimal color value.')]
+
+    :param hex_values: The hexadecimal color values to convert.
+
+    """
+    return _convert_collecting(hex_values, _hex_to_rgb_or_code)
+
+
+def name_to_hex_batch(names: typing.Iterable[str], spec: str = CSS3) -> BatchResult:
+    """
+    Convert each of an iterable of color names to a normalized hexadecimal color
+    value, as :func:`name_to_hex` does, collecting the names with no definition in the
+    given spec as for :func:`hex_to_rgb_batch`, rather than raising an exception.
+
+    Examples:
+
+    .. doctest::
+
+        >>> result = name_to_hex_batch(["navy", "Goldenrod", "octarine"])
+        >>> result.values
+        ['#000080', '#daa520', None]
+        >>> result.errors.indexes, result.errors.codes
+        (array('Q', [2]), b'\\x02')
+
+    :param names: The color names to convert.
+    :param spec: The specification from which to draw the list of color names. Default
+       is :data:`CSS3`.
+    :raises ValueError: when the given spec is not supported.
+
+    """
+    color_map = _get_cased_name_to_hex_map(spec)
+
+    def convert(name: str) -> typing.Union[str, int]:
+        """
+        Convert a color name to its hexadecimal value, or return the code of the error
+        if it is not defined.
+
+        """
+        return (
+            color_map.get(name)
+            or color_map.get(name.lower())
+            or ConversionErrors.UNDEFINED_NAME
+        )
+
+    return _convert_collecting(names, convert, spec)
+
+
+def hex_to_name_batch(
+    hex_values: typing.Iterable[str], spec: str = CSS3
+) -> BatchResult:
+    """
+    Convert each of an iterable of hexadecimal color values to its normalized color
+    name, as :func:`hex_to_name` does, collecting the values which are invalid or
+    which have no name in the given spec as for :func:`hex_to_rgb_batch`, rather than
+    raising an exception.
+
+    Examples:
+
+    .. doctest::
+
+        >>> result = hex_to_name_batch(["#000080", "#123456", "#nope"])
+        >>> result.values
+        ['navy', None, None]
+        >>> for index, message in result.errors.messages():
+        ...     print(index, message)
+        1 "#123456" has no defined color name in css3.
+        2 "#nope" is not a valid hexadecimal color value.
+
+    :param hex_values: The hexadecimal color values to convert.
+    :param spec: The specification from which to draw the list of color names. Default
+       is :data:`CSS3`.
+    :raises ValueError: when the given spec is not supported.
+
+    """
+    color_map = _get_hex_to_name_map(spec)
+
+    def convert(hex_value: str) -> typing.Union[str, int]:
+        """
+        Convert a hexadecimal color value to its color name, or return the code of the
+        error if it is invalid or has no name.
+
+        """
+        if _HEX_COLOR_RE.match(hex_value) is None:
+            return ConversionErrors.INVALID_HEX
+        return color_map.get(normalize_hex(hex_value)) or ConversionErrors.NO_NAME
+
+    return _convert_collecting(hex_values, convert, spec)
+
+
+# Conversion of columns held in the buffers of Apache Arrow string arrays.
+# --------------------------------------------------------------------------------
+
+# The positions of the red, green and blue bytes within a packed 32-bit integer in the
+# platform's native byte order.
+_PACKED_POSITIONS = (2, 1, 0) if sys.byteorder == "little" else (1, 2, 3)
+
+# The length of a hexadecimal color value in its long "#rrggbb" form.
+_LONG_HEX_LENGTH = 7
+
+_BIT_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+_BIT_FLAGS = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def _unpack_bits(bitmap, offset: int, length: int) -> bytes:
+    """
+    Internal helper returning the ``length`` bits of a bitmap in least-significant bit
+    order, starting from bit ``offset``, as one byte per bit, each 0 or 1.
+
+    """
+    bits = int.from_bytes(memoryview(bitmap).cast("B"), "little") >> offset
+    return format(bits, f"0{length}b")[::-1][:length].encode().translate(_BIT_FLAGS)
+
+
+def _pack_bits(flags: bytes) -> bytearray:
+    """
+    Internal helper returning a bitmap, in least-significant bit order, of a sequence
+    of bytes which are each 0 or 1.
+
+    """
+    bits = int(flags[::-1].translate(_BIT_DIGITS) or b"0", 2)
+    return bytearray(bits.to_bytes((len(flags) + 7) // 8, "little"))
+
+
+def _parse_hex_bytes(raw: bytes) -> int:
+    """
+    Internal helper returning the packed integer value of a hexadecimal color value
+    given as bytes, or -1 if it is not a valid hexadecimal color value.
+
+    """
+    try:
+        return int(normalize_hex(raw.decode("ascii"))[1:], 16)
+    except ValueError:
+        return -1
+
+
+def _hex_buffers_to_rgb(
+    offsets, data, validity, offset: int, length: typing.Optional[int], large: bool
+) -> typing.Tuple[bytes, bytes]:
+    """
+    Internal helper converting the hexadecimal color values held in the buffers of an
+    Arrow string array to packed ``rgb()`` triplets, returning the triplets and a flag
+    for each row which is 1 when the row held a valid color.
+
+    When every row is valid and holds a value in the long ``#rrggbb`` form, the whole
+    data buffer is decoded at once by :meth:`bytes.fromhex`. Otherwise each distinct
+    value is decoded once, and rows which are null or invalid are left as zeroes.
+
+    """
+    bounds = memoryview(offsets).cast("B").cast("q" if large else "i")[offset:]
+    if length is None:
+        length = len(bounds) - 1
+    bounds = bounds[: length + 1]
+    if len(bounds) != length + 1:
+        raise ValueError(f"Offsets buffer is too short to hold {length} rows.")
+    data_view = memoryview(data).cast("B")
+    flags = b"\x01" * length
+    if validity is not None:
+        flags = _unpack_bits(validity, offset, length)
+    start, end = bounds[0], bounds[-1]
+    if flags.count(1) == length and end - start == _LONG_HEX_LENGTH * length:
+        text = bytes(data_view[start:end])
+        # The checks of the positions of "#" characters, and of the length of the
+        # decoded result, ensure that every row is "#" followed by six hexadecimal
+        # digits, so that decoding the whole buffer is equivalent to decoding each row.
+        if text[0::_LONG_HEX_LENGTH] == b"#" * length and text.count(b"#") == length:
+            try:
+                triplets = bytes.fromhex(text.replace(b"#", b"").decode("ascii"))
+            except ValueError:
+                triplets = b""
+            if len(triplets) == 3 * length:
+                return triplets, flags
+    triplets = bytearray(3 * length)
+    valid = bytearray(length)
+    known: typing.Dict[bytes, int] = {}
+    for row in range(length):
+        if not flags[row]:
+            continue
+        raw = bytes(data_view[bounds[row] : bounds[row + 1]])
+        if (value := known.get(raw)) is None:
+            value = known[raw] = _parse_hex_bytes(raw)
+        if value >= 0:
+            triplets[3 * row : 3 * row + 3] = value.to_bytes(3, "big")
+            valid[row] = 1
+    return bytes(triplets), bytes(valid)
+
+
+def hex_buffers_to_rgb(
+    offsets,
+    data,
+    validity=None,
+    offset: int = 0,
+    length: typing.Optional[int] = None,
+    large: bool = False,
+) -> ColorBuffers:
+    """
+    Convert the hexadecimal color values of an Apache Arrow string array, given as its
+    raw buffers, to ``rgb()`` triplets, in the layout of an Arrow
+    ``fixed_size_list<uint8, 3>`` array.
+
+    The buffers are read in place. When every row holds a value in the common
+    ``#rrggbb`` form, the whole column is decoded in a single pass, without creating
+    any Python object per row; otherwise, each distinct value is decoded once. The
+    buffers may be any objects supporting the buffer
+    protocol, such as the :class:`pyarrow.Buffer` objects returned by
+    :meth:`pyarrow.Array.buffers`. Rows which are null, or which do not hold a valid
+    hexadecimal color value, are marked as null in the validity bitmap of the result
+    instead of raising an exception.
+
+    The result's :attr:`~ColorBuffers.values` is a :class:`bytearray` holding three
+    bytes -- red, green and blue -- per row.
+
+    Examples:
+
+    .. doctest::
+
+        >>> from array import array
+        >>> offsets = array("i", [0, 7, 11, 14])
+        >>> result = hex_buffers_to_rgb(offsets, b"#000080#FFFnope")
+        >>> list(result.values)
+        [0, 0, 128, 255, 255, 255, 0, 0, 0]
+        >>> result.validity, result.null_count
+        (bytearray(b'\\x03'), 1)
+
+    :param offsets: The offsets buffer of the string array.
+    :param data: The data buffer of the string array.
+    :param validity: The validity bitmap of the string array, or :data:`None` if it has
+       no nulls.
+    :param offset: The index of the first row of the array within its buffers, as
+       given by :attr:`pyarrow.Array.offset`. Default is 0.
+    :param length: The number of rows of the array. By default, every row held by the
+       offsets buffer after ``offset``.
+    :param large: Whether the array is a ``large_string`` array, with 64-bit rather
+       than 32-bit offsets. Default is :data:`False`.
+    :raises ValueError: when the offsets buffer is too short to hold the given number
+       of rows.
+
+    """
+    triplets, valid = _hex_buffers_to_rgb(
+        offsets, data, validity, offset, length, large
+    )
+    return ColorBuffers(bytearray(triplets), _pack_bits(valid), valid.count(0))
+
+
+def hex_buffers_to_packed(
+    offsets,
+    data,
+    validity=None,
+    offset: int = 0,
+    length: typing.Optional[int] = None,
+    large: bool = False,
+) -> ColorBuffers:
+    """
+    Convert the hexadecimal color values of an Apache Arrow string array, given as its
+    raw buffers, to packed integers of the form ``red << 16 | green << 8 | blue``, in
+    the layout of an Arrow ``uint32`` array.
+
+    This works as described for :func:`hex_buffers_to_rgb`, except that the result's
+    :attr:`~ColorBuffers.values` is an :class:`array.array` of unsigned 32-bit
+    integers (typecode ``"I"``), which is 0 for rows which are null or invalid.
+
+    For example, to convert a :mod:`pyarrow` string array:
+
+    .. code-block:: python
+
+        import pyarrow
+        import webcolors
+
+        validity, offsets, data = colors.buffers()
+        result = webcolors.hex_buffers_to_packed(
+            offsets, data, validity, offset=colors.offset, length=len(colors)
+        )
+        packed = pyarrow.Array.from_buffers(
+            pyarrow.uint32(),
+            len(colors),
+            [pyarrow.py_buffer(result.validity), pyarrow.py_buffer(result.values)],
+            null_count=result.null_count,
+        )
+
+    Examples:
+
+    .. doctest::
+
+        >>> from array import array
+        >>> offsets = array("i", [0, 7, 11, 14])
+        >>> result = hex_buffers_to_packed(offsets, b"#000080#FFFnope")
+        >>> result.values
+        array('I', [128, 16777215, 0])
+
+    :param offsets: The offsets buffer of the string array.
+    :param data: The data buffer of the string array.
+    :param validity: The validity bitmap of the string array, or :data:`None` if it has
+       no nulls.
+    :param offset: The index of the first row of the array within its buffers, as
+       given by :attr:`pyarrow.Array.offset`. Default is 0.
+    :param length: The number of rows of the array. By default, every row held by the
+       offsets buffer after ``offset``.
+    :param large: Whether the array is a ``large_string`` array, with 64-bit rather
+       than 32-bit offsets. Default is :data:`False`.
+    :raises ValueError: when the offsets buffer is too short to hold the given number
+       of rows.
+
+    """
+    triplets, valid = _hex_buffers_to_rgb(
+        offsets, data, validity, offset, length, large
+    )
+    packed = bytearray(4 * len(valid))
+    for channel, position in enumerate(_PACKED_POSITIONS):
+        packed[position::4] = triplets[channel::3]
+    values = array("I")
+    values.frombytes(packed)
+    return ColorBuffers(values, _pack_bits(valid), valid.count(0))
+
+
+# Conversion of fixed-width records of hexadecimal color values.
+# --------------------------------------------------------------------------------
+
+# Tables for bytes.translate() mapping each hexadecimal digit to its value, shifted
+# into the high or low half of a byte, and every other byte to 0.
+_HIGH_NIBBLES = bytes(
+    int(chr(byte), 16) << 4 if chr(byte) in string.hexdigits else 0
+    for byte in range(256)
+)
+_LOW_NIBBLES = bytes(
+    int(chr(byte), 16) if chr(byte) in string.hexdigits else 0 for byte in range(256)
+)
+
+# Tables for bytes.translate() mapping the bytes valid at each position of a record to
+# 0, and every other byte to 1.
+_INVALID_HASH = bytes(0 if byte == ord("#") else 1 for byte in range(256))
+_INVALID_DIGIT = bytes(0 if chr(byte) in string.hexdigits else 1 for byte in range(256))
+
+# The number of records decoded at a time, bounding the memory used for intermediate
+# columns when decoding large files.
+_RECORDS_PER_CHUNK = 1 << 20
+
+
+def _decode_records(view: memoryview, count: int, record_size: int):
+    """
+    Internal helper decoding ``count`` fixed-width records of hexadecimal color
+    values, returning the packed 8-bit RGB colors, and a flag for each record which is
+    1 when the record is invalid.
+
+    Each position of the records is handled as a whole column at once: the bytes at
+    that position of every record are gathered by slicing, checked and converted to
+    digit values by :meth:`bytes.translate`, and combined with the other digit of
+    their channel through a single bitwise OR of large integers.
+
+    """
+    columns = [bytes(view[position::record_size][:count]) for position in range(7)]
+    invalid = int.from_bytes(columns[0].translate(_INVALID_HASH), "big")
+    triplets = bytearray(3 * count)
+    for channel in range(3):
+        high, low = columns[1 + 2 * channel], columns[2 + 2 * channel]
+        invalid |= int.from_bytes(high.translate(_INVALID_DIGIT), "big")
+        invalid |= int.from_bytes(low.translate(_INVALID_DIGIT), "big")
+        triplets[channel::3] = (
+            int.from_bytes(high.translate(_HIGH_NIBBLES), "big")
+            | int.from_bytes(low.translate(_LOW_NIBBLES), "big")
+        ).to_bytes(count, "big")
+    return triplets, invalid.to_bytes(count, "big")
+
+
+def hex_records_to_rgb(buffer, record_size: int = _LONG_HEX_LENGTH) -> DecodedRecords:
+    """
+    Decode a buffer of fixed-width records, each holding a hexadecimal color value in
+    the long ``#rrggbb`` form, to packed 8-bit RGB colors.
+
+    Each record starts with a ``#`` character followed by six hexadecimal digits, in
+    either case -- exactly the seven-character values accepted by
+    :func:`normalize_hex` -- and may be padded to ``record_size`` bytes by any
+    separator, such as a newline; the separator after the last record may be omitted.
+
+    The records are decoded column by column, by a handful of operations over the
+    whole buffer, so no Python object is created per record. Invalid records do not
+    raise an exception; they are decoded as black, and their positions reported in
+    the result's :attr:`~DecodedRecords.invalid`.
+
+    Examples:
+
+    .. doctest::
+
+        >>> records = b"#000080\\n#DaA520\\n#nope!!\\n"
+        >>> result = hex_records_to_rgb(records, record_size=8)
+        >>> list(result.values)
+        [0, 0, 128, 218, 165, 32, 0, 0, 0]
+        >>> result.invalid
+        array('Q', [2])
+
+    :param buffer: The buffer of records, which may be any C-contiguous object
+       supporting the buffer protocol whose items are single bytes.
+    :param record_size: The size in bytes of each record, including any separator.
+       Default is 7.
+    :raises ValueError: when the record size is less than 7, or when the length of
+       the buffer is not a whole number of records.
+
+    """
+    if record_size < _LONG_HEX_LENGTH:
+        raise ValueError(
+            f"Records of {record_size} bytes cannot hold hexadecimal color values."
+        )
+    with memoryview(buffer).cast("B") as view:
+        if len(view) % record_size not in (0, _LONG_HEX_LENGTH):
+            raise ValueError(
+                f"Buffer length {len(view)} is not a whole number of "
+                f"{record_size}-byte records."
+            )
+        count = (len(view) + record_size - _LONG_HEX_LENGTH) // record_size
+        values = bytearray()
+        invalid = array("Q")
+        for start in range(0, count, _RECORDS_PER_CHUNK):
+            chunk_count = min(_RECORDS_PER_CHUNK, count - start)
+            with view[start * record_size :] as chunk:
+                triplets, flags = _decode_records(chunk, chunk_count, record_size)
+            position = flags.find(1)
+            while position >= 0:
+                triplets[3 * position : 3 * position + 3] = bytes(3)
+                invalid.append(start + position)
+                position = flags.find(1, position + 1)
+            values += triplets
+    return DecodedRecords(values, invalid)
+
+
+def hex_record_file_to_rgb(
+    path: typing.Union[str, "os.PathLike[str]"], record_size: int = _LONG_HEX_LENGTH
+) -> DecodedRecords:
+    """
+    Decode a file of fixed-width records of hexadecimal color values to packed 8-bit
+    RGB colors, as for :func:`hex_records_to_rgb`.
+
+    The file is mapped into memory rather than read, and decoded in chunks of records,
+    so no copy of the whole file is made and its text is never split into lines. For
+    example, to convert a file of newline-terminated ``#rrggbb`` values to a color
+    file, logging the lines which were invalid:
+
+    .. code-block:: python
+
+        import webcolors
+
+        result = webcolors.hex_record_file_to_rgb("colors.txt", record_size=8)
+        for position in result.invalid:
+            log.warning("Invalid color on line %d", position + 1)
+        webcolors.write_color_file("colors.wcc", result.values, layout="rgb")
+
+    :param path: The path of the file to decode.
+    :param record_size: The size in bytes of each record, including any separator.
+       Default is 7.
+    :raises ValueError: when the record size is less than 7, or when the length of
+       the file is not a whole number of records.
+
+    """
+    with open(path, "rb") as record_file:
+        if os.fstat(record_file.fileno()).st_size == 0:
+            return hex_records_to_rgb(b"", record_size)
+        with mmap.mmap(record_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return hex_records_to_rgb(mapped, record_size)
@@ -0,0 +1,40 @@
+"""
+Caching of lazily-built lookup structures.
+
+Several parts of webcolors build lookup structures (such as nearest-color palettes and
+name indexes) the first time they are needed, and keep them for reuse. Those structures
+are shared by every thread, so they are built and published here in a way which is
+safe when threads truly run in parallel, as on free-threaded builds of Python: each
+structure is built exactly once, under a lock, and is never modified after being
+published. Once a structure has been built, looking it up is a plain dictionary read,
+which takes no lock, so threads do not contend with each other.
+
+"""
+
+# SPDX-License-Identifier: BSD-3-Clause
+
+import threading
+import typing
+
+T = typing.TypeVar("T")
+
+# Builders may themselves need other cached structures (for example, a nearest-name
+# index is built from a distance matrix), so the lock must be reentrant.
+_build_lock = threading.RLock()
+
+
+def _cached(
+    cache: typing.Dict[tuple, T], build: typing.Callable[..., T], *args: typing.Any
+) -> T:
+    """
+    Return the structure cached under ``args``, first building it by calling
+    ``build(*args)`` and caching the result if it is not already cached.
+
+    Exceptions raised by ``build`` propagate, and nothing is cached for ``args``.
+
+    """
+    if (value := cache.get(args)) is None:
+        with _build_lock:
+            if (value := cache.get(args)) is None:
+                value = cache[args] = build(*args)
+    return value
@@ -0,0 +1,525 @@
+"""
+Conversions between RGB and the cylindrical HSL and HWB color models.
+
+The algorithms here follow the sample code in CSS Color Module Level 4:
+
+https://www.w3.org/TR/css-color-4/#hsl-to-rgb
+
+https://www.w3.org/TR/css-color-4/#hwb-to-rgb
+
+Each conversion is provided in two forms: a scalar form working on a single color, and
+an array form working on a whole buffer of colors, laid out as a flat row-major ``(N,
+3)`` block of values. The array forms exist so that large batches of colors can be
+converted without the overhead of creating a tuple for each color: the array forms read
+their input in place and write each channel straight into their result.
+
+"""
+
+# SPDX-License-Identifier: BSD-3-Clause
+
+import math
+import operator
+import typing
+from array import array
+
+from ._normalization import _as_byte_view, normalize_integer_triplet
+from ._types import HSL, HWB, HSLTuple, HWBTuple, IntegerRGB, IntTuple
+
+# Linear-light value of each 8-bit sRGB channel value, per the sRGB transfer function.
+_SRGB_TO_LINEAR = tuple(
+    value / 12.92 if value <= 0.04045 else ((value + 0.055) / 1.055) ** 2.4
+    for value in (i / 255 for i in range(256))
+)
+
+# Matrix converting linear-light sRGB to CIE XYZ coordinates, and the coordinates of
+# the D65 reference white (which is sRGB white, so is given by the row sums).
+_SRGB_TO_XYZ = (
+    (0.4124564, 0.3575761, 0.1804375),
+    (0.2126729, 0.7151522, 0.0721750),
+    (0.0193339, 0.1191920, 0.9503041),
+)
+_D65_WHITE = tuple(sum(row) for row in _SRGB_TO_XYZ)
+
+# The inverse of the above matrix, converting CIE XYZ coordinates to linear-light sRGB.
+_XYZ_TO_SRGB = (
+    (3.2404542, -1.5371385, -0.4985314),
+    (-0.9692660, 1.8760108, 0.0415560),
+    (0.0556434, -0.2040259, 1.0572252),
+)
+
+
+def _lab_f(t: float) -> float:
+    """
+    Internal helper implementing the nonlinear compression function used in
+    converting CIE XYZ coordinates to CIE L*a*b*.
+
+    """
+    return t ** (1 / 3) if t > 216 / 24389 else t * 841 / 108 + 4 / 29
+
+
+def _rgb_to_lab(red: int, green: int, blue: int) -> typing.Tuple[float, float, float]:
+    """
+    Internal helper converting an 8-bit sRGB color to CIE L*a*b* coordinates, relative
+    to the D65 reference white.
+
+    """
+    linear = (_SRGB_TO_LINEAR[red], _SRGB_TO_LINEAR[green], _SRGB_TO_LINEAR[blue])
+    f_x, f_y, f_z = (
+        _lab_f(sum(map(operator.mul, row, linear)) / white)
+        for row, white in zip(_SRGB_TO_XYZ, _D65_WHITE)
+    )
+    return (116 * f_y - 16, 500 * (f_x - f_y), 200 * (f_y - f_z))
+
+
+def _lab_f_inverse(t: float) -> float:
+    """
+    Internal helper implementing the inverse of :func:`_lab_f`.
+
+    """
+    return t**3 if t > 6 / 29 else (t - 4 / 29) * 108 / 841
+
+
+def _lab_to_linear(
+    lightness: float, a: float, b: float
+) -> typing.Tuple[float, float, float]:
+    """
+    Internal helper converting CIE L*a*b* coordinates, relative to the D65 reference
+    white, to linear-light sRGB values, which fall outside the range 0-1 for colors
+    outside the sRGB gamut.
+
+    """
+    f_y = (lightness + 16) / 116
+    x = _lab_f_inverse(f_y + a / 500) * _D65_WHITE[0]
+    y = _lab_f_inverse(f_y) * _D65_WHITE[1]
+    z = _lab_f_inverse(f_y - b / 200) * _D65_WHITE[2]
+    (r_x, r_y, r_z), (g_x, g_y, g_z), (b_x, b_y, b_z) = _XYZ_TO_SRGB
+    return (
+        r_x * x + r_y * y + r_z * z,
+        g_x * x + g_y * y + g_z * z,
+        b_x * x + b_y * y + b_z * z,
+    )
+
+
+def _as_float_view(values) -> memoryview:
+    """
+    Internal helper for obtaining a flat, zero-copy :class:`memoryview` of
+    double-precision floats over a buffer of ``(N, 3)`` color components.
+
+    :raises ValueError: when the buffer does not hold C-contiguous doubles, or when its
+       length is not a multiple of three.
+
+    """
+    view = memoryview(values)
+    if view.itemsize != 8 or not view.format.endswith("d") or not view.c_contiguous:
+        raise ValueError("Component buffers must be C-contiguous buffers of doubles.")
+    view = view.cast("B").cast("d")
+    if len(view) % 3:
+        raise ValueError(f"Component buffer length {len(view)} is not a multiple of 3.")
+    return view
+
+
+def _clip_percent(value: float) -> float:
+    """
+    Internal helper for clipping a percentage value into the permitted range (0-100,
+    inclusive).
+
+    """
+    return 0.0 if value < 0 else 100.0 if value > 100 else value
+
+
+def _hue(red: int, green: int, blue: int, maximum: int, delta: int) -> float:
+    """
+    Internal helper computing the hue angle, in degrees, of an integer RGB color whose
+    largest channel value is ``maximum`` and whose channel range is ``delta``.
+
+    """
+    if delta == 0:
+        return 0.0
+    if maximum == red:
+        hue = (green - blue) / delta + (6 if green < blue else 0)
+    elif maximum == green:
+        hue = (blue - red) / delta + 2
+    else:
+        hue = (red - green) / delta + 4
+    return hue * 60
+
+
+def _hue_sextant(hue: float) -> float:
+    """
+    Internal helper taking a hue angle, in degrees, modulo 360 and dividing it by 30,
+    as the CSS HSL-to-RGB algorithm does.
+
+    :raises ValueError: when the hue is not finite.
+
+    """
+    if not math.isfinite(hue):
+        raise ValueError(f"{hue} is not a finite hue angle.")
+    return hue % 360 / 30
+
+
+def _hsl_channel(offset: int, hue: float, chroma: float, lightness: float) -> float:
+    """
+    Internal helper computing one unrounded fractional channel value of the CSS
+    HSL-to-RGB algorithm, given the channel's offset (0 for red, 8 for green, 4 for
+    blue), a hue from :func:`_hue_sextant` and the chroma of the color.
+
+    """
+    k = (offset + hue) % 12
+    return lightness - chroma * max(-1, min(k - 3, 9 - k, 1))
+
+
+def _hsl_fractions(hue: float, saturation: float, lightness: float) -> tuple:
+    """
+    Internal helper implementing the CSS HSL-to-RGB algorithm on already-clipped
+    fractional saturation and lightness values, returning unrounded fractional
+    channel values.
+
+    :raises ValueError: when the hue is not finite.
+
+    """
+    hue = _hue_sextant(hue)
+    chroma = saturation * min(lightness, 1 - lightness)
+    return (
+        _hsl_channel(0, hue, chroma, lightness),
+        _hsl_channel(8, hue, chroma, lightness),
+        _hsl_channel(4, hue, chroma, lightness),
+    )
+
+
+def _hwb_fractions(hue: float, whiteness: float, blackness: float) -> tuple:
+    """
+    Internal helper implementing the CSS HWB-to-RGB algorithm on already-clipped
+    fractional whiteness and blackness values, returning unrounded fractional channel
+    values.
+
+    :raises ValueError: when the hue is not finite.
+
+    """
+    hue = _hue_sextant(hue)
+    if whiteness + blackness >= 1:
+        gray = whiteness / (whiteness + blackness)
+        return (gray, gray, gray)
+    scale = 1 - whiteness - blackness
+    return (
+        _hsl_channel(0, hue, 0.5, 0.5) * scale + whiteness,
+        _hsl_channel(8, hue, 0.5, 0.5) * scale + whiteness,
+        _hsl_channel(4, hue, 0.5, 0.5) * scale + whiteness,
+    )
+
+
+def _round_channel(fraction: float) -> int:
+    """
+    Internal helper which scales a fractional channel value to 0-255 and rounds it to
+    the nearest integer, with ties rounded up, as CSS does when serializing colors.
+
+    """
+    return int(fraction * 255 + 0.5)
+
+
+def _round_channels(fractions: tuple) -> IntegerRGB:
+    """
+    Internal helper applying :func:`_round_channel` to each of three fractional channel
+    values.
+
+    """
+    return IntegerRGB._make(map(_round_channel, fractions))
+
+
+# Conversions from integer rgb() triplets to HSL and HWB.
+# --------------------------------------------------------------------------------
+
+
+def rgb_to_hsl(rgb_triplet: IntTuple) -> HSL:
+    """
+    Convert a 3-:class:`tuple` of :class:`int`, suitable for use in an ``rgb()``
+    color triplet, to a 3-:class:`tuple` of hue, saturation and lightness suitable
+    for use in an ``hsl()`` function specifying that color.
+
+    Achromatic colors (grays, including black and white) have no meaningful hue, and
+    are given a hue of ``0.0``.
+
+    Examples:
+
+    .. doctest::
+
+        >>> rgb_to_hsl((255, 0, 0))
+        HSL(hue=0.0, saturation=100.0, lightness=50.0)
+        >>> rgb_to_hsl((0, 0, 128))
+        HSL(hue=240.0, saturation=100.0, lightness=25.098039215686274)
+        >>> rgb_to_hsl((255, 255, 255))
+        HSL(hue=0.0, saturation=0.0, lightness=100.0)
+
+    :param rgb_triplet: The ``rgb()`` triplet.
+
+    """
+    red, green, blue = normalize_integer_triplet(rgb_triplet)
+    maximum = max(red, green, blue)
+    minimum = min(red, green, blue)
+    delta = maximum - minimum
+    total = maximum + minimum
+    return HSL(
+        _hue(red, green, blue, maximum, delta),
+        delta * 100 / min(total, 510 - total) if delta else 0.0,
+        total * 100 / 510,
+    )
+
+
+def rgb_to_hwb(rgb_triplet: IntTuple) -> HWB:
+    """
+    Convert a 3-:class:`tuple` of :class:`int`, suitable for use in an ``rgb()``
+    color triplet, to a 3-:class:`tuple` of hue, whiteness and blackness suitable for
+    use in an ``hwb()`` function specifying that color.
+
+    Achromatic colors (grays, including black and white) have no meaningful hue, and
+    are given a hue of ``0.0``.
+
+    Examples:
+
+    .. doctest::
+
+        >>> rgb_to_hwb((255, 0, 0))
+        HWB(hue=0.0, whiteness=0.0, blackness=0.0)
+        >>> rgb_to_hwb((0, 0, 0))
+        HWB(hue=0.0, whiteness=0.0, blackness=100.0)
+
+    :param rgb_triplet: The ``rgb()`` triplet.
+
+    """
+    red, green, blue = normalize_integer_triplet(rgb_triplet)
+    maximum = max(red, green, blue)
+    minimum = min(red, green, blue)
+    return HWB(
+        _hue(red, green, blue, maximum, maximum - minimum),
+        minimum * 100 / 255,
+        (255 - maximum) * 100 / 255,
+    )
+
+
+# Conversions from HSL and HWB to integer rgb() triplets.
+# --------------------------------------------------------------------------------
+
+
+def hsl_to_rgb(hsl_triplet: HSLTuple) -> IntegerRGB:
+    """
+    Convert a 3-:class:`tuple` of hue, saturation and lightness, suitable for use in
+    an ``hsl()`` function, to a 3-:class:`tuple` of :class:`int` suitable for use in
+    an ``rgb()`` triplet specifying that color.
+
+    The hue is taken modulo 360 degrees, and must be finite; saturation and lightness
+    are clipped to the range 0-100. Each resulting channel is rounded to the nearest
+    integer, with ties rounded up, as in CSS.
+
+    Examples:
+
+    .. doctest::
+
+        >>> hsl_to_rgb((0, 100, 50))
+        IntegerRGB(red=255, green=0, blue=0)
+        >>> hsl_to_rgb((240, 100, 25))
+        IntegerRGB(red=0, green=0, blue=128)
+        >>> hsl_to_rgb((-120, 100, 50))
+        IntegerRGB(red=0, green=0, blue=255)
+
+    :param hsl_triplet: The ``hsl()`` triplet.
+    :raises ValueError: when the hue is not finite.
+
+    """
+    hue, saturation, lightness = hsl_triplet
+    return _round_channels(
+        _hsl_fractions(
+            hue, _clip_percent(saturation) / 100, _clip_percent(lightness) / 100
+        )
+    )
+
+
+def hwb_to_rgb(hwb_triplet: HWBTuple) -> IntegerRGB:
+    """
+    Convert a 3-:class:`tuple` of hue, whiteness and blackness, suitable for use in an
+    ``hwb()`` function, to a 3-:class:`tuple` of :class:`int` suitable for use in an
+    ``rgb()`` triplet specifying that color.
+
+    The hue is taken modulo 360 degrees, and must be finite; whiteness and blackness
+    are clipped to the range 0-100. When whiteness and blackness add up to 100 or
+    more, the result is the gray given by their ratio, as in CSS.
+
+    Examples:
+
+    .. doctest::
+
+        >>> hwb_to_rgb((0, 0, 0))
+        IntegerRGB(red=255, green=0, blue=0)
+        >>> hwb_to_rgb((120, 0, 50))
+        IntegerRGB(red=0, green=128, blue=0)
+        >>> hwb_to_rgb((0, 60, 60))
+        IntegerRGB(red=128, green=128, blue=128)
+
+    :param hwb_triplet: The ``hwb()`` triplet.
+    :raises ValueError: when the hue is not finite.
+
+    """
+    hue, whiteness, blackness = hwb_triplet
+    return _round_channels(
+        _hwb_fractions(
+            hue, _clip_percent(whiteness) / 100, _clip_percent(blackness) / 100
+        )
+    )
+
+
+# Array forms of the above conversions.
+# --------------------------------------------------------------------------------
+
+
+def rgb_to_hsl_array(rgb_buffer) -> array:
+    """
+    Convert a buffer of packed 8-bit RGB colors to a flat :class:`array.array` of
+    double-precision hue, saturation and lightness values.
+
+    The input may be any C-contiguous object supporting the buffer protocol whose
+    items are single bytes -- such as :class:`bytes`, :class:`bytearray`, a
+    :class:`memoryview`, or a NumPy ``uint8`` array of shape ``(N, 3)`` -- and it is
+    read in place, without being copied. The result holds ``3 * N`` values, in the
+    same order as the colors in the input, and each group of three is identical to the
+    result of :func:`rgb_to_hsl` for the corresponding color.
+
+    Examples:
+
+    .. doctest::
+
+        >>> rgb_to_hsl_array(bytes([255, 0, 0, 255, 255, 255]))
+        array('d', [0.0, 100.0, 50.0, 0.0, 0.0, 100.0])
+
+    :param rgb_buffer: The buffer of RGB colors.
+    :raises ValueError: when the buffer is not a contiguous buffer of bytes whose
+       length is a multiple of three.
+
+    """
+    view = _as_byte_view(rgb_buffer)
+    result = array("d", bytes(8 * len(view)))
+    index = 0
+    for red, green, blue in zip(view[0::3], view[1::3], view[2::3]):
+        maximum = max(red, green, blue)
+        minimum = min(red, green, blue)
+        delta = maximum - minimum
+        total = maximum + minimum
+        if delta:
+            result[index] = _hue(red, green, blue, maximum, delta)
+            result[index + 1] = delta * 100 / min(total, 510 - total)
+        result[index + 2] = total * 100 / 510
+        index += 3
+    return result
+
+
+def rgb_to_hwb_array(rgb_buffer) -> array:
+    """
+    Convert a buffer of packed 8-bit RGB colors to a flat :class:`array.array` of
+    double-precision hue, whiteness and blackness values.
+
+    The input is handled as described for :func:`rgb_to_hsl_array`, and each group of
+    three values in the result is identical to the result of :func:`rgb_to_hwb` for
+    the corresponding color.
+
+    Examples:
+
+    .. doctest::
+
+        >>> rgb_to_hwb_array(bytes([255, 0, 0, 0, 0, 0]))
+        array('d', [0.0, 0.0, 0.0, 0.0, 0.0, 100.0])
+
+    :param rgb_buffer: The buffer of RGB colors.
+    :raises ValueError: when the buffer is not a contiguous buffer of bytes whose
+       length is a multiple of three.
+
+    """
+    view = _as_byte_view(rgb_buffer)
+    result = array("d", bytes(8 * len(view)))
+    index = 0
+    for red, green, blue in zip(view[0::3], view[1::3], view[2::3]):
+        maximum = max(red, green, blue)
+        minimum = min(red, green, blue)
+        result[index] = _hue(red, green, blue, maximum, maximum - minimum)
+        result[index + 1] = minimum * 100 / 255
+        result[index + 2] = (255 - maximum) * 100 / 255
+        index += 3
+    return result
+
+
+def hsl_to_rgb_array(hsl_buffer) -> bytearray:
+    """
+    Convert a flat buffer of double-precision hue, saturation and lightness values to
+    a :class:`bytearray` of packed 8-bit RGB colors.
+
+    The input may be any C-contiguous object supporting the buffer protocol whose
+    items are doubles -- such as the result of :func:`rgb_to_hsl_array`, or a NumPy
+    ``float64`` array of shape ``(N, 3)`` -- and it is read in place, without being
+    copied. Each group of three bytes in the result is identical to the result of
+    :func:`hsl_to_rgb` for the corresponding color.
+
+    Examples:
+
+    .. doctest::
+
+        >>> hsl_to_rgb_array(rgb_to_hsl_array(bytes([255, 0, 0, 0, 0, 128])))
+        bytearray(b'\\xff\\x00\\x00\\x00\\x00\\x80')
+
+    :param hsl_buffer: The buffer of HSL values.
+    :raises ValueError: when the buffer is not a contiguous buffer of doubles whose
+       length is a multiple of three, or when any hue is not finite.
+
+    """
+    view = _as_float_view(hsl_buffer)
+    result = bytearray(len(view))
+    # The channels are written straight into the result, so no tuple is created per
+    # color.
+    for index in range(0, len(view), 3):
+        hue = _hue_sextant(view[index])
+        saturation = _clip_percent(view[index + 1]) / 100
+        lightness = _clip_percent(view[index + 2]) / 100
+        chroma = saturation * min(lightness, 1 - lightness)
+        result[index] = _round_channel(_hsl_channel(0, hue, chroma, lightness))
+        result[index + 1] = _round_channel(_hsl_channel(8, hue, chroma, lightness))
+        result[index + 2] = _round_channel(_hsl_channel(4, hue, chroma, lightness))
+    return result
+
+
+def hwb_to_rgb_array(hwb_buffer) -> bytearray:
+    """
+    Convert a flat buffer of double-precision hue, whiteness and blackness values to a
+    :class:`bytearray` of packed 8-bit RGB colors.
+
+    The input is handled as described for :func:`hsl_to_rgb_array`, and each group of
+    three bytes in the result is identical to the result of :func:`hwb_to_rgb` for the
+    corresponding color.
+
+    Examples:
+
+    .. doctest::
+
+        >>> hwb_to_rgb_array(rgb_to_hwb_array(bytes([255, 0, 0, 128, 128, 128])))
+        bytearray(b'\\xff\\x00\\x00\\x80\\x80\\x80')
+
+    :param hwb_buffer: The buffer of HWB values.
+    :raises ValueError: when the buffer is not a contiguous buffer of doubles whose
+       length is a multiple of three, or when any hue is not finite.
+
+    """
+    view = _as_float_view(hwb_buffer)
+    result = bytearray(len(view))
+    for index in range(0, len(view), 3):
+        hue = _hue_sextant(view[index])
+        whiteness = _clip_percent(view[index + 1]) / 100
+        blackness = _clip_percent(view[index + 2]) / 100
+        if whiteness + blackness >= 1:
+            gray = _round_channel(whiteness / (whiteness + blackness))
+            result[index] = result[index + 1] = result[index + 2] = gray
+            continue
+        scale = 1 - whiteness - blackness
+        result[index] = _round_channel(
+            _hsl_channel(0, hue, 0.5, 0.5) * scale + whiteness
+        )
+        result[index + 1] = _round_channel(
+            _hsl_channel(8, hue, 0.5, 0.5) * scale + whiteness
+        )
+        result[index + 2] = _round_channel(
+            _hsl_channel(4, hue, 0.5, 0.5) * scale + whiteness
+        )
+    return result
@@ -0,0 +1,306 @@
+"""
+Relative luminance and contrast ratio, as defined by the Web Content Accessibility
+Guidelines (WCAG) 2:
+
+https://www.w3.org/TR/WCAG22/#dfn-relative-luminance
+
+https://www.w3.org/TR/WCAG22/#dfn-contrast-ratio
+
+"""
+
+# SPDX-License-Identifier: BSD-3-Clause
+
+import bisect
+import typing
+from array import array
+
+from ._caching import _cached
+from ._colorspaces import _SRGB_TO_LINEAR
+from ._definitions import CSS3, _get_name_to_packed_map, names_tuple
+from ._normalization import _as_byte_view, normalize_integer_triplet
+from ._types import IntTuple
+
+# The contribution of each 8-bit value of each channel to relative luminance: its
+# linear-light value, weighted by the luminance coefficient of the channel. WCAG 2 uses
+# a linearization threshold of 0.03928 rather than the 0.04045 of sRGB, but no 8-bit
+# channel value falls between the two, so the sRGB table can be used for both.
+_RED_LUMINANCE = tuple(0.2126 * value for value in _SRGB_TO_LINEAR)
+_GREEN_LUMINANCE = tuple(0.7152 * value for value in _SRGB_TO_LINEAR)
+_BLUE_LUMINANCE = tuple(0.0722 * value for value in _SRGB_TO_LINEAR)
+
+# The flare term added to both luminances when computing a contrast ratio.
+_FLARE = 0.05
+
+
+class _LuminanceIndex(typing.NamedTuple):
+    """
+    Internal index of the named colors of a specification by relative luminance.
+
+    ``luminances`` holds the luminance of every color name, plus the flare term, in
+    ascending order, and ``names`` holds the corresponding names.
+
+    """
+
+    luminances: typing.Tuple[float, ...]
+    names: typing.Tuple[str, ...]
+
+
+_luminance_indexes: typing.Dict[typing.Tuple[str], _LuminanceIndex] = {}
+
+
+def _luminance(red: int, green: int, blue: int) -> float:
+    """
+    Internal helper returning the relative luminance of an 8-bit sRGB color.
+
+    """
+    return _RED_LUMINANCE[red] + _GREEN_LUMINANCE[green] + _BLUE_LUMINANCE[blue]
+
+
+def _ratio(first: float, second: float) -> float:
+    """
+    Internal helper returning the contrast ratio of two relative luminances.
+
+    """
+    if first < second:
+        first, second = second, first
+    return (first + _FLARE) / (second + _FLARE)
+
+
+def _luminances(rgb_buffer) -> typing.List[float]:
+    """
+    Internal helper returning the relative luminance of each color in a buffer of
+    packed 8-bit RGB colors.
+
+    :raises ValueError: when the buffer is not a contiguous buffer of bytes whose
+       length is a multiple of three.
+
+    """
+    view = _as_byte_view(rgb_buffer)
+    return list(map(_luminance, view[0::3], view[1::3], view[2::3]))
+
+
+def relative_luminance(rgb_triplet: IntTuple) -> float:
+    """
+    Return the relative luminance of a color given as a 3-:class:`tuple` of
+    :class:`int`, suitable for use in an ``rgb()`` triplet: its brightness, from 0.0
+    for black to 1.0 for white, as defined by WCAG 2.
+
+    Each channel is converted to linear light using a precomputed table of the 256
+    possible channel values, so no exponentiation is done per color.
+
+    Examples:
+
+    .. doctest::
+
+        >>> relative_luminance((255, 255, 255))
+        1.0
+        >>> relative_luminance((0, 0, 128))
+        0.01...
+
+    :param rgb_triplet: The ``rgb()`` triplet.
+
+    """
+    return _luminance(*normalize_integer_triplet(rgb_triplet))
+
+
+def contrast_ratio(first_rgb_triplet: IntTuple, second_rgb_triplet: IntTuple) -> float:
+    """
+    Return the contrast ratio of two colors, each given as a 3-:class:`tuple` of
+    :class:`int` suitable for use in an ``rgb()`` triplet, as defined by WCAG 2.
+
+    The ratio ranges from 1.0, for two colors of the same luminance, to 21.0, for black
+    and white, and does not depend on the order of the colors. WCAG 2 level AA requires
+    a ratio of at least 4.5 between text and its background (or 3 for large text), and
+    level AAA requires at least 7 (or 4.5 for large text).
+
+    Examples:
+
+    .. doctest::
+
+        >>> contrast_ratio((0, 0, 0), (255, 255, 255))
+        21.0
+        >>> round(contrast_ratio((0, 0, 128), (218, 165, 32)), 2)
+        7.15
+
+    :param first_rgb_triplet: The ``rgb()`` triplet of the first color.
+    :param second_rgb_triplet: The ``rgb()`` triplet of the second color.
+
+    """
+    return _ratio(
+        relative_luminance(first_rgb_triplet), relative_luminance(second_rgb_triplet)
+    )
+
+
+def relative_luminance_array(rgb_buffer) -> array:
+    """
+    Return the relative luminance of each color in a buffer of packed 8-bit RGB
+    colors, as an :class:`array.array` of doubles.
+
+    The input may be any C-contiguous object supporting the buffer protocol whose items
+    are single bytes, and it is read in place, without being copied. Each value of the
+    result is identical to the result of :func:`relative_luminance` for the
+    corresponding color.
+
+    Examples:
+
+    .. doctest::
+
+        >>> relative_luminance_array(bytes([255, 255, 255, 0, 0, 0]))
+        array('d', [1.0, 0.0])
+
+    :param rgb_buffer: The buffer of RGB colors.
+    :raises ValueError: when the buffer is not a contiguous buffer of bytes whose
+       length is a multiple of three.
+
+    """
+    return array("d", _luminances(rgb_buffer))
+
+
+def contrast_ratio_array(first_rgb_buffer, second_rgb_buffer) -> array:
+    """
+    Return the contrast ratio of each pair of corresponding colors in two buffers of
+    packed 8-bit RGB colors -- for example, of foreground and background colors -- as
+    an :class:`array.array` of doubles.
+
+    The inputs are read in place as described for :func:`relative_luminance_array`,
+    and each value of the result is identical to the result of :func:`contrast_ratio`
+    for the corresponding pair of colors.
+
+    Examples:
+
+    .. doctest::
+
+        >>> contrast_ratio_array(
+        ...     bytes([0, 0, 0, 255, 255, 255]), bytes([255, 255, 255, 255, 255, 255])
+        ... )
+        array('d', [21.0, 1.0])
+
+    :param first_rgb_buffer: The buffer of the first color of each pair.
+    :param second_rgb_buffer: The buffer of the second color of each pair.
+    :raises ValueError: when either buffer is not a contiguous buffer of bytes whose
+       length is a multiple of three, or when the buffers hold different numbers of
+       colors.
+
+    """
+    first = _luminances(first_rgb_buffer)
+    second = _luminances(second_rgb_buffer)
+    if len(first) != len(second):
+        raise ValueError(
+            f"Cannot pair a buffer of {len(first)} colors with a buffer of "
+            f"{len(second)} colors."
+        )
+    return array("d", map(_ratio, first, second))
+
+
+def _get_luminance_index(spec: str) -> _LuminanceIndex:
+    """
+    Return the luminance index for the given specification, building it on first use.
+
+    :raises ValueError: when the given spec is not supported.
+
+    """
+    return _cached(_luminance_indexes, _build_luminance_index, spec)
+
+
+def _build_luminance_index(spec: str) -> _LuminanceIndex:
+    """
+    Build the luminance index for the given specification.
+
+    :raises ValueError: when the given spec is not supported.
+
+    """
+    name_to_packed = _get_name_to_packed_map(spec)
+    entries = []
+    for name in names_tuple(spec):
+        value = name_to_packed[name]
+        luminance = _luminance(value >> 16, value >> 8 & 0xFF, value & 0xFF)
+        entries.append((luminance + _FLARE, name))
+    entries.sort()
+    return _LuminanceIndex(
+        tuple(luminance for luminance, _ in entries), tuple(name for _, name in entries)
+    )
+
+
+def _prefix_end(estimate: int, size: int, meets: typing.Callable[[int], bool]) -> int:
+    """
+    Internal helper returning the end of the run of positions, from 0 up to ``size``,
+    for which ``meets`` is true, by moving an estimate of it an entry at a time.
+
+    """
+    while estimate and not meets(estimate - 1):
+        estimate -= 1
+    while estimate < size and meets(estimate):
+        estimate += 1
+    return estimate
+
+
+def names_with_contrast(
+    rgb_triplet: IntTuple, min_ratio: float = 4.5, spec: str = CSS3
+) -> typing.List[str]:
+    """
+    Return, in alphabetical order, the color names of the given specification whose
+    contrast ratio (see :func:`contrast_ratio`) with a color given as a
+    3-:class:`tuple` of :class:`int`, suitable for use in an ``rgb()`` triplet, is at
+    least the given ratio.
+
+    The named colors are indexed by luminance once per specification, and every color
+    meeting the ratio is either darker or lighter than all of the rest, so each query
+    only needs two binary searches of the index.
+
+    Examples:
+
+    .. doctest::
+
+        >>> names_with_contrast((0, 0, 128), min_ratio=12, spec=HTML4)
+        ['aqua', 'white', 'yellow']
+        >>> names_with_contrast((128, 128, 128), min_ratio=4, spec=HTML4)
+        ['black', 'navy']
+
+    :param rgb_triplet: The ``rgb()`` triplet of the color to contrast with.
+    :param min_ratio: The minimum contrast ratio. Default is 4.5, the minimum for
+       text under WCAG 2 level AA.
+    :param spec: The specification from which to draw the list of color names. Default
+       is :data:`CSS3`.
+    :raises ValueError: when the given spec is not supported, or when ``min_ratio`` is
+       not greater than 0.
+
+    """
+    if not min_ratio > 0:
+        raise ValueError(f"min_ratio must be greater than 0, not {min_ratio}.")
+    index = _get_luminance_index(spec)
+    luminances = index.luminances
+    luminance = relative_luminance(rgb_triplet) + _FLARE
+
+    def darker_meets(position: int) -> bool:
+        """
+        Return whether the name at the given position is no lighter than the color,
+        and meets the ratio.
+
+        """
+        other = luminances[position]
+        return other <= luminance and luminance / other >= min_ratio
+
+    def lighter_fails(position: int) -> bool:
+        """
+        Return whether the name at the given position is darker than the color, or
+        fails to meet the ratio.
+
+        """
+        other = luminances[position]
+        return other < luminance or other / luminance < min_ratio
+
+    # The bisections only estimate the bounds, since dividing or multiplying by the
+    # ratio rounds differently from the division of contrast_ratio(); the estimates
+    # are corrected by comparing ratios computed exactly as it computes them.
+    darker = _prefix_end(
+        bisect.bisect_right(luminances, luminance / min_ratio),
+        len(luminances),
+        darker_meets,
+    )
+    lighter = _prefix_end(
+        bisect.bisect_left(luminances, luminance * min_ratio),
+        len(luminances),
+        lighter_fails,
+    )
+    # With a ratio of 1 or less, the darker and lighter names overlap.
+    return sorted(index.names[:darker] + index.names[max(darker, lighter) :])
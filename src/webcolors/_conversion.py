@@ -5,7 +5,13 @@ Functions which convert between various types of color values.
 
 # SPDX-License-Identifier: BSD-3-Clause
 
-from ._definitions import CSS3, _get_hex_to_name_map, _get_name_to_hex_map
+from ._definitions import (
+    CSS3,
+    _get_cased_name_to_hex_map,
+    _get_cased_name_to_rgb_map,
+    _get_hex_to_name_map,
+    _get_packed_to_name_map,
+)
 from ._normalization import (
     _percent_to_integer,
     normalize_hex,
@@ -14,6 +20,78 @@ from ._normalization import (
 )
 from ._types import IntegerRGB, IntTuple, PercentRGB, PercentTuple
 
+# In order to maintain precision for common values when converting integers to
+# percentages, they are special-cased.
+_PERCENT_SPECIALS = {
+    255: "100%",
+    128: "50%",
+    64: "25%",
+    32: "12.5%",
+    16: "6.25%",
+    0: "0%",
+}
+
+
+# Internal conversions of already-normalized values.
+# --------------------------------------------------------------------------------
+#
+# Each public conversion normalizes its input once, and then passes it along a chain of
+# these functions, which trust that their input is already normalized -- either by the
+# public function, or because it was produced by another conversion -- rather than
+# normalizing it again at every step.
+
+
+def _rgb_to_name(rgb_triplet: IntTuple, spec: str) -> str:
+    """
+    Internal helper converting a normalized integer ``rgb()`` triplet to its
+    normalized color name.
+
+    :raises ValueError: when the given color has no name in the given spec, or when
+       the given spec is not supported.
+
+    """
+    red, green, blue = rgb_triplet
+    value = red << 16 | green << 8 | blue
+    if name := _get_packed_to_name_map(spec).get(value):
+        return name
+    raise ValueError(f'"#{value:06x}" has no defined color name in {spec}.')
+
+
+def _rgb_to_hex(rgb_triplet: IntTuple) -> str:
+    """
+    Internal helper converting a normalized integer ``rgb()`` triplet to a normalized
+    hexadecimal color value.
+
+    """
+    red, green, blue = rgb_triplet
+    return f"#{red:02x}{green:02x}{blue:02x}"
+
+
+def _rgb_to_rgb_percent(rgb_triplet: IntTuple) -> PercentRGB:
+    """
+    Internal helper converting a normalized integer ``rgb()`` triplet to a percentage
+    ``rgb()`` triplet.
+
+    """
+    return PercentRGB._make(
+        _PERCENT_SPECIALS.get(d, f"{d / 255.0 * 100:.02f}%") for d in rgb_triplet
+    )
+
+
+def _rgb_percent_to_rgb(rgb_percent_triplet: PercentTuple) -> IntegerRGB:
+    """
+    Internal helper converting a normalized percentage ``rgb()`` triplet to an integer
+    ``rgb()`` triplet.
+
+    """
+    return IntegerRGB._make(
+        map(
+            _percent_to_integer,  # pylint: disable=protected-access
+            rgb_percent_triplet,
+        )
+    )
+
+
 # Conversions from color names to other formats.
 # --------------------------------------------------------------------------------
 
@@ -45,8 +123,10 @@ def name_to_hex(name: str, spec: str = CSS3) -> str:
     :raises ValueError: when the given name has no definition in the given spec.
 
     """
-    color_map = _get_name_to_hex_map(spec)
-    if hex_value := color_map.get(name.lower()):
+    # Names in the most common letter cases can be found without first normalizing
+    # them to lower-case.
+    color_map = _get_cased_name_to_hex_map(spec)
+    if hex_value := color_map.get(name) or color_map.get(name.lower()):
         return hex_value
     raise ValueError(f'"{name}" is not defined as a named color in {spec}')
 
@@ -75,7 +155,10 @@ def name_to_rgb(name: str, spec: str = CSS3) -> IntegerRGB:
     :raises ValueError: when the given name has no definition in the given spec.
 
     """
-    return hex_to_rgb(name_to_hex(name, spec=spec))
+    color_map = _get_cased_name_to_rgb_map(spec)
+    if rgb_triplet := color_map.get(name) or color_map.get(name.lower()):
+        return rgb_triplet
+    raise ValueError(f'"{name}" is not defined as a named color in {spec}')
 
 
 def name_to_rgb_percent(name: str, spec: str = CSS3) -> PercentRGB:
@@ -102,7 +185,7 @@ def name_to_rgb_percent(name: str, spec: str = CSS3) -> PercentRGB:
     :raises ValueError: when the given name has no definition in the given spec.
 
     """
-    return rgb_to_rgb_percent(name_to_rgb(name, spec=spec))
+    return _rgb_to_rgb_percent(name_to_rgb(name, spec=spec))
 
 
 # Conversions from hexadecimal color values to other formats.
@@ -198,7 +281,7 @@ def hex_to_rgb_percent(hex_value: str) -> PercentRGB:
     :raises ValueError: when the supplied hex value is invalid.
 
     """
-    return rgb_to_rgb_percent(hex_to_rgb(hex_value))
+    return _rgb_to_rgb_percent(hex_to_rgb(hex_value))
 
 
 # Conversions from  integer rgb() triplets to other formats.
@@ -210,8 +293,7 @@ def rgb_to_name(rgb_triplet: IntTuple, spec: str = CSS3) -> str:
     Convert a 3-:class:`tuple` of :class:`int`, suitable for use in an ``rgb()``
     color triplet, to its corresponding normalized color name, if any such name exists.
 
-    To determine the name, the triplet will be converted to a normalized hexadecimal
-    value.
+    The triplet will be normalized before being looked up.
 
     .. note:: **Spelling variants**
 
@@ -236,7 +318,7 @@ def rgb_to_name(rgb_triplet: IntTuple, spec: str = CSS3) -> str:
     :raises ValueError: when the given color has no name in the given spec.
 
     """
-    return hex_to_name(rgb_to_hex(normalize_integer_triplet(rgb_triplet)), spec=spec)
+    return _rgb_to_name(normalize_integer_triplet(rgb_triplet), spec)
 
 
 def rgb_to_hex(rgb_triplet: IntTuple) -> str:
@@ -256,8 +338,7 @@ def rgb_to_hex(rgb_triplet: IntTuple) -> str:
     :param rgb_triplet: The ``rgb()`` triplet.
 
     """
-    red, green, blue = normalize_integer_triplet(rgb_triplet)
-    return f"#{red:02x}{green:02x}{blue:02x}"
+    return _rgb_to_hex(normalize_integer_triplet(rgb_triplet))
 
 
 def rgb_to_rgb_percent(rgb_triplet: IntTuple) -> PercentRGB:
@@ -290,20 +371,7 @@ def rgb_to_rgb_percent(rgb_triplet: IntTuple) -> PercentRGB:
     :param rgb_triplet: The ``rgb()`` triplet.
 
     """
-    # In order to maintain precision for common values,
-    # special-case them.
-    specials = {
-        255: "100%",
-        128: "50%",
-        64: "25%",
-        32: "12.5%",
-        16: "6.25%",
-        0: "0%",
-    }
-    return PercentRGB._make(
-        specials.get(d, f"{d / 255.0 * 100:.02f}%")
-        for d in normalize_integer_triplet(rgb_triplet)
-    )
+    return _rgb_to_rgb_percent(normalize_integer_triplet(rgb_triplet))
 
 
 # Conversions from percentage rgb() triplets to other formats.
@@ -343,9 +411,8 @@ def rgb_percent_to_name(rgb_percent_triplet: PercentTuple, spec: str = CSS3) ->
     :raises ValueError: when the given color has no name in the given spec.
 
     """
-    return rgb_to_name(
-        rgb_percent_to_rgb(normalize_percent_triplet(rgb_percent_triplet)),
-        spec=spec,
+    return _rgb_to_name(
+        _rgb_percent_to_rgb(normalize_percent_triplet(rgb_percent_triplet)), spec
     )
 
 
@@ -368,8 +435,8 @@ def rgb_percent_to_hex(rgb_percent_triplet: PercentTuple) -> str:
     :param rgb_percent_triplet: The ``rgb()`` triplet.
 
     """
-    return rgb_to_hex(
-        rgb_percent_to_rgb(normalize_percent_triplet(rgb_percent_triplet))
+    return _rgb_to_hex(
+        _rgb_percent_to_rgb(normalize_percent_triplet(rgb_percent_triplet))
     )
 
 
@@ -396,9 +463,4 @@ def rgb_percent_to_rgb(rgb_percent_triplet: PercentTuple) -> IntegerRGB:
     :param rgb_percent_triplet: The ``rgb()`` triplet.
 
     """
-    return IntegerRGB._make(
-        map(
-            _percent_to_integer,  # pylint: disable=protected-access
-            normalize_percent_triplet(rgb_percent_triplet),
-        )
-    )
+    return _rgb_percent_to_rgb(normalize_percent_triplet(rgb_percent_triplet))
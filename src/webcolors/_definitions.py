@@ -6,17 +6,25 @@ Definitions of valid formats and values for colors.
 # SPDX-License-Identifier: BSD-3-Clause
 
 import re
-from typing import List
-
-
-def _reversedict(dict_to_reverse: dict) -> dict:
-    """
-    Internal helper for generating reverse mappings; given a dictionary, returns a
-    new dictionary with keys and values swapped.
-
-    """
-    return {value: key for key, value in dict_to_reverse.items()}
-
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
+
+from ._caching import _cached
+from ._tables import (
+    _CSS3_CASED_NAMES_TO_HEX,
+    _CSS3_HEX_TO_NAMES,
+    _CSS3_NAMES_TO_PACKED,
+    _CSS3_PACKED_TO_NAMES,
+    _CSS21_CASED_NAMES_TO_HEX,
+    _CSS21_HEX_TO_NAMES,
+    _CSS21_NAMES_TO_PACKED,
+    _CSS21_PACKED_TO_NAMES,
+    _HTML4_CASED_NAMES_TO_HEX,
+    _HTML4_HEX_TO_NAMES,
+    _HTML4_NAMES_TO_PACKED,
+    _HTML4_PACKED_TO_NAMES,
+)
+from ._types import IntegerRGB
 
 _HEX_COLOR_RE = re.compile(r"^#([a-fA-F0-9]{3}|[a-fA-F0-9]{6})$")
 
@@ -236,31 +244,23 @@ _CSS3_NAMES_TO_HEX = {
 }
 
 
-# Mappings of normalized hexadecimal color values to color names.
+# Derived mappings.
 # --------------------------------------------------------------------------------
 
-_HTML4_HEX_TO_NAMES = _reversedict(_HTML4_NAMES_TO_HEX)
+# The remaining mappings are derived from the ones above: mappings of normalized
+# hexadecimal values to normalized color names, of names to the integer value of their
+# hexadecimal values, and of names in several common letter cases (all-lowercase,
+# all-uppercase, and capitalized) to hexadecimal values. Rather than being computed at
+# import time, they are precomputed into the module webcolors._tables; see
+# webcolors._tablegen for how they are derived and how to regenerate them.
 
 _CSS2_HEX_TO_NAMES = _HTML4_HEX_TO_NAMES
 
-_CSS21_HEX_TO_NAMES = _reversedict(_CSS21_NAMES_TO_HEX)
+_CSS2_NAMES_TO_PACKED = _HTML4_NAMES_TO_PACKED
 
-_CSS3_HEX_TO_NAMES = _reversedict(_CSS3_NAMES_TO_HEX)
+_CSS2_CASED_NAMES_TO_HEX = _HTML4_CASED_NAMES_TO_HEX
 
-# CSS3 defines both "gray" and "grey", as well as defining either spelling variant for
-# other related colors like "darkgray"/"darkgrey", etc. For a "forward" lookup from
-# name to hex, this is straightforward, but a "reverse" lookup from hex to name requires
-# picking one spelling and being consistent about it.
-#
-# Since "gray" was the only spelling supported in HTML 4, CSS1, and CSS2, "gray" and its
-# variants are chosen here.
-_CSS3_HEX_TO_NAMES["#a9a9a9"] = "darkgray"
-_CSS3_HEX_TO_NAMES["#2f4f4f"] = "darkslategray"
-_CSS3_HEX_TO_NAMES["#696969"] = "dimgray"
-_CSS3_HEX_TO_NAMES["#808080"] = "gray"
-_CSS3_HEX_TO_NAMES["#d3d3d3"] = "lightgray"
-_CSS3_HEX_TO_NAMES["#778899"] = "lightslategray"
-_CSS3_HEX_TO_NAMES["#708090"] = "slategray"
+_CSS2_PACKED_TO_NAMES = _HTML4_PACKED_TO_NAMES
 
 
 _names_to_hex = {
@@ -278,6 +278,46 @@ _hex_to_names = {
 }
 
 
+_names_to_packed = {
+    HTML4: _HTML4_NAMES_TO_PACKED,
+    CSS2: _CSS2_NAMES_TO_PACKED,
+    CSS21: _CSS21_NAMES_TO_PACKED,
+    CSS3: _CSS3_NAMES_TO_PACKED,
+}
+
+_cased_names_to_hex = {
+    HTML4: _HTML4_CASED_NAMES_TO_HEX,
+    CSS2: _CSS2_CASED_NAMES_TO_HEX,
+    CSS21: _CSS21_CASED_NAMES_TO_HEX,
+    CSS3: _CSS3_CASED_NAMES_TO_HEX,
+}
+
+_packed_to_names = {
+    HTML4: _HTML4_PACKED_TO_NAMES,
+    CSS2: _CSS2_PACKED_TO_NAMES,
+    CSS21: _CSS21_PACKED_TO_NAMES,
+    CSS3: _CSS3_PACKED_TO_NAMES,
+}
+
+# Read-only views of the above, and the sorted names of each specification, which are
+# handed out publicly so that callers can use them without copying them.
+_name_to_hex_views = {
+    spec: MappingProxyType(mapping) for spec, mapping in _names_to_hex.items()
+}
+
+_hex_to_name_views = {
+    spec: MappingProxyType(mapping) for spec, mapping in _hex_to_names.items()
+}
+
+_sorted_names = {
+    spec: tuple(sorted(mapping)) for spec, mapping in _names_to_hex.items()
+}
+
+# Built on first use from the above, since they hold IntegerRGB instances rather than
+# literal values.
+_cased_names_to_rgb: Dict[Tuple[str], Dict[str, IntegerRGB]] = {}
+
+
 def _get_name_to_hex_map(spec: str):
     """
     Return the name-to-hex mapping for the given specification.
@@ -302,6 +342,76 @@ def _get_hex_to_name_map(spec: str):
     return _hex_to_names[spec]
 
 
+def _get_name_to_packed_map(spec: str):
+    """
+    Return the mapping of names to integer color values for the given specification.
+
+    :raises ValueError: when the given spec is not supported.
+
+    """
+    if spec not in _SUPPORTED_SPECIFICATIONS:
+        raise ValueError(_SPECIFICATION_ERROR_TEMPLATE.format(spec=spec))
+    return _names_to_packed[spec]
+
+
+def _get_cased_name_to_hex_map(spec: str):
+    """
+    Return the mapping of names, in several common letter cases, to hex values for the
+    given specification.
+
+    :raises ValueError: when the given spec is not supported.
+
+    """
+    if spec not in _SUPPORTED_SPECIFICATIONS:
+        raise ValueError(_SPECIFICATION_ERROR_TEMPLATE.format(spec=spec))
+    return _cased_names_to_hex[spec]
+
+
+def _get_packed_to_name_map(spec: str):
+    """
+    Return the mapping of integer color values to normalized names for the given
+    specification.
+
+    :raises ValueError: when the given spec is not supported.
+
+    """
+    if spec not in _SUPPORTED_SPECIFICATIONS:
+        raise ValueError(_SPECIFICATION_ERROR_TEMPLATE.format(spec=spec))
+    return _packed_to_names[spec]
+
+
+def _get_cased_name_to_rgb_map(spec: str) -> Dict[str, IntegerRGB]:
+    """
+    Return the mapping of names, in several common letter cases, to integer ``rgb()``
+    triplets for the given specification, building it on first use.
+
+    :raises ValueError: when the given spec is not supported.
+
+    """
+    return _cached(_cased_names_to_rgb, _build_cased_name_to_rgb_map, spec)
+
+
+def _build_cased_name_to_rgb_map(spec: str) -> Dict[str, IntegerRGB]:
+    """
+    Build the mapping of names, in several common letter cases, to integer ``rgb()``
+    triplets for the given specification. All the names of a color share a single
+    triplet.
+
+    :raises ValueError: when the given spec is not supported.
+
+    """
+    triplets: Dict[str, IntegerRGB] = {}
+    cased_names_to_rgb = {}
+    for name, hex_value in _get_cased_name_to_hex_map(spec).items():
+        if (triplet := triplets.get(hex_value)) is None:
+            value = int(hex_value[1:], 16)
+            triplet = triplets[hex_value] = IntegerRGB(
+                value >> 16, value >> 8 & 0xFF, value & 0xFF
+            )
+        cased_names_to_rgb[name] = triplet
+    return cased_names_to_rgb
+
+
 def names(spec: str = CSS3) -> List[str]:
     """
     Return the list of valid color names for the given specification.
@@ -335,8 +445,95 @@ def names(spec: str = CSS3) -> List[str]:
 
     :raises ValueError: when the given spec is not supported.
 
+    """
+    return list(names_tuple(spec))
+
+
+def names_tuple(spec: str = CSS3) -> Tuple[str, ...]:
+    """
+    Return the valid color names for the given specification, as a :class:`tuple`.
+
+    This returns the same names as :func:`names`, in the same order, but rather than
+    building a new :class:`list` on each call, it returns the same immutable tuple
+    every time, so it can be used freely without copying.
+
+    Examples:
+
+    .. doctest::
+
+        >>> names_tuple(spec=HTML4)[:4]
+        ('aqua', 'black', 'blue', 'fuchsia')
+        >>> names_tuple() is names_tuple()
+        True
+
+    :param spec: The specification from which to draw the list of color names. Default
+       is :data:`CSS3`.
+    :raises ValueError: when the given spec is not supported.
+
+    """
+    if spec not in _SUPPORTED_SPECIFICATIONS:
+        raise ValueError(_SPECIFICATION_ERROR_TEMPLATE.format(spec=spec))
+    return _sorted_names[spec]
+
+
+def name_to_hex_mapping(spec: str = CSS3) -> Mapping[str, str]:
+    """
+    Return a read-only mapping of the color names of the given specification to their
+    normalized hexadecimal color values.
+
+    The mapping is a :class:`types.MappingProxyType` view of the table used by
+    ``webcolors`` itself, so it is not copied, and it cannot be modified. Its keys are
+    normalized (all-lowercase) names, including -- for CSS3 -- both spelling variants
+    of the ``"gray"``/``"grey"`` colors.
+
+    Examples:
+
+    .. doctest::
+
+        >>> mapping = name_to_hex_mapping(spec=HTML4)
+        >>> mapping["navy"]
+        '#000080'
+        >>> len(mapping)
+        16
+        >>> mapping["navy"] = "#000000"
+        Traceback (most recent call last):
+            ...
+        TypeError: 'mappingproxy' object does not support item assignment
+
+    :param spec: The specification from which to draw the color names. Default is
+       :data:`CSS3`.
+    :raises ValueError: when the given spec is not supported.
+
+    """
+    if spec not in _SUPPORTED_SPECIFICATIONS:
+        raise ValueError(_SPECIFICATION_ERROR_TEMPLATE.format(spec=spec))
+    return _name_to_hex_views[spec]
+
+
+def hex_to_name_mapping(spec: str = CSS3) -> Mapping[str, str]:
+    """
+    Return a read-only mapping of the normalized hexadecimal color values of the named
+    colors of the given specification to their normalized names.
+
+    As with :func:`name_to_hex_mapping`, the mapping is a read-only view, not a copy.
+    Where a color has two names in CSS3, it maps to the ``"gray"`` spelling, as
+    :func:`hex_to_name` does.
+
+    Examples:
+
+    .. doctest::
+
+        >>> mapping = hex_to_name_mapping()
+        >>> mapping["#000080"]
+        'navy'
+        >>> mapping["#808080"]
+        'gray'
+
+    :param spec: The specification from which to draw the color names. Default is
+       :data:`CSS3`.
+    :raises ValueError: when the given spec is not supported.
+
     """
     if spec not in _SUPPORTED_SPECIFICATIONS:
         raise ValueError(_SPECIFICATION_ERROR_TEMPLATE.format(spec=spec))
-    mapping = _names_to_hex[spec]
-    return list(sorted(mapping.keys()))
+    return _hex_to_name_views[spec]
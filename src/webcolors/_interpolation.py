@@ -0,0 +1,173 @@
+"""
+Interpolation of gradients between colors.
+
+"""
+
+# SPDX-License-Identifier: BSD-3-Clause
+
+import bisect
+import itertools
+import typing
+from array import array
+
+from ._colorspaces import _SRGB_TO_LINEAR, _lab_to_linear, _rgb_to_lab
+from ._conversion import hex_to_rgb, name_to_rgb, rgb_percent_to_rgb
+from ._definitions import CSS3
+from ._normalization import normalize_integer_triplet
+from ._types import IntTuple, PercentTuple
+
+# The color spaces in which gradients can be interpolated, and the conversions of 8-bit
+# sRGB colors to coordinates in each.
+_TO_COORDINATES = {
+    "rgb": lambda red, green, blue: (red, green, blue),
+    "linear-rgb": lambda red, green, blue: (
+        _SRGB_TO_LINEAR[red],
+        _SRGB_TO_LINEAR[green],
+        _SRGB_TO_LINEAR[blue],
+    ),
+    "lab": _rgb_to_lab,
+}
+
+# For the spaces in which each coordinate maps to a single sRGB channel, the values of
+# a coordinate at the midpoints between consecutive 8-bit channel values. Counting the
+# midpoints at or below a coordinate, which bisection does without a Python-level
+# function call, rounds it to the nearest 8-bit channel value.
+_MIDPOINTS = {
+    "rgb": tuple(value + 0.5 for value in range(255)),
+    "linear-rgb": tuple(
+        value / 12.92 if value <= 0.04045 else ((value + 0.055) / 1.055) ** 2.4
+        for value in ((i + 0.5) / 255 for i in range(255))
+    ),
+}
+
+# The forms in which interpolated colors can be returned, and the conversions of lists
+# of packed integers to each.
+_OUTPUTS = {
+    "hex": lambda packed: [f"#{value:06x}" for value in packed],
+    "packed": lambda packed: array("I", packed),
+    "rgb": lambda packed: bytearray(
+        b"".join(value.to_bytes(3, "big") for value in packed)
+    ),
+}
+
+Stop = typing.Union[str, IntTuple, PercentTuple]
+
+
+def _stop_to_rgb(stop: Stop, spec: str) -> IntTuple:
+    """
+    Internal helper converting a gradient stop, given as a color name, a hexadecimal
+    color value, or an integer or percentage ``rgb()`` triplet, to an integer
+    ``rgb()`` triplet.
+
+    :raises ValueError: when the stop is not a valid color in any of those formats.
+
+    """
+    if isinstance(stop, str):
+        return hex_to_rgb(stop) if stop.startswith("#") else name_to_rgb(stop, spec)
+    if all(isinstance(value, str) for value in stop):
+        return rgb_percent_to_rgb(stop)
+    return normalize_integer_triplet(stop)
+
+
+def interpolate(
+    stops: typing.Sequence[Stop],
+    steps: int,
+    space: str = "rgb",
+    output: str = "hex",
+    spec: str = CSS3,
+) -> typing.Union[typing.List[str], array, bytearray]:
+    """
+    Return ``steps`` evenly spaced colors along a gradient through the given stops,
+    from the first stop to the last.
+
+    Stops may be given in any of the formats supported by ``webcolors``: color names,
+    hexadecimal color values, and integer or percentage ``rgb()`` triplets, in any
+    mixture. They are evenly spaced along the gradient, and each interpolated color is
+    rounded to the nearest 8-bit sRGB color.
+
+    Three color spaces are available to interpolate in:
+
+    * ``"rgb"`` interpolates the sRGB channel values directly, as CSS gradients do by
+      default.
+
+    * ``"linear-rgb"`` interpolates linear-light sRGB values, which mixes colors as
+      light does, avoiding the dark bands which ``"rgb"`` produces between saturated
+      colors.
+
+    * ``"lab"`` interpolates CIE L*a*b* coordinates, which changes perceived color at
+      an even rate along the gradient, as is wanted for the colormaps of charts.
+
+    And three forms of output:
+
+    * ``"hex"``, a :class:`list` of normalized hexadecimal color values.
+
+    * ``"packed"``, an :class:`array.array` of unsigned 32-bit integers (typecode
+      ``"I"``) of the form ``red << 16 | green << 8 | blue``.
+
+    * ``"rgb"``, a :class:`bytearray` of packed 8-bit RGB colors, three bytes per
+      color, as used by the array forms of other functions.
+
+    Examples:
+
+    .. doctest::
+
+        >>> interpolate(["black", "#fff"], 5)
+        ['#000000', '#404040', '#808080', '#bfbfbf', '#ffffff']
+        >>> interpolate(["black", "#fff"], 3, space="linear-rgb")
+        ['#000000', '#bcbcbc', '#ffffff']
+        >>> interpolate([(255, 0, 0), ("0%", "0%", "100%")], 3, space="lab")
+        ['#ff0000', '#ca0088', '#0000ff']
+        >>> interpolate(["navy", "red", "yellow"], 3, output="packed")
+        array('I', [128, 16711680, 16776960])
+
+    :param stops: The colors to interpolate between.
+    :param steps: The number of colors to return.
+    :param space: The color space to interpolate in: ``"rgb"``, ``"linear-rgb"`` or
+       ``"lab"``. Default is ``"rgb"``.
+    :param output: The form of the result: ``"hex"``, ``"packed"`` or ``"rgb"``.
+       Default is ``"hex"``.
+    :param spec: The specification from which to draw the color names used as stops.
+       Default is :data:`CSS3`.
+    :raises ValueError: when fewer than two stops or two steps are given, when any of
+       the stops is not a valid color, or when the given space, output form or spec is
+       not supported.
+
+    """
+    if space not in _TO_COORDINATES:
+        raise ValueError(
+            f"{space} is not a supported color space for interpolation; supported "
+            f"spaces are: {tuple(_TO_COORDINATES)}."
+        )
+    if output not in _OUTPUTS:
+        raise ValueError(
+            f"{output} is not a supported output form; supported forms are: "
+            f"{tuple(_OUTPUTS)}."
+        )
+    if len(stops) < 2 or steps < 2:
+        raise ValueError("Gradients need at least two stops and two steps.")
+    to_coordinates = _TO_COORDINATES[space]
+    points = [to_coordinates(*_stop_to_rgb(stop, spec)) for stop in stops]
+    # Each step's position along the gradient, counted in segments between stops, and
+    # the segment it falls in. Each channel is then interpolated as a whole column at
+    # once, from the start and change of its value over each segment.
+    positions = [step * (len(points) - 1) / (steps - 1) for step in range(steps)]
+    segments = [min(int(position), len(points) - 2) for position in positions]
+    columns = []
+    for channel in range(3):
+        starts = [point[channel] for point in points]
+        deltas = [last - first for first, last in zip(starts, starts[1:])]
+        columns.append(
+            [
+                starts[segment] + deltas[segment] * (position - segment)
+                for position, segment in zip(positions, segments)
+            ]
+        )
+    if space == "lab":
+        # Lab coordinates are converted to linear light, and rounded from there.
+        columns = zip(*map(_lab_to_linear, *columns))
+        midpoints = itertools.repeat(_MIDPOINTS["linear-rgb"])
+    else:
+        midpoints = itertools.repeat(_MIDPOINTS[space])
+    triplets = zip(*(map(bisect.bisect_right, midpoints, column) for column in columns))
+    packed = [red << 16 | green << 8 | blue for red, green, blue in triplets]
+    return _OUTPUTS[output](packed)
@@ -0,0 +1,193 @@
+"""
+Lookup of color names by prefix, and suggestion of color names for misspelled input.
+
+"""
+
+# SPDX-License-Identifier: BSD-3-Clause
+
+import typing
+
+from ._caching import _cached
+from ._definitions import CSS3, names_tuple
+
+
+class _TrieNode(typing.NamedTuple):
+    """
+    Internal representation of a node of a prefix tree of color names.
+
+    ``completions`` holds, in alphabetical order, every name which begins with the
+    prefix leading to this node, so that completing a prefix needs no traversal below
+    the node it leads to.
+
+    """
+
+    children: typing.Dict[str, "_TrieNode"]
+    completions: typing.List[str]
+
+
+class _BKNode(typing.NamedTuple):
+    """
+    Internal representation of a node of a Burkhard-Keller tree of color names, whose
+    children are keyed by their edit distance from the node's name.
+
+    """
+
+    name: str
+    children: typing.Dict[int, "_BKNode"]
+
+
+class _NameIndex(typing.NamedTuple):
+    """
+    Internal index of the color names of a specification.
+
+    """
+
+    trie: _TrieNode
+    bk_tree: _BKNode
+
+
+_name_indexes: typing.Dict[typing.Tuple[str], _NameIndex] = {}
+
+
+def _edit_distance(first: str, second: str) -> int:
+    """
+    Return the Levenshtein edit distance between two strings: the number of
+    single-character insertions, deletions and substitutions needed to turn one into
+    the other.
+
+    """
+    if len(first) < len(second):
+        first, second = second, first
+    previous = list(range(len(second) + 1))
+    for i, first_char in enumerate(first, 1):
+        current = [i]
+        for j, second_char in enumerate(second, 1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (first_char != second_char),
+                )
+            )
+        previous = current
+    return previous[-1]
+
+
+def _get_name_index(spec: str) -> _NameIndex:
+    """
+    Return the name index for the given specification, building it on first use.
+
+    :raises ValueError: when the given spec is not supported.
+
+    """
+    return _cached(_name_indexes, _build_name_index, spec)
+
+
+def _build_name_index(spec: str) -> _NameIndex:
+    """
+    Build the name index for the given specification.
+
+    :raises ValueError: when the given spec is not supported.
+
+    """
+    spec_names = names_tuple(spec)
+    trie = _TrieNode({}, list(spec_names))
+    for name in spec_names:
+        node = trie
+        for char in name:
+            node = node.children.setdefault(char, _TrieNode({}, []))
+            node.completions.append(name)
+    bk_tree = _BKNode(spec_names[0], {})
+    for name in spec_names[1:]:
+        node = bk_tree
+        while True:
+            distance = _edit_distance(name, node.name)
+            if (child := node.children.get(distance)) is None:
+                node.children[distance] = _BKNode(name, {})
+                break
+            node = child
+    return _NameIndex(trie, bk_tree)
+
+
+def complete_names(
+    prefix: str, spec: str = CSS3, limit: typing.Optional[int] = None
+) -> typing.List[str]:
+    """
+    Return, in alphabetical order, the color names of the given specification which
+    begin with the given prefix.
+
+    The prefix will be normalized to lower-case before being looked up. Lookups use a
+    prefix tree built once per specification, so their cost depends on the length of
+    the prefix and the number of results, not on the number of color names.
+
+    Examples:
+
+    .. doctest::
+
+        >>> complete_names("lightg")
+        ['lightgoldenrodyellow', 'lightgray', 'lightgreen', 'lightgrey']
+        >>> complete_names("dark", limit=3)
+        ['darkblue', 'darkcyan', 'darkgoldenrod']
+        >>> complete_names("x")
+        []
+
+    :param prefix: The prefix to complete.
+    :param spec: The specification from which to draw the list of color names. Default
+       is :data:`CSS3`.
+    :param limit: If given, return at most this many names.
+    :raises ValueError: when the given spec is not supported.
+
+    """
+    node = _get_name_index(spec).trie
+    for char in prefix.lower():
+        if (node := node.children.get(char)) is None:
+            return []
+    return node.completions[:limit]
+
+
+def suggest_names(
+    name: str, max_distance: int = 2, spec: str = CSS3
+) -> typing.List[str]:
+    """
+    Return the color names of the given specification which are within the given
+    edit distance of a possibly-misspelled name, closest first.
+
+    The name will be normalized to lower-case before being looked up. Edit distance is
+    Levenshtein distance: the number of single-character insertions, deletions and
+    substitutions needed to turn one name into the other. Names at equal distances are
+    returned in alphabetical order. Lookups use a Burkhard-Keller tree built once per
+    specification, so only a fraction of the color names need to be compared.
+
+    Examples:
+
+    .. doctest::
+
+        >>> suggest_names("lightgoldenrodyelow")
+        ['lightgoldenrodyellow']
+        >>> suggest_names("drkblue")
+        ['darkblue']
+        >>> suggest_names("gren", max_distance=1)
+        ['green', 'grey']
+
+    :param name: The name to find suggestions for.
+    :param max_distance: The largest edit distance at which to suggest a name. Default
+       is 2.
+    :param spec: The specification from which to draw the list of color names. Default
+       is :data:`CSS3`.
+    :raises ValueError: when the given spec is not supported.
+
+    """
+    name = name.lower()
+    matches = []
+    pending = [_get_name_index(spec).bk_tree]
+    while pending:
+        node = pending.pop()
+        distance = _edit_distance(name, node.name)
+        if distance <= max_distance:
+            matches.append((distance, node.name))
+        pending.extend(
+            child
+            for child_distance, child in node.children.items()
+            if distance - max_distance <= child_distance <= distance + max_distance
+        )
+    return [match for _, match in sorted(matches)]
@@ -0,0 +1,675 @@
+"""
+Mapping of arbitrary colors onto the nearest named color of a specification.
+
+"""
+
+# SPDX-License-Identifier: BSD-3-Clause
+
+import collections
+import functools
+import heapq
+import math
+import operator
+import typing
+
+from ._caching import _cached
+from ._colorspaces import _rgb_to_lab
+from ._definitions import (
+    CSS3,
+    _get_hex_to_name_map,
+    _get_name_to_hex_map,
+    _get_name_to_packed_map,
+    names_tuple,
+)
+from ._normalization import _as_byte_view, normalize_integer_triplet
+from ._types import IntTuple, NameCount, NameDistance
+
+RGB = "rgb"
+LAB = "lab"
+
+_SUPPORTED_METRICS = (RGB, LAB)
+
+
+# The number of high bits of each channel which select the cell of a color in the coarse
+# RGB grid used to narrow nearest-color searches: 4 bits divide the RGB cube into 4096
+# cells of 16 values a side.
+_GRID_BITS = 4
+_GRID_SHIFT = 8 - _GRID_BITS
+
+
+class _Palette(typing.NamedTuple):
+    """
+    Internal representation of the named colors of a specification, prepared for
+    nearest-color searches.
+
+    """
+
+    names: typing.Tuple[str, ...]
+    colors: typing.Tuple[typing.Tuple[int, int, int, int], ...]
+    cells: typing.Tuple[typing.Tuple[typing.Tuple[int, int, int, int], ...], ...]
+
+
+def _grid_cell(red: int, green: int, blue: int) -> int:
+    """
+    Internal helper returning the position of the cell of the coarse RGB grid holding
+    the given color.
+
+    """
+    return (
+        (red >> _GRID_SHIFT) << 2 * _GRID_BITS
+        | (green >> _GRID_SHIFT) << _GRID_BITS
+        | blue >> _GRID_SHIFT
+    )
+
+
+def _grid_candidates(
+    colors: typing.Sequence[typing.Sequence[int]],
+) -> typing.List[typing.List[int]]:
+    """
+    Internal helper returning, for each cell of the coarse RGB grid in the order of
+    :func:`_grid_cell`, the positions among ``colors`` -- each a sequence starting
+    with its red, green and blue values -- of every color which may be the nearest
+    color to some color in the cell, in ascending order.
+
+    Every color in a cell is within the largest distance from the cell of any one
+    color, so only colors whose smallest distance from the cell is no greater than
+    the least such largest distance can be nearest to a color in it, or tie for
+    nearest.
+
+    """
+    size = 1 << _GRID_SHIFT
+    bounds = [(low, low + size - 1) for low in range(0, 256, size)]
+    # The squared smallest and largest distances of each channel value from each range
+    # of channel values covered by a cell.
+    near = [
+        [max(low - value, value - high, 0) ** 2 for value in range(256)]
+        for low, high in bounds
+    ]
+    far = [
+        [max(value - low, high - value) ** 2 for value in range(256)]
+        for low, high in bounds
+    ]
+    channels = [tuple(color[:3]) for color in colors]
+    cells = []
+    for near_red, far_red in zip(near, far):
+        for near_green, far_green in zip(near, far):
+            for near_blue, far_blue in zip(near, far):
+                bound = min(
+                    far_red[red] + far_green[green] + far_blue[blue]
+                    for red, green, blue in channels
+                )
+                cells.append(
+                    [
+                        position
+                        for position, (red, green, blue) in enumerate(channels)
+                        if near_red[red] + near_green[green] + near_blue[blue] <= bound
+                    ]
+                )
+    return cells
+
+
+_palettes: typing.Dict[typing.Tuple[str], _Palette] = {}
+
+
+def _get_palette(spec: str) -> _Palette:
+    """
+    Return the nearest-color palette for the given specification, building it on first
+    use.
+
+    :raises ValueError: when the given spec is not supported.
+
+    """
+    return _cached(_palettes, _build_palette, spec)
+
+
+def _build_palette(spec: str) -> _Palette:
+    """
+    Build the nearest-color palette for the given specification.
+
+    The palette's ``names`` are those returned by :func:`names` for the specification,
+    and its ``colors`` hold one ``(red, green, blue, index)`` entry per distinct color
+    value, where ``index`` is the position in ``names`` of the color's normalized name
+    (so that, for example, the ``"gray"`` spelling is always preferred over
+    ``"grey"``). Entries are ordered by name, so that ties in a nearest-color search
+    are resolved in favor of the alphabetically-first name. Its ``cells`` hold, for
+    each cell of the coarse RGB grid, the entries which may be nearest to a color in
+    the cell, as found by :func:`_grid_candidates`, in the same order.
+
+    :raises ValueError: when the given spec is not supported.
+
+    """
+    name_to_packed = _get_name_to_packed_map(spec)
+    spec_names = names_tuple(spec)
+    positions = {name: index for index, name in enumerate(spec_names)}
+    colors = []
+    for name in _get_hex_to_name_map(spec).values():
+        value = name_to_packed[name]
+        red, green, blue = value >> 16, value >> 8 & 0xFF, value & 0xFF
+        colors.append((red, green, blue, positions[name]))
+    colors.sort(key=lambda color: color[3])
+    return _Palette(
+        spec_names,
+        tuple(colors),
+        tuple(
+            tuple(colors[position] for position in candidates)
+            for candidates in _grid_candidates(colors)
+        ),
+    )
+
+
+def _nearest_index(palette: _Palette, red: int, green: int, blue: int) -> int:
+    """
+    Return the index, in ``palette.names``, of the named color nearest to the given
+    color by Euclidean distance in RGB space.
+
+    Only the named colors which may be nearest to a color in the color's cell of the
+    coarse RGB grid are compared, rather than the whole palette.
+
+    """
+    best_distance = 3 * 255 * 255 + 1
+    best_index = 0
+    for named_red, named_green, named_blue, index in palette.cells[
+        _grid_cell(red, green, blue)
+    ]:
+        distance = (
+            (red - named_red) ** 2
+            + (green - named_green) ** 2
+            + (blue - named_blue) ** 2
+        )
+        if distance < best_distance:
+            best_distance = distance
+            best_index = index
+    return best_index
+
+
+def _check_channels(channels: int) -> None:
+    """
+    Internal helper ensuring the given number of bytes per pixel is supported.
+
+    :raises ValueError: when ``channels`` is not 3 or 4.
+
+    """
+    if channels not in (3, 4):
+        raise ValueError(f"channels must be 3 (RGB) or 4 (RGBA), not {channels}.")
+
+
+def _name_indexes(
+    rgb_buffer, nearest: typing.Callable[[int, int, int], int], channels: int
+) -> bytearray:
+    """
+    Internal helper returning a flat :class:`bytearray` holding, for each pixel of the
+    given buffer, the index of the nearest named color as returned by ``nearest``.
+
+    :raises ValueError: when the buffer is not a contiguous buffer of bytes whose
+       length is a multiple of ``channels``, or when ``channels`` is not 3 or 4.
+
+    """
+    _check_channels(channels)
+    view = _as_byte_view(rgb_buffer, channels)
+    result = bytearray(len(view) // channels)
+    # Images rarely contain more than a small fraction of the possible colors, so
+    # remembering the answer for each distinct color seen avoids almost all of the
+    # palette searches.
+    known: typing.Dict[typing.Tuple[int, int, int], int] = {}
+    for position, pixel in enumerate(
+        zip(view[0::channels], view[1::channels], view[2::channels])
+    ):
+        if (index := known.get(pixel)) is None:
+            index = known[pixel] = nearest(*pixel)
+        result[position] = index
+    return result
+
+
+def _shape_indexes(indexes: bytearray, rgb_buffer, channels: int) -> memoryview:
+    """
+    Internal helper returning a :class:`memoryview` of the given per-pixel indexes,
+    shaped like the given buffer of pixels without its channel dimension, if it has
+    one.
+
+    """
+    shape = memoryview(rgb_buffer).shape
+    if len(shape) > 1 and shape[-1] == channels:
+        return memoryview(indexes).cast("B", shape[:-1])
+    return memoryview(indexes)
+
+
+def rgb_buffer_to_name_indexes(
+    rgb_buffer, spec: str = CSS3, channels: int = 3
+) -> memoryview:
+    """
+    Map every pixel of a buffer of packed 8-bit RGB or RGBA colors to the index, in
+    :func:`names` for the given specification, of the nearest named color.
+
+    The input may be any C-contiguous object supporting the buffer protocol whose
+    items are single bytes -- such as :class:`bytes`, a :class:`memoryview`, a NumPy
+    ``uint8`` array, or the raw data of a Pillow image in ``"RGB"`` or ``"RGBA"`` mode
+    -- and it is read in place, without being copied. Any alpha channel is ignored.
+
+    Distance between colors is Euclidean distance in RGB space. When two named colors
+    are equally near, the one whose name sorts first is chosen, and where a color value
+    has two names in CSS3, the index is that of the ``"gray"`` spelling.
+
+    The result is a :class:`memoryview` of unsigned bytes, with one index per pixel.
+    When the input is a multidimensional buffer whose last dimension holds the
+    channels of each pixel (for example, a NumPy array of shape ``(height, width,
+    3)``), the result has the same shape without that last dimension; otherwise it is
+    one-dimensional.
+
+    Examples:
+
+    .. doctest::
+
+        >>> indexes = rgb_buffer_to_name_indexes(bytes([255, 0, 0, 250, 250, 250]))
+        >>> [names()[index] for index in indexes]
+        ['red', 'snow']
+        >>> rgb_buffer_to_name_indexes(
+        ...     bytes([0, 0, 130, 255, 0, 0, 0, 0]), spec=HTML4, channels=4
+        ... ).tolist()
+        [8, 1]
+
+    :param rgb_buffer: The buffer of colors.
+    :param spec: The specification from which to draw the list of color names. Default
+       is :data:`CSS3`.
+    :param channels: The number of bytes per pixel: 3 for RGB, or 4 for RGBA. Default
+       is 3.
+    :raises ValueError: when the buffer is not a contiguous buffer of bytes whose
+       length is a multiple of ``channels``, when ``channels`` is not 3 or 4, or when
+       the given spec is not supported.
+
+    """
+    nearest = functools.partial(_nearest_index, _get_palette(spec))
+    return _shape_indexes(
+        _name_indexes(rgb_buffer, nearest, channels), rgb_buffer, channels
+    )
+
+
+class NameHistogram:
+    """
+    Streaming histogram of the named colors nearest to the pixels of one or more
+    buffers of packed 8-bit RGB or RGBA colors.
+
+    Pixels are fed in with :meth:`update`, one buffer at a time, so an image too large
+    to hold in memory can be counted chunk by chunk. Each pixel is counted against its
+    nearest named color, as chosen by :func:`rgb_buffer_to_name_indexes`. Chunks need
+    not end on a pixel boundary: the bytes of an incomplete pixel at the end of a chunk
+    are held over, and counted once the next chunk completes the pixel.
+
+    Histograms built in parallel -- for example, by separate worker processes, since
+    instances can be pickled -- can be combined with :meth:`merge`. A histogram is not
+    safe to update from several threads at once; give each thread its own histogram
+    and merge them when the threads finish.
+
+    .. attribute:: spec
+
+       The specification from which the color names are drawn.
+
+    Examples:
+
+    .. doctest::
+
+        >>> histogram = NameHistogram()
+        >>> histogram.update(bytes([255, 0, 0, 250, 0, 0]))
+        >>> histogram.update(bytes([0, 0, 128]))
+        >>> histogram.most_common()
+        [NameCount(name='red', hex='#ff0000', count=2),
+         NameCount(name='navy', hex='#000080', count=1)]
+
+    :param spec: The specification from which to draw the list of color names. Default
+       is :data:`CSS3`.
+    :raises ValueError: when the given spec is not supported.
+
+    """
+
+    def __init__(self, spec: str = CSS3):
+        self.spec = spec
+        self._counts = [0] * len(_get_palette(spec).names)
+        # The bytes of an incomplete pixel left over by the last update, and the number
+        # of channels of that update.
+        self._partial = b""
+        self._partial_channels = 3
+
+    @property
+    def total(self) -> int:
+        """
+        The total number of pixels counted, not including any incomplete pixel held
+        over from the last update.
+
+        """
+        return sum(self._counts)
+
+    @property
+    def pending(self) -> int:
+        """
+        The number of bytes of an incomplete pixel held over from the last update,
+        waiting to be completed by the next; 0 when every pixel fed in was counted.
+
+        """
+        return len(self._partial)
+
+    def update(self, rgb_buffer, channels: int = 3) -> None:
+        """
+        Count the pixels of a buffer of packed 8-bit RGB or RGBA colors, which is read
+        in place as described for :func:`rgb_buffer_to_name_indexes`, but may be of any
+        length. Bytes which do not make up a whole pixel -- together with any bytes
+        held over from the last update -- are held over until the next update.
+
+        :param rgb_buffer: The buffer of colors.
+        :param channels: The number of bytes per pixel: 3 for RGB, or 4 for RGBA.
+           Default is 3.
+        :raises ValueError: when the buffer is not a contiguous buffer of bytes, when
+           ``channels`` is not 3 or 4, or when an incomplete pixel is held over from
+           an update with a different number of channels.
+
+        """
+        _check_channels(channels)
+        view = _as_byte_view(rgb_buffer, 1)
+        if partial := self._partial:
+            if channels != self._partial_channels:
+                raise ValueError(
+                    f"channels must be {self._partial_channels} to complete the "
+                    f"pixel held over from the last update, not {channels}."
+                )
+            needed = channels - len(partial)
+            pixel = partial + bytes(view[:needed])
+            view = view[needed:]
+            if len(pixel) < channels:
+                self._partial = pixel
+                return
+            self._count(pixel, channels)
+        whole = len(view) - len(view) % channels
+        self._partial = bytes(view[whole:])
+        self._partial_channels = channels
+        self._count(view[:whole], channels)
+
+    def _count(self, rgb_buffer, channels: int) -> None:
+        """
+        Count the pixels of a buffer of whole pixels.
+
+        """
+        counts = self._counts
+        nearest = functools.partial(_nearest_index, _get_palette(self.spec))
+        indexes = _name_indexes(rgb_buffer, nearest, channels)
+        for index, count in collections.Counter(indexes).items():
+            counts[index] += count
+
+    def merge(self, other: "NameHistogram") -> None:
+        """
+        Add the counts of another histogram, built for the same specification, to
+        this one. Any incomplete pixel held over by this histogram is kept, to be
+        completed by its next update; the other histogram must hold none, since its
+        stream of pixels cannot be continued here.
+
+        :param other: The histogram to merge into this one.
+        :raises ValueError: when the other histogram is for a different specification,
+           or holds an incomplete pixel.
+
+        """
+        if other.spec != self.spec:
+            raise ValueError(
+                f"Cannot merge a {other.spec} histogram into a {self.spec} histogram."
+            )
+        if other.pending:
+            raise ValueError(
+                f"Cannot merge a histogram holding {other.pending} bytes of an "
+                "incomplete pixel."
+            )
+        self._counts = list(map(operator.add, self._counts, other._counts))
+
+    def most_common(self, n: typing.Optional[int] = None) -> typing.List[NameCount]:
+        """
+        Return the counted colors, from most to least common, as a :class:`list` of
+        :class:`NameCount`. Colors with equal counts are ordered by name, and colors
+        which were never counted -- including that of any incomplete pixel held over
+        from the last update -- are omitted.
+
+        :param n: If given, return at most this many colors.
+
+        """
+        spec_names = _get_palette(self.spec).names
+        name_to_hex = _get_name_to_hex_map(self.spec)
+        ranked = sorted(
+            (-count, spec_names[index])
+            for index, count in enumerate(self._counts)
+            if count
+        )
+        return [
+            NameCount(name, name_to_hex[name], -count) for count, name in ranked[:n]
+        ]
+
+
+# Distances between named colors, and nearest-name queries.
+# --------------------------------------------------------------------------------
+
+_coordinates = {RGB: lambda red, green, blue: (red, green, blue), LAB: _rgb_to_lab}
+
+_distance_matrices: typing.Dict[
+    typing.Tuple[str, str], typing.Tuple[typing.Tuple[float, ...], ...]
+] = {}
+
+_neighbor_indexes: typing.Dict[typing.Tuple[str, str], "_NeighborIndex"] = {}
+
+
+class _NeighborIndex(typing.NamedTuple):
+    """
+    Internal index answering nearest-name queries for one specification and metric.
+
+    ``points`` holds one ``(coordinates, name)`` entry per distinct color value, named
+    by its normalized name. ``neighbors`` maps the packed integer value of each named
+    color to every entry of ``points`` as a :class:`NameDistance`, sorted nearest
+    first, so that queries for a named color need no distance computations at all.
+
+    """
+
+    points: typing.Tuple[typing.Tuple[typing.Tuple[float, ...], str], ...]
+    neighbors: typing.Dict[int, typing.Tuple[NameDistance, ...]]
+
+
+def _check_metric(metric: str) -> None:
+    """
+    Internal helper ensuring the given distance metric is supported.
+
+    :raises ValueError: when the given metric is not supported.
+
+    """
+    if metric not in _SUPPORTED_METRICS:
+        raise ValueError(
+            f"{metric} is not a supported distance metric; supported metrics are: "
+            f"{_SUPPORTED_METRICS}."
+        )
+
+
+def distance_matrix(
+    spec: str = CSS3, metric: str = RGB
+) -> typing.Tuple[typing.Tuple[float, ...], ...]:
+    """
+    Return the matrix of distances between every pair of named colors of the given
+    specification.
+
+    Rows and columns are both in the order of :func:`names` for the specification, so
+    the distance between ``names(spec)[i]`` and ``names(spec)[j]`` is
+    ``distance_matrix(spec)[i][j]``. The matrix is computed once per specification
+    and metric, and the same immutable :class:`tuple` of rows is returned on every
+    subsequent call.
+
+    Two metrics are available: ``"rgb"``, the Euclidean distance between integer
+    ``rgb()`` triplets, and ``"lab"``, the Euclidean distance between CIE L*a*b*
+    coordinates (the CIE 1976 color difference, or "delta E"), which tracks perceived
+    difference more closely.
+
+    Examples:
+
+    .. doctest::
+
+        >>> distance_matrix(spec=HTML4)[0][1]
+        360.62445840513925
+        >>> names(spec=HTML4)[:2]
+        ['aqua', 'black']
+
+    :param spec: The specification from which to draw the list of color names. Default
+       is :data:`CSS3`.
+    :param metric: The distance metric: ``"rgb"`` or ``"lab"``. Default is ``"rgb"``.
+    :raises ValueError: when the given spec or metric is not supported.
+
+    """
+    _check_metric(metric)
+    return _cached(_distance_matrices, _build_distance_matrix, spec, metric)
+
+
+def _build_distance_matrix(
+    spec: str, metric: str
+) -> typing.Tuple[typing.Tuple[float, ...], ...]:
+    """
+    Build the matrix of distances between the named colors of the given specification,
+    using the given metric.
+
+    :raises ValueError: when the given spec is not supported.
+
+    """
+    name_to_packed = _get_name_to_packed_map(spec)
+    coordinates = _coordinates[metric]
+    points = []
+    for name in names_tuple(spec):
+        value = name_to_packed[name]
+        points.append(coordinates(value >> 16, value >> 8 & 0xFF, value & 0xFF))
+    return tuple(tuple(math.dist(point, other) for other in points) for point in points)
+
+
+def _get_neighbor_index(spec: str, metric: str) -> _NeighborIndex:
+    """
+    Return the nearest-name index for the given specification and metric, building it
+    on first use.
+
+    :raises ValueError: when the given spec or metric is not supported.
+
+    """
+    return _cached(_neighbor_indexes, _build_neighbor_index, spec, metric)
+
+
+def _build_neighbor_index(spec: str, metric: str) -> _NeighborIndex:
+    """
+    Build the nearest-name index for the given specification and metric.
+
+    :raises ValueError: when the given spec or metric is not supported.
+
+    """
+    matrix = distance_matrix(spec, metric)
+    palette = _get_palette(spec)
+    coordinates = _coordinates[metric]
+    points = tuple(
+        (coordinates(red, green, blue), palette.names[position])
+        for red, green, blue, position in palette.colors
+    )
+    neighbors = {}
+    for red, green, blue, position in palette.colors:
+        row = matrix[position]
+        neighbors[red << 16 | green << 8 | blue] = tuple(
+            NameDistance(name, distance)
+            for distance, name in sorted(
+                (row[other], palette.names[other]) for *_, other in palette.colors
+            )
+        )
+    return _NeighborIndex(points, neighbors)
+
+
+def _k_nearest(
+    index: _NeighborIndex, metric: str, rgb_triplet: IntTuple, k: int
+) -> typing.List[NameDistance]:
+    """
+    Internal helper answering a single nearest-name query against an index.
+
+    """
+    red, green, blue = normalize_integer_triplet(rgb_triplet)
+    if (neighbors := index.neighbors.get(red << 16 | green << 8 | blue)) is not None:
+        return list(neighbors[:k])
+    point = _coordinates[metric](red, green, blue)
+    return [
+        NameDistance(name, distance)
+        for distance, name in heapq.nsmallest(
+            k, ((math.dist(point, other), name) for other, name in index.points)
+        )
+    ]
+
+
+def k_nearest_names(
+    rgb_triplet: IntTuple, k: int = 1, spec: str = CSS3, metric: str = RGB
+) -> typing.List[NameDistance]:
+    """
+    Return the ``k`` named colors nearest to a color given as a 3-:class:`tuple` of
+    :class:`int`, suitable for use in an ``rgb()`` triplet, nearest first.
+
+    Each result is a :class:`NameDistance` holding a normalized color name and its
+    distance from the given color, measured using the given metric (see
+    :func:`distance_matrix`). Colors with two names in CSS3 are only returned once,
+    under their ``"gray"`` spelling, and colors at equal distances are ordered by name.
+
+    The search runs against an index built once per specification and metric; queries
+    for named colors are answered directly from the precomputed distances between
+    named colors, and other queries select the nearest names without sorting the whole
+    palette. To answer many queries at once, see :func:`k_nearest_names_batch`.
+
+    Examples:
+
+    .. doctest::
+
+        >>> k_nearest_names((0, 0, 130), k=2)
+        [NameDistance(name='navy', distance=2.0),
+         NameDistance(name='darkblue', distance=9.0)]
+        >>> k_nearest_names((255, 0, 0), k=2, metric="lab")
+        [NameDistance(name='red', distance=0.0),
+         NameDistance(name='orangered', distance=...)]
+
+    :param rgb_triplet: The ``rgb()`` triplet.
+    :param k: The number of names to return. Default is 1.
+    :param spec: The specification from which to draw the list of color names. Default
+       is :data:`CSS3`.
+    :param metric: The distance metric: ``"rgb"`` or ``"lab"``. Default is ``"rgb"``.
+    :raises ValueError: when the given spec or metric is not supported, or when ``k``
+       is less than 1.
+
+    """
+    if k < 1:
+        raise ValueError(f"k must be at least 1, not {k}.")
+    return _k_nearest(_get_neighbor_index(spec, metric), metric, rgb_triplet, k)
+
+
+def k_nearest_names_batch(
+    rgb_triplets: typing.Iterable[IntTuple],
+    k: int = 1,
+    spec: str = CSS3,
+    metric: str = RGB,
+) -> typing.List[typing.List[NameDistance]]:
+    """
+    Answer :func:`k_nearest_names` for each of an iterable of ``rgb()`` triplets,
+    returning a :class:`list` of results in the same order.
+
+    Repeated colors in the input are only searched for once.
+
+    Examples:
+
+    .. doctest::
+
+        >>> k_nearest_names_batch([(0, 0, 130), (0, 0, 130), (0, 0, 0)])
+        [[NameDistance(name='navy', distance=2.0)],
+         [NameDistance(name='navy', distance=2.0)],
+         [NameDistance(name='black', distance=0.0)]]
+
+    :param rgb_triplets: The ``rgb()`` triplets.
+    :param k: The number of names to return for each triplet. Default is 1.
+    :param spec: The specification from which to draw the list of color names. Default
+       is :data:`CSS3`.
+    :param metric: The distance metric: ``"rgb"`` or ``"lab"``. Default is ``"rgb"``.
+    :raises ValueError: when the given spec or metric is not supported, or when ``k``
+       is less than 1.
+
+    """
+    if k < 1:
+        raise ValueError(f"k must be at least 1, not {k}.")
+    index = _get_neighbor_index(spec, metric)
+    known: typing.Dict[typing.Tuple[int, ...], typing.List[NameDistance]] = {}
+    results = []
+    for rgb_triplet in rgb_triplets:
+        key = tuple(rgb_triplet)
+        if (result := known.get(key)) is None:
+            result = known[key] = _k_nearest(index, metric, rgb_triplet, k)
+        results.append(list(result))
+    return results
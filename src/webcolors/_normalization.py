@@ -126,3 +126,23 @@ def _percent_to_integer(percent: str) -> int:
 
     """
     return int(round(float(percent.split("%")[0]) / 100 * 255))
+
+
+def _as_byte_view(buffer, channels: int = 3) -> memoryview:
+    """
+    Internal helper for obtaining a flat, zero-copy :class:`memoryview` of unsigned
+    bytes over a buffer of packed color channels.
+
+    :raises ValueError: when the buffer is not C-contiguous, when its items are not
+       single bytes, or when its length is not a multiple of ``channels``.
+
+    """
+    view = memoryview(buffer)
+    if view.itemsize != 1 or not view.c_contiguous:
+        raise ValueError("Color buffers must be C-contiguous buffers of single bytes.")
+    view = view.cast("B")
+    if len(view) % channels:
+        raise ValueError(
+            f"Color buffer length {len(view)} is not a multiple of {channels}."
+        )
+    return view
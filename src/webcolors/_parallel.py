@@ -0,0 +1,225 @@
+"""
+Conversion of large batches of color values in parallel, by a pool of processes.
+
+"""
+
+# SPDX-License-Identifier: BSD-3-Clause
+
+import collections
+import concurrent.futures
+import itertools
+import multiprocessing
+import os
+import typing
+from array import array
+
+from ._batch import (
+    _LONG_HEX_LENGTH,
+    _PACKED_POSITIONS,
+    _convert_unique,
+    hex_records_to_rgb,
+)
+
+# The number of chunks waiting to be converted, or to be collected, per worker process,
+# bounding the memory held by chunks in flight.
+_CHUNKS_PER_WORKER = 2
+
+
+def _encode_chunk(hex_values: typing.List[str]) -> typing.Tuple[bytes, bytes]:
+    """
+    Internal helper encoding a chunk of hexadecimal color values for sending to a
+    worker process, as their concatenated text, encoded as UTF-8, and the length in
+    characters of each value, as native unsigned 32-bit integers.
+
+    When every value is seven ASCII characters long, as in the common ``#rrggbb``
+    form, the lengths are sent as an empty :class:`bytes`, and the text holds
+    fixed-width records.
+
+    """
+    data = "".join(hex_values).encode("utf-8", "surrogatepass")
+    lengths = array("I", map(len, hex_values))
+    fixed_width = lengths.count(_LONG_HEX_LENGTH) == len(hex_values)
+    # Values of seven characters encoded as seven bytes each are ASCII.
+    if fixed_width and len(data) == _LONG_HEX_LENGTH * len(hex_values):
+        return data, b""
+    return data, lengths.tobytes()
+
+
+def _decode_chunk(data: bytes, lengths: bytes) -> typing.List[str]:
+    """
+    Internal helper decoding a chunk of hexadecimal color values encoded by
+    :func:`_encode_chunk`.
+
+    """
+    text = data.decode("utf-8", "surrogatepass")
+    if not lengths:
+        return [
+            text[start : start + _LONG_HEX_LENGTH]
+            for start in range(0, len(text), _LONG_HEX_LENGTH)
+        ]
+    ends = list(itertools.accumulate(array("I", lengths)))
+    return [text[start:end] for start, end in zip([0] + ends, ends)]
+
+
+def _hex_chunk_to_rgb(data: bytes, lengths: bytes, packed: bool) -> bytes:
+    """
+    Internal helper, run in a worker process, converting a chunk of hexadecimal color
+    values encoded by :func:`_encode_chunk`, returning the packed 8-bit RGB colors, or
+    the packed integers of the colors in native byte order if ``packed`` is true.
+
+    Fixed-width records are decoded column by column, as by
+    :func:`hex_records_to_rgb`; other chunks, and chunks holding any invalid record,
+    are converted once per distinct value.
+
+    :raises ValueError: when any of the values is not a valid hexadecimal color value.
+
+    """
+    rgb = None
+    if not lengths:
+        decoded = hex_records_to_rgb(data)
+        if not decoded.invalid:
+            rgb = bytes(decoded.values)
+    if rgb is None:
+        # Any invalid value raises ValueError here, with the message normalize_hex()
+        # gives for it.
+        rgb = _convert_unique(
+            _decode_chunk(data, lengths), lambda value: value.to_bytes(3, "big")
+        )
+    if not packed:
+        return rgb
+    result = bytearray(4 * (len(rgb) // 3))
+    for channel, position in enumerate(_PACKED_POSITIONS):
+        result[position::4] = rgb[channel::3]
+    return bytes(result)
+
+
+def _convert_parallel(
+    hex_values: typing.Iterable[str],
+    packed: bool,
+    workers: typing.Optional[int],
+    chunk_size: int,
+    start_method: typing.Optional[str],
+) -> typing.Iterator[bytes]:
+    """
+    Internal helper converting hexadecimal color values in chunks by a pool of worker
+    processes, yielding the converted chunks in order.
+
+    :raises ValueError: when any of the values is not a valid hexadecimal color value,
+       when ``workers`` or ``chunk_size`` is less than 1, or when the start method is
+       not supported.
+
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1 or chunk_size < 1:
+        raise ValueError("workers and chunk_size must both be at least 1.")
+    context = multiprocessing.get_context(start_method)
+    values = iter(hex_values)
+    chunks = iter(lambda: list(itertools.islice(values, chunk_size)), [])
+    pending: typing.Deque[concurrent.futures.Future] = collections.deque()
+    executor = concurrent.futures.ProcessPoolExecutor(workers, mp_context=context)
+    try:
+        for chunk in chunks:
+            if len(pending) == _CHUNKS_PER_WORKER * workers:
+                yield pending.popleft().result()
+            pending.append(
+                executor.submit(_hex_chunk_to_rgb, *_encode_chunk(chunk), packed)
+            )
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def hex_to_rgb_parallel(
+    hex_values: typing.Iterable[str],
+    workers: typing.Optional[int] = None,
+    chunk_size: int = 65536,
+    start_method: typing.Optional[str] = None,
+) -> bytearray:
+    """
+    Convert each of an iterable of hexadecimal color values to an ``rgb()`` triplet,
+    in parallel by a pool of worker processes, returning a :class:`bytearray` of
+    packed 8-bit RGB colors, three bytes per value.
+
+    The values are read in chunks of ``chunk_size``, and each chunk is sent to a
+    worker as two flat buffers -- the concatenated text of its values, and the length
+    of each -- or as one buffer of fixed-width records when every value is in the
+    ``#rrggbb`` form; workers send back the converted chunk as packed bytes. Nothing
+    is sent between processes as a Python object per value, so the cost of
+    communicating with the workers is small next to that of converting. Workers
+    convert fixed-width records as :func:`hex_records_to_rgb` does, and other values
+    once per distinct value in a chunk, as :func:`hex_to_packed_array` does. At most
+    two chunks per worker are held in memory at once, so iterables of any length can
+    be converted.
+
+    Starting a pool of processes takes some time, particularly with the ``"spawn"``
+    start method, so this is worthwhile only for large batches -- millions of values
+    -- and should be called from code guarded by ``if __name__ == "__main__":`` when
+    using the ``"spawn"`` or ``"forkserver"`` start method, as :mod:`multiprocessing`
+    requires.
+
+    Examples:
+
+    .. code-block:: python
+
+        import webcolors
+
+        if __name__ == "__main__":
+            with open("colors.txt", encoding="ascii") as hex_file:
+                rgb = webcolors.hex_to_rgb_parallel(
+                    (line.strip() for line in hex_file), start_method="spawn"
+                )
+            webcolors.write_color_file("colors.wcc", rgb, layout="rgb")
+
+    :param hex_values: The hexadecimal color values to convert.
+    :param workers: The number of worker processes. By default, the number of CPUs.
+    :param chunk_size: The number of values sent to a worker at a time. Default is
+       65536.
+    :param start_method: The :mod:`multiprocessing` start method of the worker
+       processes, such as ``"spawn"``, ``"fork"`` or ``"forkserver"``. By default,
+       the platform's default start method.
+    :raises ValueError: when any of the values is not a valid hexadecimal color value,
+       when ``workers`` or ``chunk_size`` is less than 1, or when the start method is
+       not supported.
+
+    """
+    rgb = bytearray()
+    for chunk in _convert_parallel(
+        hex_values, False, workers, chunk_size, start_method
+    ):
+        rgb += chunk
+    return rgb
+
+
+def hex_to_packed_parallel(
+    hex_values: typing.Iterable[str],
+    workers: typing.Optional[int] = None,
+    chunk_size: int = 65536,
+    start_method: typing.Optional[str] = None,
+) -> array:
+    """
+    Convert each of an iterable of hexadecimal color values to a packed integer, of
+    the form ``red << 16 | green << 8 | blue``, in parallel by a pool of worker
+    processes, returning an :class:`array.array` of unsigned 32-bit integers
+    (typecode ``"I"``).
+
+    This works as described for :func:`hex_to_rgb_parallel`, and gives the same
+    results as :func:`hex_to_packed_array`.
+
+    :param hex_values: The hexadecimal color values to convert.
+    :param workers: The number of worker processes. By default, the number of CPUs.
+    :param chunk_size: The number of values sent to a worker at a time. Default is
+       65536.
+    :param start_method: The :mod:`multiprocessing` start method of the worker
+       processes, such as ``"spawn"``, ``"fork"`` or ``"forkserver"``. By default,
+       the platform's default start method.
+    :raises ValueError: when any of the values is not a valid hexadecimal color value,
+       when ``workers`` or ``chunk_size`` is less than 1, or when the start method is
+       not supported.
+
+    """
+    packed = array("I")
+    for chunk in _convert_parallel(hex_values, True, workers, chunk_size, start_method):
+        packed.frombytes(chunk)
+    return packed
@@ -0,0 +1,240 @@
+"""
+Lazy pipelines chaining conversions over streams of color values.
+
+"""
+
+# SPDX-License-Identifier: BSD-3-Clause
+
+import functools
+import typing
+
+from ._definitions import CSS3, _get_hex_to_name_map, _get_packed_to_name_map
+from ._html5 import html5_parse_legacy_color, html5_serialize_simple_color
+from ._normalization import normalize_hex
+from ._types import IntTuple
+
+# Marks a name lookup which raises ValueError for colors with no name, rather than
+# producing a default.
+_NO_DEFAULT = object()
+
+# A stage of a pipeline: its kind -- "parse_legacy", "to_hex" or "to_name" -- and, for
+# "to_name", the spec and default.
+_Stage = typing.Tuple[typing.Any, ...]
+
+
+def _hex_to_name(spec: str, default: typing.Any) -> typing.Callable[[str], typing.Any]:
+    """
+    Internal helper returning a function which converts a hexadecimal color value to
+    its color name, as :func:`hex_to_name` does, or to ``default`` if it has no name
+    and a default was given.
+
+    """
+    color_map = _get_hex_to_name_map(spec)
+
+    def to_name(hex_value: str) -> typing.Any:
+        """
+        Convert a hexadecimal color value to its color name, or to the default.
+
+        """
+        if name := color_map.get(normalize_hex(hex_value)):
+            return name
+        if default is _NO_DEFAULT:
+            raise ValueError(f'"{hex_value}" has no defined color name in {spec}.')
+        return default
+
+    return to_name
+
+
+def _simple_color_to_name(
+    spec: str, default: typing.Any
+) -> typing.Callable[[IntTuple], typing.Any]:
+    """
+    Internal helper returning a function which serializes a simple color and converts
+    the result to its color name, as the stages ``to_hex()`` and ``to_name()`` do in
+    turn, but which looks the color up by its integer value, without serializing it
+    unless it has no name and no default was given.
+
+    Only simple colors of three :class:`int` channels in the range 0-255 inclusive,
+    which serialize to valid hexadecimal color values, are looked up by their integer
+    value; any other value is serialized and looked up by the two stages in turn, so
+    it produces the same result, or raises the same exception, as they would.
+
+    """
+    color_map = _get_packed_to_name_map(spec)
+    unfused = _compose(html5_serialize_simple_color, _hex_to_name(spec, default))
+
+    def to_name(simple_color: IntTuple) -> typing.Any:
+        """
+        Convert a simple color to its color name, or to the default.
+
+        """
+        red, green, blue = simple_color
+        # Channels are all in the range 0-255 when no bit above the lowest eight is
+        # set in any of them, nor is any of them negative.
+        if (
+            type(red) is type(green) is type(blue) is int
+            and not (red | green | blue) >> 8
+        ):
+            if name := color_map.get(red << 16 | green << 8 | blue):
+                return name
+            if default is not _NO_DEFAULT:
+                return default
+        return unfused(simple_color)
+
+    return to_name
+
+
+def _compose(
+    first: typing.Callable[[typing.Any], typing.Any],
+    second: typing.Callable[[typing.Any], typing.Any],
+) -> typing.Callable[[typing.Any], typing.Any]:
+    """
+    Internal helper returning a function which applies ``first`` and then ``second``.
+
+    """
+    return lambda value: second(first(value))
+
+
+def _fuse(
+    stages: typing.Tuple[_Stage, ...],
+) -> typing.Callable[[typing.Any], typing.Any]:
+    """
+    Internal helper fusing the (one or more) stages of a pipeline into a single
+    function converting one value.
+
+    Where a stage serializing simple colors is followed by a name lookup, the two are
+    replaced by a single lookup of the simple color's integer value.
+
+    """
+    functions = []
+    position = 0
+    while position < len(stages):
+        kind, *options = stages[position]
+        if kind == "parse_legacy":
+            functions.append(html5_parse_legacy_color)
+        elif kind == "to_hex":
+            if position + 1 < len(stages) and stages[position + 1][0] == "to_name":
+                position += 1
+                functions.append(_simple_color_to_name(*stages[position][1:]))
+            else:
+                functions.append(html5_serialize_simple_color)
+        else:
+            functions.append(_hex_to_name(*options))
+        position += 1
+    return functools.reduce(_compose, functions)
+
+
+class ColorPipeline:
+    """
+    A lazy chain of conversions over an iterable of color values, as returned by
+    :func:`pipeline`.
+
+    Each conversion method returns a new pipeline, with the conversion added as its
+    last stage, and leaves the original unchanged. Nothing is converted until the
+    pipeline is iterated over, and then the stages are fused into a single function
+    applied to each value in turn, so no intermediate results are stored, and a
+    pipeline over a stream of any length runs in constant memory.
+
+    Iterating over a pipeline iterates over its source; a pipeline over a list can be
+    iterated over many times, but a pipeline over a generator only once.
+
+    Examples:
+
+    .. doctest::
+
+        >>> colors = pipeline(["black", "#DAA520", "chucknorris"])
+        >>> list(colors.parse_legacy().to_hex())
+        ['#000000', '#daa520', '#c00000']
+        >>> list(colors.parse_legacy().to_hex().to_name(default=None))
+        ['black', 'goldenrod', None]
+
+    """
+
+    def __init__(
+        self, source: typing.Iterable[typing.Any], stages: typing.Tuple[_Stage, ...]
+    ):
+        self._source = source
+        self._stages = stages
+
+    def __iter__(self) -> typing.Iterator[typing.Any]:
+        """
+        Return an iterator converting each value of the source in turn.
+
+        :raises ValueError: as each value is converted, when any stage raises
+           ValueError for it.
+
+        """
+        if not self._stages:
+            return iter(self._source)
+        return map(_fuse(self._stages), self._source)
+
+    def _then(self, *stage: typing.Any) -> "ColorPipeline":
+        """
+        Return a new pipeline with the given stage added to the end of this one.
+
+        """
+        return ColorPipeline(self._source, self._stages + (stage,))
+
+    def parse_legacy(self) -> "ColorPipeline":
+        """
+        Add a stage parsing each value as by :func:`html5_parse_legacy_color`,
+        producing simple colors.
+
+        """
+        return self._then("parse_legacy")
+
+    def to_hex(self) -> "ColorPipeline":
+        """
+        Add a stage serializing each simple color as by
+        :func:`html5_serialize_simple_color`, producing normalized hexadecimal color
+        values.
+
+        """
+        return self._then("to_hex")
+
+    def to_name(
+        self, spec: str = CSS3, default: typing.Any = _NO_DEFAULT
+    ) -> "ColorPipeline":
+        """
+        Add a stage converting each hexadecimal color value to its color name, as by
+        :func:`hex_to_name`.
+
+        :param spec: The specification from which to draw the list of color names.
+           Default is :data:`CSS3`.
+        :param default: The value to produce for colors with no name in the given
+           spec. If not given, such colors raise :exc:`ValueError` when they are
+           converted.
+        :raises ValueError: when the given spec is not supported.
+
+        """
+        _get_hex_to_name_map(spec)
+        return self._then("to_name", spec, default)
+
+
+def pipeline(source: typing.Iterable[typing.Any]) -> ColorPipeline:
+    """
+    Begin a lazy chain of conversions over an iterable of color values.
+
+    Chaining conversions with nested generator expressions, such as
+    ``(hex_to_name(value) for value in (html5_serialize_simple_color(color) for color
+    in ...))``, resumes a generator for every stage of every value. A pipeline instead
+    fuses its stages into a single function, which is applied to each value in one
+    loop, and skips steps whose results are never seen: when a name is looked up for a
+    serialized simple color, the color is looked up by its integer value, without
+    being serialized or normalized.
+
+    Examples:
+
+    .. doctest::
+
+        >>> names = pipeline(["navy", "#fff", "#123"]).parse_legacy().to_hex()
+        >>> list(names.to_name(default="unnamed"))
+        ['navy', 'white', 'unnamed']
+        >>> list(pipeline(["#000080", "#FFF"]).to_name())
+        ['navy', 'white']
+
+    :param source: The values to convert, which are read lazily, one at a time, as
+       the pipeline is iterated over.
+
+    """
+    return ColorPipeline(source, ())
@@ -0,0 +1,765 @@
+"""
+Lookup structures which many processes can share without copying them.
+
+"""
+
+# SPDX-License-Identifier: BSD-3-Clause
+
+import bisect
+import itertools
+import struct
+import sys
+import typing
+import zlib
+from array import array
+from multiprocessing import shared_memory
+
+from ._definitions import (
+    CSS3,
+    _get_hex_to_name_map,
+    _get_name_to_packed_map,
+    names_tuple,
+)
+from ._html5 import html5_parse_legacy_color
+from ._nearest import (
+    _GRID_BITS,
+    _grid_candidates,
+    _grid_cell,
+    _name_indexes,
+    _shape_indexes,
+)
+from ._normalization import normalize_integer_triplet
+from ._types import HTML5SimpleColor, IntTuple
+
+# The layout of a palette index, in the native byte order and item sizes of the
+# platform:
+#
+# * A header, laid out as described by _HEADER: the magic bytes b"WCPI", the layout
+#   version, the length in bytes of the name of the specification, the number of
+#   color names, the number of distinct color values, the length in bytes of the text
+#   section, and the number of entries of the candidates section.
+#
+# * The distinct color values, as packed 32-bit integers in ascending order.
+#
+# * For each cell of the coarse RGB grid which narrows nearest-color searches, in the
+#   order of _grid_cell(), the offset of the start of its candidates within the
+#   candidates section, followed by the offset of the end of the last cell's
+#   candidates, as 32-bit integers.
+#
+# * For each color name, the offset of its start within the text section, followed by
+#   the offset of the end of the last name, as 16-bit integers.
+#
+# * For each distinct color value, the index of its normalized name, as an 8-bit
+#   integer.
+#
+# * The candidates section: for each cell of the grid, the positions among the
+#   distinct color values of those which may be nearest to a color in the cell, as
+#   found by _grid_candidates(), as 8-bit integers.
+#
+# * The text section: the name of the specification, followed by the color names, in
+#   the order of names(spec), encoded as ASCII.
+#
+# Every section can be used in place as a memoryview, so attaching to an index involves
+# no parsing beyond reading the header.
+_HEADER = struct.Struct("=4sHHHHII")
+_MAGIC = b"WCPI"
+_VERSION = 2
+_CELLS = 1 << 3 * _GRID_BITS
+
+# Before Python 3.13, processes attaching to a shared memory block cannot opt out of
+# registering it with the resource tracker. Processes started by multiprocessing share
+# the resource tracker of their parent, so this is harmless for them; the docstring of
+# _SharedBuffer.attach() explains how other processes can avoid it.
+_ATTACH_OPTIONS = {"track": False} if sys.version_info >= (3, 13) else {}
+
+
+def build_palette_index(spec: str = CSS3) -> bytes:
+    """
+    Build the palette index of the given specification, as :class:`bytes` which can
+    be loaded by :class:`SharedPaletteIndex`.
+
+    Use this to publish an index through a file rather than through shared memory:
+    write the result to a file once, and have each process open the file and
+    :mod:`mmap` it, passing the memory map to :class:`SharedPaletteIndex`. Indexes
+    use the native byte order of the platform, so a file can only be shared between
+    processes on machines of the same architecture.
+
+    Examples:
+
+    .. doctest::
+
+        >>> index = SharedPaletteIndex(build_palette_index(HTML4))
+        >>> index.nearest_name((0, 0, 130))
+        'navy'
+
+    :param spec: The specification from which to draw the list of color names. Default
+       is :data:`CSS3`.
+    :raises ValueError: when the given spec is not supported.
+
+    """
+    spec_names = names_tuple(spec)
+    positions = {name: index for index, name in enumerate(spec_names)}
+    name_to_packed = _get_name_to_packed_map(spec)
+    colors = sorted(
+        (name_to_packed[name], positions[name])
+        for name in _get_hex_to_name_map(spec).values()
+    )
+    text = spec.encode("ascii")
+    offsets = array("H")
+    for name in spec_names:
+        offsets.append(len(text))
+        text += name.encode("ascii")
+    offsets.append(len(text))
+    cells = _grid_candidates(
+        [(value >> 16, value >> 8 & 0xFF, value & 0xFF) for value, _ in colors]
+    )
+    cell_offsets = array("I", itertools.accumulate(map(len, cells), initial=0))
+    return b"".join(
+        (
+            _HEADER.pack(
+                _MAGIC,
+                _VERSION,
+                len(spec),
+                len(spec_names),
+                len(colors),
+                len(text),
+                cell_offsets[-1],
+            ),
+            array("I", [value for value, _ in colors]).tobytes(),
+            cell_offsets.tobytes(),
+            offsets.tobytes(),
+            bytes(position for _, position in colors),
+            bytes(itertools.chain.from_iterable(cells)),
+            text,
+        )
+    )
+
+
+def _read_header(view: memoryview) -> typing.Tuple[int, int, int, int, int]:
+    """
+    Internal helper returning the lengths of the sections of the palette index held
+    in the given buffer: the length of the name of its specification, the number of
+    color names, the number of distinct color values, the length of its text section,
+    and the number of entries of its candidates section.
+
+    :raises ValueError: when the buffer does not hold a palette index.
+
+    """
+    if len(view) < _HEADER.size:
+        raise ValueError("Buffer is too short to hold a palette index.")
+    magic, version, *lengths = _HEADER.unpack_from(view)
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError(f"Buffer does not hold a version {_VERSION} palette index.")
+    spec_length, name_count, color_count, text_length, candidate_count = lengths
+    size = (
+        _HEADER.size
+        + 4 * color_count
+        + 4 * (_CELLS + 1)
+        + 2 * (name_count + 1)
+        + color_count
+        + candidate_count
+        + text_length
+    )
+    if len(view) < size:
+        raise ValueError("Buffer is too short to hold its palette index.")
+    return spec_length, name_count, color_count, text_length, candidate_count
+
+
+_SharedBufferT = typing.TypeVar("_SharedBufferT", bound="_SharedBuffer")
+
+
+class _SharedBuffer:
+    """
+    Base class of structures which read from a buffer that may be held in a shared
+    memory block, handling the lifecycle of the block.
+
+    Subclasses take the buffer as the only argument of their constructor, and set
+    :attr:`_view` to a :class:`memoryview` of it; they release any other views they
+    take of it in :meth:`_release`.
+
+    """
+
+    _shared_memory: typing.Optional[shared_memory.SharedMemory] = None
+    _view: memoryview
+
+    @classmethod
+    def attach(cls: typing.Type[_SharedBufferT], name: str) -> _SharedBufferT:
+        """
+        Return an instance reading from the existing shared memory block with the
+        given name, as created by :meth:`create`.
+
+        Before Python 3.13, attaching to a shared memory block registers it with the
+        :mod:`multiprocessing` resource tracker of the attaching process, which cannot
+        be avoided. Processes started by :mod:`multiprocessing` share the resource
+        tracker of their parent, so this is harmless for them. But in any other
+        process -- such as one started separately, or by :mod:`subprocess` -- the
+        resource tracker warns of a leaked block when the process exits, and destroys
+        the block, though the process does not own it. On POSIX systems, such a
+        process can prevent this by unregistering the block after attaching to it:
+
+        .. code-block:: python
+
+            from multiprocessing import resource_tracker
+
+            shared = SharedPaletteIndex.attach(name)
+            resource_tracker.unregister(f"/{shared.name}", "shared_memory")
+
+        Alternatively, share the structure through a memory-mapped file holding the
+        output of :func:`build_palette_index` or :func:`build_legacy_color_cache`
+        rather than through shared memory, or use Python 3.13 or later, where
+        attaching does not register the block.
+
+        :param name: The name of the shared memory block.
+        :raises FileNotFoundError: when no shared memory block has the given name.
+        :raises ValueError: when the shared memory block does not hold a structure of
+           this type.
+
+        """
+        return cls._from_shared_memory(
+            shared_memory.SharedMemory(name, **_ATTACH_OPTIONS)
+        )
+
+    @classmethod
+    def _from_shared_memory(
+        cls: typing.Type[_SharedBufferT], block: shared_memory.SharedMemory
+    ) -> _SharedBufferT:
+        """
+        Return an instance reading from the given shared memory block, which it takes
+        ownership of.
+
+        """
+        try:
+            instance = cls(block.buf)
+        except ValueError:
+            block.close()
+            raise
+        instance._shared_memory = block
+        return instance
+
+    @classmethod
+    def _create_shared_memory(
+        cls: typing.Type[_SharedBufferT], data, name: typing.Optional[str]
+    ) -> _SharedBufferT:
+        """
+        Return an instance reading from a new shared memory block holding a copy of
+        the given data.
+
+        """
+        block = shared_memory.SharedMemory(name, create=True, size=len(data))
+        block.buf[: len(data)] = data
+        return cls._from_shared_memory(block)
+
+    @property
+    def name(self) -> typing.Optional[str]:
+        """
+        The name of the shared memory block holding the structure, or :data:`None` if
+        it was loaded from some other buffer.
+
+        """
+        return None if self._shared_memory is None else self._shared_memory.name
+
+    def __reduce__(self):
+        """
+        Pickle the structure by the name of its shared memory block, so that
+        unpickling attaches to the same block; a structure loaded from some other
+        buffer is pickled by value.
+
+        """
+        if self._shared_memory is None:
+            return (type(self), (bytearray(self._view),))
+        return (type(self).attach, (self._shared_memory.name,))
+
+    def __enter__(self: _SharedBufferT) -> _SharedBufferT:
+        """
+        Return the structure, for use as a context manager which closes it on exit.
+
+        """
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """
+        Close the structure.
+
+        """
+        self.close()
+
+    def _release(self) -> None:
+        """
+        Release the views of the buffer taken by the subclass.
+
+        """
+
+    def close(self) -> None:
+        """
+        Stop reading from the buffer, and detach from its shared memory block, if
+        any. The structure cannot be used afterward.
+
+        """
+        self._release()
+        self._view.release()
+        if self._shared_memory is not None:
+            self._shared_memory.close()
+
+    def unlink(self) -> None:
+        """
+        Destroy the shared memory block, once every process has closed it. Only the
+        process which created the block should call this.
+
+        :raises ValueError: when the structure was not loaded from shared memory.
+
+        """
+        if self._shared_memory is None:
+            raise ValueError(f"The {type(self).__name__} is not held in shared memory.")
+        self._shared_memory.unlink()
+
+
+class SharedPaletteIndex(_SharedBuffer):
+    """
+    Read-only index of the named colors of a specification, answering exact and
+    nearest-name lookups directly from a buffer which many processes can share.
+
+    The index is built once, with :meth:`create`, into a
+    :class:`~multiprocessing.shared_memory.SharedMemory` block. Other processes then
+    :meth:`attach` to the block by its :attr:`name`; attaching maps the block into
+    memory and reads its header, without copying or parsing the index, so memory use
+    does not grow with the number of attached processes. Instances can also be
+    pickled, for example as an argument to a :mod:`multiprocessing` worker, in which
+    case the worker attaches to the same block.
+
+    An index can also be loaded from any other object supporting the buffer protocol
+    which holds the output of :func:`build_palette_index` -- such as a memory-mapped
+    file -- by passing it to the constructor.
+
+    Lookups behave like the equivalent module-level functions: :meth:`rgb_to_name`
+    like :func:`rgb_to_name`, and :meth:`nearest_name` and
+    :meth:`rgb_buffer_to_name_indexes` like :func:`rgb_buffer_to_name_indexes`.
+
+    .. attribute:: spec
+
+       The specification from which the color names are drawn.
+
+    Examples:
+
+    .. doctest::
+
+        >>> index = SharedPaletteIndex.create(HTML4)
+        >>> attached = SharedPaletteIndex.attach(index.name)
+        >>> attached.rgb_to_name((0, 0, 128))
+        'navy'
+        >>> attached.nearest_name((250, 10, 5))
+        'red'
+        >>> attached.close()
+        >>> index.close()
+        >>> index.unlink()
+
+    :param buffer: A buffer holding a palette index.
+    :raises ValueError: when the buffer does not hold a palette index.
+
+    """
+
+    def __init__(self, buffer):
+        view = memoryview(buffer).cast("B")
+        try:
+            (
+                spec_length,
+                name_count,
+                color_count,
+                text_length,
+                candidate_count,
+            ) = _read_header(view)
+        except ValueError:
+            # Release the view at once, so that the buffer it was taken from can be
+            # closed.
+            view.release()
+            raise
+        cell_offsets_start = _HEADER.size + 4 * color_count
+        offsets_start = cell_offsets_start + 4 * (_CELLS + 1)
+        color_names_start = offsets_start + 2 * (name_count + 1)
+        candidates_start = color_names_start + color_count
+        text_start = candidates_start + candidate_count
+        self._view = view
+        self._colors = view[_HEADER.size : cell_offsets_start].cast("I")
+        self._cell_offsets = view[cell_offsets_start:offsets_start].cast("I")
+        self._offsets = view[offsets_start:color_names_start].cast("H")
+        self._color_names = view[color_names_start:candidates_start]
+        self._candidates = view[candidates_start:text_start]
+        self._text = view[text_start : text_start + text_length]
+        self.spec = str(self._text[:spec_length], "ascii")
+
+    @classmethod
+    def create(
+        cls, spec: str = CSS3, name: typing.Optional[str] = None
+    ) -> "SharedPaletteIndex":
+        """
+        Build the palette index of the given specification into a new shared memory
+        block, and return an index reading from it.
+
+        The process which creates the block is responsible for destroying it, by
+        calling :meth:`unlink` once no process needs it any more.
+
+        :param spec: The specification from which to draw the list of color names.
+           Default is :data:`CSS3`.
+        :param name: The name of the shared memory block to create. By default, a
+           unique name is generated.
+        :raises ValueError: when the given spec is not supported.
+        :raises FileExistsError: when a shared memory block with the given name
+           already exists.
+
+        """
+        return cls._create_shared_memory(build_palette_index(spec), name)
+
+    def _release(self) -> None:
+        """
+        Release the views of the index's sections.
+
+        """
+        for view in (
+            self._colors,
+            self._cell_offsets,
+            self._offsets,
+            self._color_names,
+            self._candidates,
+            self._text,
+        ):
+            view.release()
+
+    def index_to_name(self, index: int) -> str:
+        """
+        Return the color name at the given position in :func:`names` for the index's
+        specification.
+
+        :param index: The position of the name.
+        :raises IndexError: when the position is out of range.
+
+        """
+        if not 0 <= index < len(self._offsets) - 1:
+            raise IndexError(f"Color name index {index} is out of range.")
+        return str(self._text[self._offsets[index] : self._offsets[index + 1]], "ascii")
+
+    def rgb_to_name(self, rgb_triplet: IntTuple) -> str:
+        """
+        Convert a 3-:class:`tuple` of :class:`int`, suitable for use in an ``rgb()``
+        color triplet, to its corresponding normalized color name, if any such name
+        exists.
+
+        :param rgb_triplet: The ``rgb()`` triplet.
+        :raises ValueError: when the given color has no name in the index's
+           specification.
+
+        """
+        red, green, blue = normalize_integer_triplet(rgb_triplet)
+        value = red << 16 | green << 8 | blue
+        position = bisect.bisect_left(self._colors, value)
+        if position < len(self._colors) and self._colors[position] == value:
+            return self.index_to_name(self._color_names[position])
+        raise ValueError(f'"#{value:06x}" has no defined color name in {self.spec}.')
+
+    def nearest_name(self, rgb_triplet: IntTuple) -> str:
+        """
+        Return the named color nearest to a 3-:class:`tuple` of :class:`int`, suitable
+        for use in an ``rgb()`` triplet.
+
+        :param rgb_triplet: The ``rgb()`` triplet.
+
+        """
+        return self.index_to_name(
+            self._nearest_index(*normalize_integer_triplet(rgb_triplet))
+        )
+
+    def rgb_buffer_to_name_indexes(self, rgb_buffer, channels: int = 3) -> memoryview:
+        """
+        Map every pixel of a buffer of packed 8-bit RGB or RGBA colors to the index, in
+        :func:`names` for the index's specification, of the nearest named color, as
+        described for :func:`rgb_buffer_to_name_indexes`.
+
+        :param rgb_buffer: The buffer of colors.
+        :param channels: The number of bytes per pixel: 3 for RGB, or 4 for RGBA.
+           Default is 3.
+        :raises ValueError: when the buffer is not a contiguous buffer of bytes whose
+           length is a multiple of ``channels``, or when ``channels`` is not 3 or 4.
+
+        """
+        return _shape_indexes(
+            _name_indexes(rgb_buffer, self._nearest_index, channels),
+            rgb_buffer,
+            channels,
+        )
+
+    def _nearest_index(self, red: int, green: int, blue: int) -> int:
+        """
+        Return the index of the named color nearest to the given color by Euclidean
+        distance in RGB space, preferring the alphabetically-first name on ties.
+
+        Only the colors listed as candidates for the color's cell of the coarse RGB
+        grid are compared, rather than the whole palette.
+
+        """
+        best_distance = 3 * 255 * 255 + 1
+        best_index = 0
+        cell = _grid_cell(red, green, blue)
+        colors = self._colors
+        color_names = self._color_names
+        for position in self._candidates[
+            self._cell_offsets[cell] : self._cell_offsets[cell + 1]
+        ]:
+            value = colors[position]
+            index = color_names[position]
+            distance = (
+                (red - (value >> 16)) ** 2
+                + (green - (value >> 8 & 0xFF)) ** 2
+                + (blue - (value & 0xFF)) ** 2
+            )
+            if distance < best_distance or (
+                distance == best_distance and index < best_index
+            ):
+                best_distance = distance
+                best_index = index
+        return best_index
+
+
+# The layout of a legacy color cache, in the native byte order of the platform:
+#
+# * A header, laid out as described by _CACHE_HEADER: the magic bytes b"WCLC", the
+#   layout version, the maximum length in bytes of a cached value, and the number of
+#   buckets.
+#
+# * The buckets, each of _CACHE_WAYS slots. Each slot holds an entry header, laid out
+#   as described by _CACHE_ENTRY -- a checksum of the rest of the entry, the parsed
+#   color, and the length of the value -- followed by space for a value of the maximum
+#   length, encoded as UTF-8. Slots holding no entry are all zeroes.
+#
+# Entries are written without locking, so a process may read an entry while another
+# is overwriting it. Readers only accept entries whose checksum matches, so a torn
+# read is treated as a cache miss rather than returning a wrong result.
+_CACHE_HEADER = struct.Struct("=4sHHI")
+_CACHE_ENTRY = struct.Struct("=I3sxH")
+_CACHE_MAGIC = b"WCLC"
+_CACHE_VERSION = 1
+_CACHE_WAYS = 4
+
+
+def build_legacy_color_cache(entries: int = 16384, max_length: int = 54) -> bytearray:
+    """
+    Build an empty legacy color cache, as a :class:`bytearray` which can be loaded by
+    :class:`SharedLegacyColorCache`.
+
+    Use this to share a cache through a file rather than through shared memory: write
+    the result to a file once, and have each process open the file and :mod:`mmap` it
+    for writing, passing the memory map to :class:`SharedLegacyColorCache`.
+
+    Examples:
+
+    .. doctest::
+
+        >>> len(build_legacy_color_cache(entries=1024, max_length=54))
+        65548
+
+    :param entries: The number of entries the cache can hold, which is rounded up to
+       a multiple of 4. Default is 16384.
+    :param max_length: The maximum length, in bytes of UTF-8, of a value which can be
+       cached. Longer values are parsed, but not cached. Default is 54, which makes
+       each entry 64 bytes long.
+    :raises ValueError: when the number of entries or the maximum length is not
+       positive, or is too large.
+
+    """
+    if not 0 < entries <= 0xFFFFFFFF or not 0 < max_length <= 0xFFFF:
+        raise ValueError(
+            "The number of entries and the maximum length of a legacy color cache "
+            "must be positive, and no more than 2**32 - 1 and 2**16 - 1 respectively."
+        )
+    buckets = -(-entries // _CACHE_WAYS)
+    cache = bytearray(
+        _CACHE_HEADER.size + buckets * _CACHE_WAYS * (_CACHE_ENTRY.size + max_length)
+    )
+    _CACHE_HEADER.pack_into(cache, 0, _CACHE_MAGIC, _CACHE_VERSION, max_length, buckets)
+    return cache
+
+
+class SharedLegacyColorCache(_SharedBuffer):
+    """
+    Cache of the results of :func:`html5_parse_legacy_color`, held in a buffer which
+    many processes can read and update at once.
+
+    The cache is created once, with :meth:`create`, in a
+    :class:`~multiprocessing.shared_memory.SharedMemory` block, and other processes
+    :meth:`attach` to it by its :attr:`name`, or receive it pickled, as for
+    :class:`SharedPaletteIndex`. Each value parsed by any of the processes is then
+    cached for all of them. A cache can also be loaded from any other writable object
+    supporting the buffer protocol which holds the output of
+    :func:`build_legacy_color_cache`, such as a file memory-mapped for writing.
+
+    The cache is a fixed-size hash table, so its memory use is bounded. Each value
+    hashes to a bucket of four entries, and when the bucket is full, its entries are
+    evicted in turn. No locks are taken: a checksum guards each entry against being
+    read while another process is writing it, in which case the value is parsed
+    again.
+
+    Values which are rejected by the parsing algorithm are not cached, nor are values
+    longer than the cache's maximum length; the exceptions they raise propagate as
+    from :func:`html5_parse_legacy_color`.
+
+    .. attribute:: max_length
+
+       The maximum length, in bytes of UTF-8, of a value which can be cached.
+
+    Examples:
+
+    .. doctest::
+
+        >>> cache = SharedLegacyColorCache.create(entries=1024)
+        >>> cache.html5_parse_legacy_color("chucknorris")
+        HTML5SimpleColor(red=192, green=0, blue=0)
+        >>> attached = SharedLegacyColorCache.attach(cache.name)
+        >>> attached.lookup("chucknorris")
+        HTML5SimpleColor(red=192, green=0, blue=0)
+        >>> attached.close()
+        >>> cache.close()
+        >>> cache.unlink()
+
+    :param buffer: A writable buffer holding a legacy color cache.
+    :raises ValueError: when the buffer is not writable, or does not hold a legacy
+       color cache.
+
+    """
+
+    def __init__(self, buffer):
+        view = memoryview(buffer).cast("B")
+        try:
+            if view.readonly:
+                raise ValueError(
+                    "Legacy color caches must be held in writable buffers."
+                )
+            if len(view) < _CACHE_HEADER.size:
+                raise ValueError("Buffer is too short to hold a legacy color cache.")
+            magic, version, max_length, buckets = _CACHE_HEADER.unpack_from(view)
+            if magic != _CACHE_MAGIC or version != _CACHE_VERSION:
+                raise ValueError(
+                    f"Buffer does not hold a version {_CACHE_VERSION} legacy color "
+                    f"cache."
+                )
+            slot_size = _CACHE_ENTRY.size + max_length
+            if len(view) < _CACHE_HEADER.size + buckets * _CACHE_WAYS * slot_size:
+                raise ValueError("Buffer is too short to hold its legacy color cache.")
+        except ValueError:
+            # Release the view at once, so that the buffer it was taken from can be
+            # closed.
+            view.release()
+            raise
+        self._view = view
+        self.max_length = max_length
+        self._buckets = buckets
+        self._slot_size = slot_size
+        self._next_victim = 0
+
+    @classmethod
+    def create(
+        cls,
+        entries: int = 16384,
+        max_length: int = 54,
+        name: typing.Optional[str] = None,
+    ) -> "SharedLegacyColorCache":
+        """
+        Create an empty cache in a new shared memory block, and return a cache
+        reading from it.
+
+        The process which creates the block is responsible for destroying it, by
+        calling :meth:`unlink` once no process needs it any more.
+
+        :param entries: The number of entries the cache can hold, as for
+           :func:`build_legacy_color_cache`. Default is 16384.
+        :param max_length: The maximum length of a cached value, as for
+           :func:`build_legacy_color_cache`. Default is 54.
+        :param name: The name of the shared memory block to create. By default, a
+           unique name is generated.
+        :raises ValueError: when the number of entries or the maximum length is not
+           positive, or is too large.
+        :raises FileExistsError: when a shared memory block with the given name
+           already exists.
+
+        """
+        return cls._create_shared_memory(
+            build_legacy_color_cache(entries, max_length), name
+        )
+
+    def _slots(self, key: bytes) -> range:
+        """
+        Return the offsets of the slots of the bucket to which the given key hashes.
+
+        """
+        start = (
+            _CACHE_HEADER.size
+            + zlib.crc32(key) % self._buckets * _CACHE_WAYS * self._slot_size
+        )
+        return range(start, start + _CACHE_WAYS * self._slot_size, self._slot_size)
+
+    def lookup(self, value: str) -> typing.Optional[HTML5SimpleColor]:
+        """
+        Return the cached result of parsing the given value, or :data:`None` if it is
+        not cached.
+
+        :param value: The value to look up.
+
+        """
+        key = value.encode("utf-8", "surrogatepass")
+        if len(key) > self.max_length:
+            return None
+        slots = self._slots(key)
+        view = self._view
+        for offset in slots:
+            checksum, rgb, length = _CACHE_ENTRY.unpack_from(view, offset)
+            if length == len(key):
+                start = offset + _CACHE_ENTRY.size
+                if view[start : start + length] == key and checksum == zlib.crc32(
+                    key, zlib.crc32(rgb)
+                ):
+                    return HTML5SimpleColor(*rgb)
+        return None
+
+    def store(self, value: str, color: IntTuple) -> None:
+        """
+        Cache the given color as the result of parsing the given value, evicting
+        another entry if the value's bucket is full. Values longer than the cache's
+        maximum length are not cached.
+
+        :param value: The parsed value.
+        :param color: The result of parsing the value.
+
+        """
+        key = value.encode("utf-8", "surrogatepass")
+        if len(key) > self.max_length:
+            return
+        slots = self._slots(key)
+        view = self._view
+        target = None
+        for offset in slots:
+            *_, length = _CACHE_ENTRY.unpack_from(view, offset)
+            start = offset + _CACHE_ENTRY.size
+            if length == 0 or (
+                length == len(key) and view[start : start + length] == key
+            ):
+                target = offset
+                break
+        if target is None:
+            target = slots[self._next_victim]
+            self._next_victim = (self._next_victim + 1) % _CACHE_WAYS
+        rgb = bytes(color)
+        entry = _CACHE_ENTRY.pack(zlib.crc32(key, zlib.crc32(rgb)), rgb, len(key)) + key
+        view[target : target + len(entry)] = entry
+
+    def html5_parse_legacy_color(self, value: str) -> HTML5SimpleColor:
+        """
+        Apply the HTML5 legacy color parsing algorithm, as for
+        :func:`html5_parse_legacy_color`, returning the cached result if there is one,
+        and caching the result otherwise.
+
+        :param value: The color to parse.
+        :raises ValueError: when the given value is not a Unicode string, when it is
+           the empty string, or when it is precisely the string ``"transparent"``.
+
+        """
+        if isinstance(value, str) and (cached := self.lookup(value)) is not None:
+            return cached
+        result = html5_parse_legacy_color(value)
+        self.store(value, result)
+        return result
@@ -0,0 +1,179 @@
+"""
+Snapping of colors to the web-safe palette, and to other evenly spaced grids of
+colors.
+
+"""
+
+# SPDX-License-Identifier: BSD-3-Clause
+
+import bisect
+import typing
+
+from ._caching import _cached
+from ._normalization import _as_byte_view, normalize_hex, normalize_integer_triplet
+from ._types import IntegerRGB, IntTuple
+
+# The number of levels per channel of the web-safe palette: 0, 51, 102, 153, 204 and
+# 255, giving 216 colors.
+_WEB_SAFE_LEVELS = 6
+
+_snap_tables: typing.Dict[typing.Tuple[int], bytes] = {}
+
+
+def _get_snap_table(levels: int) -> bytes:
+    """
+    Return the snap table for the given number of levels, building it on first use.
+
+    :raises ValueError: when the number of levels is not between 2 and 256 inclusive.
+
+    """
+    return _cached(_snap_tables, _build_snap_table, levels)
+
+
+def _build_snap_table(levels: int) -> bytes:
+    """
+    Build the snap table for the given number of levels: a table, suitable for use
+    with :meth:`bytes.translate`, mapping each channel value to the nearest of the
+    levels, with ties going to the lower level.
+
+    :raises ValueError: when the number of levels is not between 2 and 256 inclusive.
+
+    """
+    if not 2 <= levels <= 256:
+        raise ValueError(
+            f"{levels} is not a supported number of levels; levels must be between 2 "
+            f"and 256."
+        )
+    # The levels are evenly spaced from 0 to 255, rounded to the nearest integer.
+    values = [(510 * level + levels - 1) // (2 * levels - 2) for level in range(levels)]
+    table = bytearray(256)
+    for value in range(256):
+        upper = bisect.bisect_left(values, value)
+        if upper and value - values[upper - 1] <= values[upper] - value:
+            upper -= 1
+        table[value] = values[upper]
+    return bytes(table)
+
+
+def snap_rgb(rgb_triplet: IntTuple, levels: int = _WEB_SAFE_LEVELS) -> IntegerRGB:
+    """
+    Snap a 3-:class:`tuple` of :class:`int`, suitable for use in an ``rgb()`` triplet,
+    to the nearest color of a grid with the given number of evenly spaced levels per
+    channel, from 0 to 255.
+
+    The default of 6 levels per channel snaps to the 216 colors of the web-safe
+    palette. Fewer levels give coarser grids, which are useful, for example, for
+    grouping similar colors under a single cache key. Each channel is snapped
+    independently, to the nearest level, with ties going to the lower level; the
+    snapping is done by table lookup, with a table precomputed once per number of
+    levels.
+
+    Examples:
+
+    .. doctest::
+
+        >>> snap_rgb((218, 165, 32))
+        IntegerRGB(red=204, green=153, blue=51)
+        >>> snap_rgb((218, 165, 32), levels=2)
+        IntegerRGB(red=255, green=255, blue=0)
+
+    :param rgb_triplet: The ``rgb()`` triplet.
+    :param levels: The number of levels per channel. Default is 6.
+    :raises ValueError: when the number of levels is not between 2 and 256 inclusive.
+
+    """
+    table = _get_snap_table(levels)
+    return IntegerRGB(*bytes(normalize_integer_triplet(rgb_triplet)).translate(table))
+
+
+def snap_hex(hex_value: str, levels: int = _WEB_SAFE_LEVELS) -> str:
+    """
+    Snap a hexadecimal color value to the nearest color of a grid with the given
+    number of levels per channel, as for :func:`snap_rgb`, returning a normalized
+    hexadecimal color value.
+
+    Examples:
+
+    .. doctest::
+
+        >>> snap_hex("#daa520")
+        '#cc9933'
+        >>> snap_hex("#FFF")
+        '#ffffff'
+
+    :param hex_value: The hexadecimal color value to snap.
+    :param levels: The number of levels per channel. Default is 6.
+    :raises ValueError: when the given value is not a valid hexadecimal color value,
+       or when the number of levels is not between 2 and 256 inclusive.
+
+    """
+    table = _get_snap_table(levels)
+    return f"#{bytes.fromhex(normalize_hex(hex_value)[1:]).translate(table).hex()}"
+
+
+def snap_packed(value: int, levels: int = _WEB_SAFE_LEVELS) -> int:
+    """
+    Snap a color given as a packed integer, of the form ``red << 16 | green << 8 |
+    blue``, to the nearest color of a grid with the given number of levels per
+    channel, as for :func:`snap_rgb`, returning a packed integer.
+
+    Examples:
+
+    .. doctest::
+
+        >>> hex(snap_packed(0xDAA520))
+        '0xcc9933'
+
+    :param value: The packed integer to snap.
+    :param levels: The number of levels per channel. Default is 6.
+    :raises ValueError: when the value is not between 0 and ``0xFFFFFF`` inclusive, or
+       when the number of levels is not between 2 and 256 inclusive.
+
+    """
+    table = _get_snap_table(levels)
+    if not 0 <= value <= 0xFFFFFF:
+        raise ValueError(f"{value} is not a valid packed 24-bit color.")
+    return int.from_bytes(value.to_bytes(3, "big").translate(table), "big")
+
+
+def snap_rgb_buffer(
+    rgb_buffer, levels: int = _WEB_SAFE_LEVELS, channels: int = 3
+) -> bytearray:
+    """
+    Snap every pixel of a buffer of packed 8-bit RGB or RGBA colors to the nearest
+    color of a grid with the given number of levels per channel, as for
+    :func:`snap_rgb`, returning a :class:`bytearray` of the snapped pixels in the same
+    layout.
+
+    The input may be any C-contiguous object supporting the buffer protocol whose
+    items are single bytes -- such as a NumPy ``uint8`` array of shape ``(N, 3)`` --
+    and it is read in place. The whole buffer is snapped by a single call to
+    :meth:`bytes.translate`, without a Python-level loop over the pixels. Any alpha
+    channel is copied unchanged.
+
+    Examples:
+
+    .. doctest::
+
+        >>> list(snap_rgb_buffer(bytes([218, 165, 32, 1, 2, 3])))
+        [204, 153, 51, 0, 0, 0]
+        >>> list(snap_rgb_buffer(bytes([218, 165, 32, 128]), levels=2, channels=4))
+        [255, 255, 0, 128]
+
+    :param rgb_buffer: The buffer of colors.
+    :param levels: The number of levels per channel. Default is 6.
+    :param channels: The number of bytes per pixel: 3 for RGB, or 4 for RGBA. Default
+       is 3.
+    :raises ValueError: when the buffer is not a contiguous buffer of bytes whose
+       length is a multiple of ``channels``, when ``channels`` is not 3 or 4, or when
+       the number of levels is not between 2 and 256 inclusive.
+
+    """
+    if channels not in (3, 4):
+        raise ValueError(f"channels must be 3 (RGB) or 4 (RGBA), not {channels}.")
+    table = _get_snap_table(levels)
+    view = _as_byte_view(rgb_buffer, channels)
+    result = bytearray(view).translate(table)
+    if channels == 4:
+        result[3::4] = view[3::4]
+    return result
@@ -0,0 +1,369 @@
+"""
+A compact binary file format for storing large numbers of colors.
+
+"""
+
+# SPDX-License-Identifier: BSD-3-Clause
+
+import itertools
+import mmap
+import os
+import struct
+import sys
+import typing
+from array import array
+
+from ._batch import _convert_unique
+from ._normalization import _as_byte_view
+
+# The layout of a color file:
+#
+# * A header, laid out as described by _HEADER: the magic bytes b"WCCF", the format
+#   version, the code of the layout of the body (an index into _LAYOUTS), and the
+#   number of colors.
+#
+# * The body, holding each color either as a packed 32-bit integer of the form
+#   red << 16 | green << 8 | blue ("packed"), or as three bytes, red, green and blue
+#   ("rgb").
+#
+# All integers are little-endian, so files can be shared between platforms, and the
+# header is 16 bytes long, so that the packed integers of the body are aligned.
+_HEADER = struct.Struct("<4sHBxQ")
+_MAGIC = b"WCCF"
+_VERSION = 1
+_LAYOUTS = ("packed", "rgb")
+_ITEM_SIZES = {"packed": 4, "rgb": 3}
+
+# The positions of the red, green and blue bytes within a little-endian packed
+# integer.
+_LITTLE_ENDIAN_POSITIONS = (2, 1, 0)
+
+_PathLike = typing.Union[str, "os.PathLike[str]"]
+
+
+def _check_layout(layout: str) -> None:
+    """
+    Internal helper checking that a layout is supported.
+
+    :raises ValueError: when the layout is not supported.
+
+    """
+    if layout not in _LAYOUTS:
+        raise ValueError(
+            f"{layout} is not a supported color file layout; supported layouts are: "
+            f"{_LAYOUTS}."
+        )
+
+
+def _swap_packed(view: memoryview) -> typing.Union[memoryview, array]:
+    """
+    Internal helper returning the packed 32-bit integers held in a buffer with their
+    byte order converted between native and little-endian: in place on little-endian
+    platforms, and as a byte-swapped copy elsewhere.
+
+    """
+    values = view.cast("I")
+    if sys.byteorder != "little":  # pragma: no cover
+        values = array("I", values)
+        values.byteswap()
+    return values
+
+
+def _packed_to_rgb(packed: bytes) -> bytearray:
+    """
+    Internal helper converting little-endian packed integers to packed 8-bit RGB
+    colors.
+
+    """
+    rgb = bytearray(3 * (len(packed) // 4))
+    for channel, position in enumerate(_LITTLE_ENDIAN_POSITIONS):
+        rgb[channel::3] = packed[position::4]
+    return rgb
+
+
+def write_color_file(path: _PathLike, values, layout: str = "packed") -> int:
+    """
+    Write colors to a color file, returning the number of colors written.
+
+    Color files hold a 16-byte header, recording the format version, the layout of the
+    colors and their number, followed by the raw colors, with no separators. They take
+    half the space of ``#rrggbb`` text, or less, and are loaded by
+    :func:`read_color_file` without parsing.
+
+    Two layouts are available:
+
+    * ``"packed"``, in which each color is a little-endian unsigned 32-bit integer of
+      the form ``red << 16 | green << 8 | blue``. The ``values`` are given as a buffer
+      of native unsigned 32-bit integers, such as the :class:`array.array` returned by
+      :func:`hex_to_packed_array`.
+
+    * ``"rgb"``, in which each color is three bytes: red, green and blue. The
+      ``values`` are given as a buffer of packed 8-bit RGB colors, as used by the
+      buffer forms of other functions.
+
+    Examples:
+
+    .. doctest::
+
+        >>> import os, tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), "colors.wcc")
+        >>> write_color_file(path, hex_to_packed_array(["#000080", "#daa520"]))
+        2
+        >>> os.path.getsize(path)
+        24
+
+    :param path: The path of the file to write.
+    :param values: The buffer of colors to write.
+    :param layout: The layout of the colors: ``"packed"`` or ``"rgb"``. Default is
+       ``"packed"``.
+    :raises ValueError: when the layout is not supported, when the buffer is not a
+       contiguous buffer whose length in bytes is a multiple of the size of a color,
+       or when a packed integer is greater than ``0xFFFFFF``.
+
+    """
+    _check_layout(layout)
+    view = _as_byte_view(memoryview(values).cast("B"), _ITEM_SIZES[layout])
+    count = len(view) // _ITEM_SIZES[layout]
+    body: typing.Union[memoryview, array] = view
+    if layout == "packed":
+        body = _swap_packed(view)
+        if bytes(memoryview(body).cast("B")[3::4]).count(0) != count:
+            raise ValueError("Packed colors must be no greater than 0xFFFFFF.")
+    with open(path, "wb") as color_file:
+        color_file.write(_HEADER.pack(_MAGIC, _VERSION, _LAYOUTS.index(layout), count))
+        color_file.write(body)
+    return count
+
+
+class ColorFile:
+    """
+    Read-only view of the colors held in a color file, as written by
+    :func:`write_color_file`.
+
+    Color files are usually opened with :func:`read_color_file`, which maps the file
+    into memory, but the constructor accepts any object supporting the buffer protocol
+    which holds the contents of a color file.
+
+    .. attribute:: layout
+
+       The layout of the colors: ``"packed"`` or ``"rgb"``.
+
+    .. attribute:: values
+
+       The colors. For the ``"packed"`` layout, this is a :class:`memoryview` of
+       unsigned 32-bit integers; for the ``"rgb"`` layout, a :class:`memoryview` of
+       unsigned bytes, three per color. Either can be passed to functions accepting
+       buffers, or wrapped without copying by, for example, :func:`numpy.frombuffer`.
+
+    Examples:
+
+    .. doctest::
+
+        >>> import os, tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), "colors.wcc")
+        >>> write_color_file(path, bytes([0, 0, 128, 218, 165, 32]), layout="rgb")
+        2
+        >>> with read_color_file(path) as colors:
+        ...     print(colors.layout, len(colors), list(colors.values))
+        rgb 2 [0, 0, 128, 218, 165, 32]
+
+    :param buffer: A buffer holding a color file.
+    :raises ValueError: when the buffer does not hold a color file.
+
+    """
+
+    def __init__(self, buffer):
+        self._mmap: typing.Optional[mmap.mmap] = None
+        view = memoryview(buffer).cast("B")
+        try:
+            if len(view) < _HEADER.size:
+                raise ValueError("Buffer is too short to hold a color file.")
+            magic, version, layout_code, count = _HEADER.unpack_from(view)
+            if magic != _MAGIC or version != _VERSION or layout_code >= len(_LAYOUTS):
+                raise ValueError(
+                    f"Buffer does not hold a version {_VERSION} color file."
+                )
+            self.layout = _LAYOUTS[layout_code]
+            end = _HEADER.size + _ITEM_SIZES[self.layout] * count
+            if len(view) < end:
+                raise ValueError("Buffer is too short to hold its colors.")
+        except ValueError:
+            # Release the view at once, so that the buffer it was taken from can be
+            # closed.
+            view.release()
+            raise
+        self._view = view
+        self._count = count
+        self._body = view[_HEADER.size : end]
+        self.values = self._body if self.layout == "rgb" else _swap_packed(self._body)
+
+    def __len__(self) -> int:
+        """
+        Return the number of colors in the file.
+
+        """
+        return self._count
+
+    def __enter__(self) -> "ColorFile":
+        """
+        Return the color file, for use as a context manager which closes it on exit.
+
+        """
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """
+        Close the color file.
+
+        """
+        self.close()
+
+    def close(self) -> None:
+        """
+        Stop reading from the color file's buffer, and unmap the file, if it was opened
+        by :func:`read_color_file`. The color file cannot be used afterward, nor can
+        its :attr:`values`.
+
+        """
+        # On big-endian platforms, packed values are a byte-swapped copy.
+        if isinstance(self.values, memoryview):  # pragma: no branch
+            self.values.release()
+        self._body.release()
+        self._view.release()
+        if self._mmap is not None:
+            self._mmap.close()
+
+    def to_rgb(self) -> bytearray:
+        """
+        Return the colors as a :class:`bytearray` of packed 8-bit RGB colors, three
+        bytes per color, whatever the layout of the file.
+
+        """
+        if self.layout == "rgb":
+            return bytearray(self._body)
+        return _packed_to_rgb(self._body)
+
+
+def read_color_file(path: _PathLike) -> ColorFile:
+    """
+    Open a color file, as written by :func:`write_color_file`, by mapping it into
+    memory.
+
+    No parsing is done beyond reading the header, and the colors are read from the
+    file in place, so files of any size open at once and the operating system loads
+    only the parts which are used. Close the result, or use it as a context manager,
+    to unmap the file.
+
+    Since the body of a color file starts 16 bytes into the file, it can also be
+    mapped directly by :class:`numpy.memmap`:
+
+    .. code-block:: python
+
+        import numpy
+
+        packed = numpy.memmap(path, dtype="<u4", mode="r", offset=16)
+        rgb = numpy.memmap(path, dtype=numpy.uint8, mode="r", offset=16).reshape(-1, 3)
+
+    Examples:
+
+    .. doctest::
+
+        >>> import os, tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), "colors.wcc")
+        >>> write_color_file(path, hex_to_packed_array(["#000080", "#daa520"]))
+        2
+        >>> with read_color_file(path) as colors:
+        ...     print(colors.layout, colors.values.tolist())
+        packed [128, 14329120]
+
+    :param path: The path of the file to open.
+    :raises ValueError: when the file is not a color file.
+
+    """
+    with open(path, "rb") as color_file:
+        mapped = mmap.mmap(color_file.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        colors = ColorFile(mapped)
+    except ValueError:
+        mapped.close()
+        raise
+    colors._mmap = mapped
+    return colors
+
+
+def hex_file_to_color_file(
+    source: _PathLike,
+    destination: _PathLike,
+    layout: str = "packed",
+    chunk_size: int = 65536,
+) -> int:
+    """
+    Convert a text file of hexadecimal color values, one per line, to a color file,
+    returning the number of colors converted.
+
+    The source is read and converted in chunks of ``chunk_size`` lines, so files of
+    any size are converted in constant memory. Blank lines are skipped, and each value
+    is normalized as by :func:`normalize_hex`, so any valid hexadecimal color value is
+    accepted; as with :func:`hex_to_packed_array`, each distinct value in a chunk is
+    only converted once.
+
+    :param source: The path of the text file to read.
+    :param destination: The path of the color file to write.
+    :param layout: The layout of the colors: ``"packed"`` or ``"rgb"``. Default is
+       ``"packed"``.
+    :param chunk_size: The number of lines to convert at a time. Default is 65536.
+    :raises ValueError: when the layout is not supported, or when any line is not a
+       valid hexadecimal color value. The destination is left incomplete in the latter
+       case.
+
+    """
+    _check_layout(layout)
+    item_size = _ITEM_SIZES[layout]
+    byteorder = "little" if layout == "packed" else "big"
+    count = 0
+    with open(source, encoding="ascii") as hex_file, open(destination, "wb") as out:
+        out.write(_HEADER.pack(_MAGIC, _VERSION, _LAYOUTS.index(layout), 0))
+        lines = (line.strip() for line in hex_file)
+        values = (line for line in lines if line)
+        while chunk := list(itertools.islice(values, chunk_size)):
+            out.write(
+                _convert_unique(
+                    chunk, lambda value: value.to_bytes(item_size, byteorder)
+                )
+            )
+            count += len(chunk)
+        out.seek(0)
+        out.write(_HEADER.pack(_MAGIC, _VERSION, _LAYOUTS.index(layout), count))
+    return count
+
+
+def color_file_to_hex_file(
+    source: _PathLike, destination: _PathLike, chunk_size: int = 65536
+) -> int:
+    """
+    Convert a color file to a text file of normalized hexadecimal color values, one
+    per line, returning the number of colors converted.
+
+    The color file is mapped into memory and converted in chunks of ``chunk_size``
+    colors, so files of any size are converted in constant memory.
+
+    :param source: The path of the color file to read.
+    :param destination: The path of the text file to write.
+    :param chunk_size: The number of colors to convert at a time. Default is 65536.
+    :raises ValueError: when the source is not a color file.
+
+    """
+    with read_color_file(source) as colors:
+        with open(destination, "w", encoding="ascii") as hex_file:
+            item_size = _ITEM_SIZES[colors.layout]
+            for start in range(0, len(colors), chunk_size):
+                with colors._body[
+                    start * item_size : (start + chunk_size) * item_size
+                ] as chunk:
+                    rgb = chunk if colors.layout == "rgb" else _packed_to_rgb(chunk)
+                    digits = rgb.hex()
+                hex_file.writelines(
+                    f"#{digits[offset : offset + 6]}\n"
+                    for offset in range(0, len(digits), 6)
+                )
+            return len(colors)
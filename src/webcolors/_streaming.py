@@ -0,0 +1,236 @@
+"""
+Conversion of asynchronous streams of color values, in batches run off the event
+loop.
+
+"""
+
+# SPDX-License-Identifier: BSD-3-Clause
+
+import asyncio
+import collections
+import concurrent.futures
+import itertools
+import typing
+
+from ._batch import _convert_unique
+from ._types import IntegerRGB
+
+T = typing.TypeVar("T")
+
+# Marks the end of the values read from a stream.
+_END = object()
+
+
+def _hex_batch_to_rgb(hex_values: typing.List[str]) -> typing.List[IntegerRGB]:
+    """
+    Internal helper converting a batch of hexadecimal color values to integer
+    ``rgb()`` triplets, converting each distinct value only once.
+
+    :raises ValueError: when any of the values is not a valid hexadecimal color value.
+
+    """
+    triplets = iter(_convert_unique(hex_values, lambda value: value.to_bytes(3, "big")))
+    return list(map(IntegerRGB._make, zip(triplets, triplets, triplets)))
+
+
+async def _read(values: typing.AsyncIterator, queue: asyncio.Queue) -> None:
+    """
+    Internal helper reading every value of a stream into a queue, followed by
+    :data:`_END` once the stream ends, or if reading it fails.
+
+    When the reader is cancelled, because the consumer stopped early, nothing reads
+    the queue any more, so :data:`_END` is not put in it.
+
+    """
+    try:
+        async for value in values:
+            await queue.put(value)
+    except Exception:
+        await queue.put(_END)
+        raise
+    await queue.put(_END)
+
+
+async def _batches(
+    queue: asyncio.Queue, batch_size: int, max_delay: float
+) -> typing.AsyncIterator[list]:
+    """
+    Internal helper grouping the values read into a queue into batches, each of which
+    is complete when it holds ``batch_size`` values, or ``max_delay`` seconds after
+    its first value arrived.
+
+    Values which are already waiting in the queue are taken without suspending, so
+    when the stream produces values faster than they are converted, batches fill up
+    without waiting on the event loop once per value.
+
+    """
+    loop = asyncio.get_running_loop()
+    while (value := await queue.get()) is not _END:
+        batch = [value]
+        deadline = loop.time() + max_delay
+        while len(batch) < batch_size:
+            try:
+                value = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                try:
+                    value = await asyncio.wait_for(queue.get(), deadline - loop.time())
+                except asyncio.TimeoutError:
+                    break
+            if value is _END:
+                yield batch
+                return
+            batch.append(value)
+        yield batch
+
+
+async def convert_stream(
+    values: typing.AsyncIterable[str],
+    convert: typing.Callable[[typing.List[str]], typing.Iterable[T]],
+    batch_size: int = 1024,
+    max_delay: float = 0.01,
+    max_pending: int = 2,
+    executor: typing.Optional[concurrent.futures.Executor] = None,
+) -> typing.AsyncIterator[T]:
+    """
+    Convert a stream of color values in batches, yielding the converted values in the
+    order of the stream.
+
+    Values are read from the stream as they arrive, and grouped into batches of up to
+    ``batch_size`` values; a batch is also complete once ``max_delay`` seconds have
+    passed since its first value arrived, so a slow stream is not held up waiting for
+    a batch to fill. Each batch is passed, as a :class:`list`, to ``convert``, which
+    must return the converted values in the same order, and which is run in
+    ``executor`` so that converting large batches does not block the event loop.
+
+    Up to ``max_pending`` batches are converted at once. When that many are waiting
+    to be consumed, no more values are read from the stream until the oldest batch's
+    results have been yielded, so a slow consumer applies backpressure to the stream
+    rather than letting results accumulate.
+
+    If ``convert`` raises an exception for a batch -- for example, because it holds
+    an invalid value -- the exception propagates when that batch's results would have
+    been yielded, and the stream is closed. The stream is also closed, with its
+    ``aclose()`` method if it has one, when the consumer stops early and closes the
+    returned iterator.
+
+    Examples:
+
+    .. doctest::
+
+        >>> import asyncio
+        >>> async def values():
+        ...     for value in ["#fff", "#000080", "#daa520"]:
+        ...         yield value
+        >>> async def main():
+        ...     return [value async for value in convert_stream(
+        ...         values(), hex_to_packed_array, batch_size=2
+        ...     )]
+        >>> asyncio.run(main())
+        [16777215, 128, 14329120]
+
+    :param values: The stream of values to convert.
+    :param convert: The function converting a batch of values, such as
+       :func:`hex_to_packed_array`. To use a process pool as the executor, it must be
+       a function which can be pickled.
+    :param batch_size: The largest number of values in a batch. Default is 1024.
+    :param max_delay: The longest time in seconds to wait for a batch to fill. Default
+       is 0.01.
+    :param max_pending: The largest number of batches being converted, or waiting to
+       be consumed, at once. Default is 2.
+    :param executor: The executor in which to run ``convert``. By default, the default
+       executor of the event loop, which is a thread pool.
+    :raises ValueError: when ``batch_size`` or ``max_pending`` is less than 1.
+
+    """
+    if batch_size < 1 or max_pending < 1:
+        raise ValueError("batch_size and max_pending must both be at least 1.")
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(batch_size)
+    source = values.__aiter__()
+    reader = asyncio.ensure_future(_read(source, queue))
+    batches = _batches(queue, batch_size, max_delay)
+    next_batch: typing.Optional[asyncio.Future] = asyncio.ensure_future(
+        batches.__anext__()
+    )
+    pending: typing.Deque[asyncio.Future] = collections.deque()
+    try:
+        # Wait for whichever comes first: the oldest pending batch finishing
+        # conversion, in which case its results are yielded, or the next batch being
+        # complete, in which case its conversion is started, unless too many batches
+        # are already pending.
+        while next_batch is not None or pending:
+            waiting = set(itertools.islice(pending, 1))
+            if next_batch is not None and len(pending) < max_pending:
+                waiting.add(next_batch)
+            await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+            if pending and pending[0].done():
+                for converted in pending.popleft().result():
+                    yield converted
+            else:
+                # Otherwise, the next batch is complete.
+                try:
+                    batch = next_batch.result()
+                except StopAsyncIteration:
+                    next_batch = None
+                else:
+                    pending.append(loop.run_in_executor(executor, convert, batch))
+                    next_batch = asyncio.ensure_future(batches.__anext__())
+        # Raise any exception raised by reading the stream.
+        await reader
+    finally:
+        for future in pending:
+            future.cancel()
+        tasks = [reader] if next_batch is None else [reader, next_batch]
+        for task in tasks:
+            task.cancel()
+        # Wait for the cancelled tasks to finish, so none is left pending, and the
+        # source is no longer being read when it is closed.
+        await asyncio.wait(tasks)
+        if (aclose := getattr(source, "aclose", None)) is not None:
+            await aclose()
+
+
+def hex_to_rgb_stream(
+    hex_values: typing.AsyncIterable[str],
+    batch_size: int = 1024,
+    max_delay: float = 0.01,
+    max_pending: int = 2,
+    executor: typing.Optional[concurrent.futures.Executor] = None,
+) -> typing.AsyncIterator[IntegerRGB]:
+    """
+    Convert a stream of hexadecimal color values to integer ``rgb()`` triplets, in
+    batches, as for :func:`convert_stream`.
+
+    Each value is normalized as by :func:`normalize_hex` before being converted, and
+    each distinct value in a batch is only converted once. The batches are converted
+    by a function which can be pickled, so ``executor`` may be a process pool.
+
+    Examples:
+
+    .. doctest::
+
+        >>> import asyncio
+        >>> async def values():
+        ...     for value in ["#fff", "#000080"]:
+        ...         yield value
+        >>> async def main():
+        ...     return [value async for value in hex_to_rgb_stream(values())]
+        >>> asyncio.run(main())
+        [IntegerRGB(red=255, green=255, blue=255),
+         IntegerRGB(red=0, green=0, blue=128)]
+
+    :param hex_values: The stream of hexadecimal color values to convert.
+    :param batch_size: The largest number of values in a batch. Default is 1024.
+    :param max_delay: The longest time in seconds to wait for a batch to fill. Default
+       is 0.01.
+    :param max_pending: The largest number of batches being converted, or waiting to
+       be consumed, at once. Default is 2.
+    :param executor: The executor in which to convert batches. By default, the default
+       executor of the event loop, which is a thread pool.
+    :raises ValueError: when any of the values is not a valid hexadecimal color value,
+       or when ``batch_size`` or ``max_pending`` is less than 1.
+
+    """
+    return convert_stream(
+        hex_values, _hex_batch_to_rgb, batch_size, max_delay, max_pending, executor
+    )
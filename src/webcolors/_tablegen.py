@@ -0,0 +1,160 @@
+"""
+Generator for the precomputed lookup tables in ``webcolors._tables``.
+
+The mappings of color names to hexadecimal values in ``webcolors._definitions`` are the
+canonical definitions of the named colors. Every other table of named colors is derived
+from them, and rather than deriving those tables each time ``webcolors`` is imported,
+this module derives them once and writes them out as literal source code.
+
+To regenerate the tables after changing the definitions, run::
+
+    python -m webcolors._tablegen
+
+The test suite checks that the generated tables are up to date.
+
+"""
+
+# SPDX-License-Identifier: BSD-3-Clause
+
+import pathlib
+import typing
+
+from . import _definitions
+
+# The specifications for which tables are generated, and the prefixes of the names of
+# their tables. CSS2 is absent because its color names are those of HTML 4, so it
+# shares the HTML 4 tables.
+_TABLE_PREFIXES = (
+    ("_HTML4", _definitions._HTML4_NAMES_TO_HEX),
+    ("_CSS21", _definitions._CSS21_NAMES_TO_HEX),
+    ("_CSS3", _definitions._CSS3_NAMES_TO_HEX),
+)
+
+# CSS3 defines both "gray" and "grey", as well as defining either spelling variant for
+# other related colors like "darkgray"/"darkgrey", etc. For a "forward" lookup from
+# name to hex, this is straightforward, but a "reverse" lookup from hex to name requires
+# picking one spelling and being consistent about it.
+#
+# Since "gray" was the only spelling supported in HTML 4, CSS1, and CSS2, "gray" and its
+# variants are chosen here.
+_PREFERRED_NAMES = (
+    "darkgray",
+    "darkslategray",
+    "dimgray",
+    "gray",
+    "lightgray",
+    "lightslategray",
+    "slategray",
+)
+
+_TABLES_PATH = pathlib.Path(__file__).with_name("_tables.py")
+
+_HEADER = '''"""
+Precomputed lookup tables of named colors.
+
+This file is generated from the definitions in ``webcolors._definitions`` by running
+``python -m webcolors._tablegen``. Do not edit it by hand.
+
+"""
+
+# SPDX-License-Identifier: BSD-3-Clause
+'''
+
+
+def _hex_to_names(names_to_hex: typing.Dict[str, str]) -> typing.Dict[str, str]:
+    """
+    Return the mapping of hexadecimal values to normalized names for a mapping of
+    names to hexadecimal values.
+
+    Where a value has more than one name, the last name defined for it wins unless one
+    of its names is a preferred spelling.
+
+    """
+    hex_to_names = {value: key for key, value in names_to_hex.items()}
+    for name in _PREFERRED_NAMES:
+        if name in names_to_hex:
+            hex_to_names[names_to_hex[name]] = name
+    return hex_to_names
+
+
+def _cased_names_to_hex(names_to_hex: typing.Dict[str, str]) -> typing.Dict[str, str]:
+    """
+    Return a mapping of names to hexadecimal values which, in addition to the
+    all-lowercase form of each name, also has entries for its all-uppercase and
+    capitalized forms, so that input in those forms can be looked up directly.
+
+    """
+    cased = {}
+    for name, value in names_to_hex.items():
+        for variant in (name, name.upper(), name.capitalize()):
+            cased[variant] = value
+    return cased
+
+
+def _literal(value: typing.Union[str, int]) -> str:
+    """
+    Return the source code of a key or value of a table: a quoted string, or a
+    hexadecimal integer literal for packed color values.
+
+    """
+    return f"0x{value:06X}" if isinstance(value, int) else f'"{value}"'
+
+
+def _format_table(
+    table_name: str,
+    table: typing.Dict[typing.Union[str, int], typing.Union[str, int]],
+) -> str:
+    """
+    Return the source code of an assignment of a table to a module-level name.
+
+    """
+    entries = "".join(
+        f"    {_literal(key)}: {_literal(value)},\n" for key, value in table.items()
+    )
+    return f"{table_name} = {{\n{entries}}}\n"
+
+
+def generate() -> str:
+    """
+    Return the source code of the ``webcolors._tables`` module.
+
+    """
+    sections = [_HEADER]
+    for prefix, names_to_hex in _TABLE_PREFIXES:
+        sections.append(
+            _format_table(f"{prefix}_HEX_TO_NAMES", _hex_to_names(names_to_hex))
+        )
+        sections.append(
+            _format_table(
+                f"{prefix}_NAMES_TO_PACKED",
+                {name: int(value[1:], 16) for name, value in names_to_hex.items()},
+            )
+        )
+        sections.append(
+            _format_table(
+                f"{prefix}_CASED_NAMES_TO_HEX", _cased_names_to_hex(names_to_hex)
+            )
+        )
+        sections.append(
+            _format_table(
+                f"{prefix}_PACKED_TO_NAMES",
+                {
+                    int(value[1:], 16): name
+                    for value, name in _hex_to_names(names_to_hex).items()
+                },
+            )
+        )
+    return "\n".join(sections)
+
+
+def main(path: pathlib.Path = _TABLES_PATH) -> None:
+    """
+    Write the source code of the ``webcolors._tables`` module to the given path, or by
+    default to its location alongside this module.
+
+    """
+    path.write_text(generate(), encoding="utf-8")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
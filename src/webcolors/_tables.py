@@ -0,0 +1,1107 @@
+"""
+Precomputed lookup tables of named colors.
+
+This file is generated from the definitions in ``webcolors._definitions`` by running
+``python -m webcolors._tablegen``. Do not edit it by hand.
+
+"""
+
+# SPDX-License-Identifier: BSD-3-Clause
+
+_HTML4_HEX_TO_NAMES = {
+    "#00ffff": "aqua",
+    "#000000": "black",
+    "#0000ff": "blue",
+    "#ff00ff": "fuchsia",
+    "#008000": "green",
+    "#808080": "gray",
+    "#00ff00": "lime",
+    "#800000": "maroon",
+    "#000080": "navy",
+    "#808000": "olive",
+    "#800080": "purple",
+    "#ff0000": "red",
+    "#c0c0c0": "silver",
+    "#008080": "teal",
+    "#ffffff": "white",
+    "#ffff00": "yellow",
+}
+
+_HTML4_NAMES_TO_PACKED = {
+    "aqua": 0x00FFFF,
+    "black": 0x000000,
+    "blue": 0x0000FF,
+    "fuchsia": 0xFF00FF,
+    "green": 0x008000,
+    "gray": 0x808080,
+    "lime": 0x00FF00,
+    "maroon": 0x800000,
+    "navy": 0x000080,
+    "olive": 0x808000,
+    "purple": 0x800080,
+    "red": 0xFF0000,
+    "silver": 0xC0C0C0,
+    "teal": 0x008080,
+    "white": 0xFFFFFF,
+    "yellow": 0xFFFF00,
+}
+
+_HTML4_CASED_NAMES_TO_HEX = {
+    "aqua": "#00ffff",
+    "AQUA": "#00ffff",
+    "Aqua": "#00ffff",
+    "black": "#000000",
+    "BLACK": "#000000",
+    "Black": "#000000",
+    "blue": "#0000ff",
+    "BLUE": "#0000ff",
+    "Blue": "#0000ff",
+    "fuchsia": "#ff00ff",
+    "FUCHSIA": "#ff00ff",
+    "Fuchsia": "#ff00ff",
+    "green": "#008000",
+    "GREEN": "#008000",
+    "Green": "#008000",
+    "gray": "#808080",
+    "GRAY": "#808080",
+    "Gray": "#808080",
+    "lime": "#00ff00",
+    "LIME": "#00ff00",
+    "Lime": "#00ff00",
+    "maroon": "#800000",
+    "MAROON": "#800000",
+    "Maroon": "#800000",
+    "navy": "#000080",
+    "NAVY": "#000080",
+    "Navy": "#000080",
+    "olive": "#808000",
+    "OLIVE": "#808000",
+    "Olive": "#808000",
+    "purple": "#800080",
+    "PURPLE": "#800080",
+    "Purple": "#800080",
+    "red": "#ff0000",
+    "RED": "#ff0000",
+    "Red": "#ff0000",
+    "silver": "#c0c0c0",
+    "SILVER": "#c0c0c0",
+    "Silver": "#c0c0c0",
+    "teal": "#008080",
+    "TEAL": "#008080",
+    "Teal": "#008080",
+    "white": "#ffffff",
+    "WHITE": "#ffffff",
+    "White": "#ffffff",
+    "yellow": "#ffff00",
+    "YELLOW": "#ffff00",
+    "Yellow": "#ffff00",
+}
+
+_HTML4_PACKED_TO_NAMES = {
+    0x00FFFF: "aqua",
+    0x000000: "black",
+    0x0000FF: "blue",
+    0xFF00FF: "fuchsia",
+    0x008000: "green",
+    0x808080: "gray",
+    0x00FF00: "lime",
+    0x800000: "maroon",
+    0x000080: "navy",
+    0x808000: "olive",
+    0x800080: "purple",
+    0xFF0000: "red",
+    0xC0C0C0: "silver",
+    0x008080: "teal",
+    0xFFFFFF: "white",
+    0xFFFF00: "yellow",
+}
+
+_CSS21_HEX_TO_NAMES = {
+    "#ffa500": "orange",
+    "#00ffff": "aqua",
+    "#000000": "black",
+    "#0000ff": "blue",
+    "#ff00ff": "fuchsia",
+    "#008000": "green",
+    "#808080": "gray",
+    "#00ff00": "lime",
+    "#800000": "maroon",
+    "#000080": "navy",
+    "#808000": "olive",
+    "#800080": "purple",
+    "#ff0000": "red",
+    "#c0c0c0": "silver",
+    "#008080": "teal",
+    "#ffffff": "white",
+    "#ffff00": "yellow",
+}
+
+_CSS21_NAMES_TO_PACKED = {
+    "orange": 0xFFA500,
+    "aqua": 0x00FFFF,
+    "black": 0x000000,
+    "blue": 0x0000FF,
+    "fuchsia": 0xFF00FF,
+    "green": 0x008000,
+    "gray": 0x808080,
+    "lime": 0x00FF00,
+    "maroon": 0x800000,
+    "navy": 0x000080,
+    "olive": 0x808000,
+    "purple": 0x800080,
+    "red": 0xFF0000,
+    "silver": 0xC0C0C0,
+    "teal": 0x008080,
+    "white": 0xFFFFFF,
+    "yellow": 0xFFFF00,
+}
+
+_CSS21_CASED_NAMES_TO_HEX = {
+    "orange": "#ffa500",
+    "ORANGE": "#ffa500",
+    "Orange": "#ffa500",
+    "aqua": "#00ffff",
+    "AQUA": "#00ffff",
+    "Aqua": "#00ffff",
+    "black": "#000000",
+    "BLACK": "#000000",
+    "Black": "#000000",
+    "blue": "#0000ff",
+    "BLUE": "#0000ff",
+    "Blue": "#0000ff",
+    "fuchsia": "#ff00ff",
+    "FUCHSIA": "#ff00ff",
+    "Fuchsia": "#ff00ff",
+    "green": "#008000",
+    "GREEN": "#008000",
+    "Green": "#008000",
+    "gray": "#808080",
+    "GRAY": "#808080",
+    "Gray": "#808080",
+    "lime": "#00ff00",
+    "LIME": "#00ff00",
+    "Lime": "#00ff00",
+    "maroon": "#800000",
+    "MAROON": "#800000",
+    "Maroon": "#800000",
+    "navy": "#000080",
+    "NAVY": "#000080",
+    "Navy": "#000080",
+    "olive": "#808000",
+    "OLIVE": "#808000",
+    "Olive": "#808000",
+    "purple": "#800080",
+    "PURPLE": "#800080",
+    "Purple": "#800080",
+    "red": "#ff0000",
+    "RED": "#ff0000",
+    "Red": "#ff0000",
+    "silver": "#c0c0c0",
+    "SILVER": "#c0c0c0",
+    "Silver": "#c0c0c0",
+    "teal": "#008080",
+    "TEAL": "#008080",
+    "Teal": "#008080",
+    "white": "#ffffff",
+    "WHITE": "#ffffff",
+    "White": "#ffffff",
+    "yellow": "#ffff00",
+    "YELLOW": "#ffff00",
+    "Yellow": "#ffff00",
+}
+
+_CSS21_PACKED_TO_NAMES = {
+    0xFFA500: "orange",
+    0x00FFFF: "aqua",
+    0x000000: "black",
+    0x0000FF: "blue",
+    0xFF00FF: "fuchsia",
+    0x008000: "green",
+    0x808080: "gray",
+    0x00FF00: "lime",
+    0x800000: "maroon",
+    0x000080: "navy",
+    0x808000: "olive",
+    0x800080: "purple",
+    0xFF0000: "red",
+    0xC0C0C0: "silver",
+    0x008080: "teal",
+    0xFFFFFF: "white",
+    0xFFFF00: "yellow",
+}
+
+_CSS3_HEX_TO_NAMES = {
+    "#f0f8ff": "aliceblue",
+    "#faebd7": "antiquewhite",
+    "#00ffff": "cyan",
+    "#7fffd4": "aquamarine",
+    "#f0ffff": "azure",
+    "#f5f5dc": "beige",
+    "#ffe4c4": "bisque",
+    "#000000": "black",
+    "#ffebcd": "blanchedalmond",
+    "#0000ff": "blue",
+    "#8a2be2": "blueviolet",
+    "#a52a2a": "brown",
+    "#deb887": "burlywood",
+    "#5f9ea0": "cadetblue",
+    "#7fff00": "chartreuse",
+    "#d2691e": "chocolate",
+    "#ff7f50": "coral",
+    "#6495ed": "cornflowerblue",
+    "#fff8dc": "cornsilk",
+    "#dc143c": "crimson",
+    "#00008b": "darkblue",
+    "#008b8b": "darkcyan",
+    "#b8860b": "darkgoldenrod",
+    "#a9a9a9": "darkgray",
+    "#006400": "darkgreen",
+    "#bdb76b": "darkkhaki",
+    "#8b008b": "darkmagenta",
+    "#556b2f": "darkolivegreen",
+    "#ff8c00": "darkorange",
+    "#9932cc": "darkorchid",
+    "#8b0000": "darkred",
+    "#e9967a": "darksalmon",
+    "#8fbc8f": "darkseagreen",
+    "#483d8b": "darkslateblue",
+    "#2f4f4f": "darkslategray",
+    "#00ced1": "darkturquoise",
+    "#9400d3": "darkviolet",
+    "#ff1493": "deeppink",
+    "#00bfff": "deepskyblue",
+    "#696969": "dimgray",
+    "#1e90ff": "dodgerblue",
+    "#b22222": "firebrick",
+    "#fffaf0": "floralwhite",
+    "#228b22": "forestgreen",
+    "#ff00ff": "magenta",
+    "#dcdcdc": "gainsboro",
+    "#f8f8ff": "ghostwhite",
+    "#ffd700": "gold",
+    "#daa520": "goldenrod",
+    "#808080": "gray",
+    "#008000": "green",
+    "#adff2f": "greenyellow",
+    "#f0fff0": "honeydew",
+    "#ff69b4": "hotpink",
+    "#cd5c5c": "indianred",
+    "#4b0082": "indigo",
+    "#fffff0": "ivory",
+    "#f0e68c": "khaki",
+    "#e6e6fa": "lavender",
+    "#fff0f5": "lavenderblush",
+    "#7cfc00": "lawngreen",
+    "#fffacd": "lemonchiffon",
+    "#add8e6": "lightblue",
+    "#f08080": "lightcoral",
+    "#e0ffff": "lightcyan",
+    "#fafad2": "lightgoldenrodyellow",
+    "#d3d3d3": "lightgray",
+    "#90ee90": "lightgreen",
+    "#ffb6c1": "lightpink",
+    "#ffa07a": "lightsalmon",
+    "#20b2aa": "lightseagreen",
+    "#87cefa": "lightskyblue",
+    "#778899": "lightslategray",
+    "#b0c4de": "lightsteelblue",
+    "#ffffe0": "lightyellow",
+    "#00ff00": "lime",
+    "#32cd32": "limegreen",
+    "#faf0e6": "linen",
+    "#800000": "maroon",
+    "#66cdaa": "mediumaquamarine",
+    "#0000cd": "mediumblue",
+    "#ba55d3": "mediumorchid",
+    "#9370db": "mediumpurple",
+    "#3cb371": "mediumseagreen",
+    "#7b68ee": "mediumslateblue",
+    "#00fa9a": "mediumspringgreen",
+    "#48d1cc": "mediumturquoise",
+    "#c71585": "mediumvioletred",
+    "#191970": "midnightblue",
+    "#f5fffa": "mintcream",
+    "#ffe4e1": "mistyrose",
+    "#ffe4b5": "moccasin",
+    "#ffdead": "navajowhite",
+    "#000080": "navy",
+    "#fdf5e6": "oldlace",
+    "#808000": "olive",
+    "#6b8e23": "olivedrab",
+    "#ffa500": "orange",
+    "#ff4500": "orangered",
+    "#da70d6": "orchid",
+    "#eee8aa": "palegoldenrod",
+    "#98fb98": "palegreen",
+    "#afeeee": "paleturquoise",
+    "#db7093": "palevioletred",
+    "#ffefd5": "papayawhip",
+    "#ffdab9": "peachpuff",
+    "#cd853f": "peru",
+    "#ffc0cb": "pink",
+    "#dda0dd": "plum",
+    "#b0e0e6": "powderblue",
+    "#800080": "purple",
+    "#ff0000": "red",
+    "#bc8f8f": "rosybrown",
+    "#4169e1": "royalblue",
+    "#8b4513": "saddlebrown",
+    "#fa8072": "salmon",
+    "#f4a460": "sandybrown",
+    "#2e8b57": "seagreen",
+    "#fff5ee": "seashell",
+    "#a0522d": "sienna",
+    "#c0c0c0": "silver",
+    "#87ceeb": "skyblue",
+    "#6a5acd": "slateblue",
+    "#708090": "slategray",
+    "#fffafa": "snow",
+    "#00ff7f": "springgreen",
+    "#4682b4": "steelblue",
+    "#d2b48c": "tan",
+    "#008080": "teal",
+    "#d8bfd8": "thistle",
+    "#ff6347": "tomato",
+    "#40e0d0": "turquoise",
+    "#ee82ee": "violet",
+    "#f5deb3": "wheat",
+    "#ffffff": "white",
+    "#f5f5f5": "whitesmoke",
+    "#ffff00": "yellow",
+    "#9acd32": "yellowgreen",
+}
+
+_CSS3_NAMES_TO_PACKED = {
+    "aliceblue": 0xF0F8FF,
+    "antiquewhite": 0xFAEBD7,
+    "aqua": 0x00FFFF,
+    "aquamarine": 0x7FFFD4,
+    "azure": 0xF0FFFF,
+    "beige": 0xF5F5DC,
+    "bisque": 0xFFE4C4,
+    "black": 0x000000,
+    "blanchedalmond": 0xFFEBCD,
+    "blue": 0x0000FF,
+    "blueviolet": 0x8A2BE2,
+    "brown": 0xA52A2A,
+    "burlywood": 0xDEB887,
+    "cadetblue": 0x5F9EA0,
+    "chartreuse": 0x7FFF00,
+    "chocolate": 0xD2691E,
+    "coral": 0xFF7F50,
+    "cornflowerblue": 0x6495ED,
+    "cornsilk": 0xFFF8DC,
+    "crimson": 0xDC143C,
+    "cyan": 0x00FFFF,
+    "darkblue": 0x00008B,
+    "darkcyan": 0x008B8B,
+    "darkgoldenrod": 0xB8860B,
+    "darkgray": 0xA9A9A9,
+    "darkgrey": 0xA9A9A9,
+    "darkgreen": 0x006400,
+    "darkkhaki": 0xBDB76B,
+    "darkmagenta": 0x8B008B,
+    "darkolivegreen": 0x556B2F,
+    "darkorange": 0xFF8C00,
+    "darkorchid": 0x9932CC,
+    "darkred": 0x8B0000,
+    "darksalmon": 0xE9967A,
+    "darkseagreen": 0x8FBC8F,
+    "darkslateblue": 0x483D8B,
+    "darkslategray": 0x2F4F4F,
+    "darkslategrey": 0x2F4F4F,
+    "darkturquoise": 0x00CED1,
+    "darkviolet": 0x9400D3,
+    "deeppink": 0xFF1493,
+    "deepskyblue": 0x00BFFF,
+    "dimgray": 0x696969,
+    "dimgrey": 0x696969,
+    "dodgerblue": 0x1E90FF,
+    "firebrick": 0xB22222,
+    "floralwhite": 0xFFFAF0,
+    "forestgreen": 0x228B22,
+    "fuchsia": 0xFF00FF,
+    "gainsboro": 0xDCDCDC,
+    "ghostwhite": 0xF8F8FF,
+    "gold": 0xFFD700,
+    "goldenrod": 0xDAA520,
+    "gray": 0x808080,
+    "grey": 0x808080,
+    "green": 0x008000,
+    "greenyellow": 0xADFF2F,
+    "honeydew": 0xF0FFF0,
+    "hotpink": 0xFF69B4,
+    "indianred": 0xCD5C5C,
+    "indigo": 0x4B0082,
+    "ivory": 0xFFFFF0,
+    "khaki": 0xF0E68C,
+    "lavender": 0xE6E6FA,
+    "lavenderblush": 0xFFF0F5,
+    "lawngreen": 0x7CFC00,
+    "lemonchiffon": 0xFFFACD,
+    "lightblue": 0xADD8E6,
+    "lightcoral": 0xF08080,
+    "lightcyan": 0xE0FFFF,
+    "lightgoldenrodyellow": 0xFAFAD2,
+    "lightgray": 0xD3D3D3,
+    "lightgrey": 0xD3D3D3,
+    "lightgreen": 0x90EE90,
+    "lightpink": 0xFFB6C1,
+    "lightsalmon": 0xFFA07A,
+    "lightseagreen": 0x20B2AA,
+    "lightskyblue": 0x87CEFA,
+    "lightslategray": 0x778899,
+    "lightslategrey": 0x778899,
+    "lightsteelblue": 0xB0C4DE,
+    "lightyellow": 0xFFFFE0,
+    "lime": 0x00FF00,
+    "limegreen": 0x32CD32,
+    "linen": 0xFAF0E6,
+    "magenta": 0xFF00FF,
+    "maroon": 0x800000,
+    "mediumaquamarine": 0x66CDAA,
+    "mediumblue": 0x0000CD,
+    "mediumorchid": 0xBA55D3,
+    "mediumpurple": 0x9370DB,
+    "mediumseagreen": 0x3CB371,
+    "mediumslateblue": 0x7B68EE,
+    "mediumspringgreen": 0x00FA9A,
+    "mediumturquoise": 0x48D1CC,
+    "mediumvioletred": 0xC71585,
+    "midnightblue": 0x191970,
+    "mintcream": 0xF5FFFA,
+    "mistyrose": 0xFFE4E1,
+    "moccasin": 0xFFE4B5,
+    "navajowhite": 0xFFDEAD,
+    "navy": 0x000080,
+    "oldlace": 0xFDF5E6,
+    "olive": 0x808000,
+    "olivedrab": 0x6B8E23,
+    "orange": 0xFFA500,
+    "orangered": 0xFF4500,
+    "orchid": 0xDA70D6,
+    "palegoldenrod": 0xEEE8AA,
+    "palegreen": 0x98FB98,
+    "paleturquoise": 0xAFEEEE,
+    "palevioletred": 0xDB7093,
+    "papayawhip": 0xFFEFD5,
+    "peachpuff": 0xFFDAB9,
+    "peru": 0xCD853F,
+    "pink": 0xFFC0CB,
+    "plum": 0xDDA0DD,
+    "powderblue": 0xB0E0E6,
+    "purple": 0x800080,
+    "red": 0xFF0000,
+    "rosybrown": 0xBC8F8F,
+    "royalblue": 0x4169E1,
+    "saddlebrown": 0x8B4513,
+    "salmon": 0xFA8072,
+    "sandybrown": 0xF4A460,
+    "seagreen": 0x2E8B57,
+    "seashell": 0xFFF5EE,
+    "sienna": 0xA0522D,
+    "silver": 0xC0C0C0,
+    "skyblue": 0x87CEEB,
+    "slateblue": 0x6A5ACD,
+    "slategray": 0x708090,
+    "slategrey": 0x708090,
+    "snow": 0xFFFAFA,
+    "springgreen": 0x00FF7F,
+    "steelblue": 0x4682B4,
+    "tan": 0xD2B48C,
+    "teal": 0x008080,
+    "thistle": 0xD8BFD8,
+    "tomato": 0xFF6347,
+    "turquoise": 0x40E0D0,
+    "violet": 0xEE82EE,
+    "wheat": 0xF5DEB3,
+    "white": 0xFFFFFF,
+    "whitesmoke": 0xF5F5F5,
+    "yellow": 0xFFFF00,
+    "yellowgreen": 0x9ACD32,
+}
+
+_CSS3_CASED_NAMES_TO_HEX = {
+    "aliceblue": "#f0f8ff",
+    "ALICEBLUE": "#f0f8ff",
+    "Aliceblue": "#f0f8ff",
+    "antiquewhite": "#faebd7",
+    "ANTIQUEWHITE": "#faebd7",
+    "Antiquewhite": "#faebd7",
+    "aqua": "#00ffff",
+    "AQUA": "#00ffff",
+    "Aqua": "#00ffff",
+    "aquamarine": "#7fffd4",
+    "AQUAMARINE": "#7fffd4",
+    "Aquamarine": "#7fffd4",
+    "azure": "#f0ffff",
+    "AZURE": "#f0ffff",
+    "Azure": "#f0ffff",
+    "beige": "#f5f5dc",
+    "BEIGE": "#f5f5dc",
+    "Beige": "#f5f5dc",
+    "bisque": "#ffe4c4",
+    "BISQUE": "#ffe4c4",
+    "Bisque": "#ffe4c4",
+    "black": "#000000",
+    "BLACK": "#000000",
+    "Black": "#000000",
+    "blanchedalmond": "#ffebcd",
+    "BLANCHEDALMOND": "#ffebcd",
+    "Blanchedalmond": "#ffebcd",
+    "blue": "#0000ff",
+    "BLUE": "#0000ff",
+    "Blue": "#0000ff",
+    "blueviolet": "#8a2be2",
+    "BLUEVIOLET": "#8a2be2",
+    "Blueviolet": "#8a2be2",
+    "brown": "#a52a2a",
+    "BROWN": "#a52a2a",
+    "Brown": "#a52a2a",
+    "burlywood": "#deb887",
+    "BURLYWOOD": "#deb887",
+    "Burlywood": "#deb887",
+    "cadetblue": "#5f9ea0",
+    "CADETBLUE": "#5f9ea0",
+    "Cadetblue": "#5f9ea0",
+    "chartreuse": "#7fff00",
+    "CHARTREUSE": "#7fff00",
+    "Chartreuse": "#7fff00",
+    "chocolate": "#d2691e",
+    "CHOCOLATE": "#d2691e",
+    "Chocolate": "#d2691e",
+    "coral": "#ff7f50",
+    "CORAL": "#ff7f50",
+    "Coral": "#ff7f50",
+    "cornflowerblue": "#6495ed",
+    "CORNFLOWERBLUE": "#6495ed",
+    "Cornflowerblue": "#6495ed",
+    "cornsilk": "#fff8dc",
+    "CORNSILK": "#fff8dc",
+    "Cornsilk": "#fff8dc",
+    "crimson": "#dc143c",
+    "CRIMSON": "#dc143c",
+    "Crimson": "#dc143c",
+    "cyan": "#00ffff",
+    "CYAN": "#00ffff",
+    "Cyan": "#00ffff",
+    "darkblue": "#00008b",
+    "DARKBLUE": "#00008b",
+    "Darkblue": "#00008b",
+    "darkcyan": "#008b8b",
+    "DARKCYAN": "#008b8b",
+    "Darkcyan": "#008b8b",
+    "darkgoldenrod": "#b8860b",
+    "DARKGOLDENROD": "#b8860b",
+    "Darkgoldenrod": "#b8860b",
+    "darkgray": "#a9a9a9",
+    "DARKGRAY": "#a9a9a9",
+    "Darkgray": "#a9a9a9",
+    "darkgrey": "#a9a9a9",
+    "DARKGREY": "#a9a9a9",
+    "Darkgrey": "#a9a9a9",
+    "darkgreen": "#006400",
+    "DARKGREEN": "#006400",
+    "Darkgreen": "#006400",
+    "darkkhaki": "#bdb76b",
+    "DARKKHAKI": "#bdb76b",
+    "Darkkhaki": "#bdb76b",
+    "darkmagenta": "#8b008b",
+    "DARKMAGENTA": "#8b008b",
+    "Darkmagenta": "#8b008b",
+    "darkolivegreen": "#556b2f",
+    "DARKOLIVEGREEN": "#556b2f",
+    "Darkolivegreen": "#556b2f",
+    "darkorange": "#ff8c00",
+    "DARKORANGE": "#ff8c00",
+    "Darkorange": "#ff8c00",
+    "darkorchid": "#9932cc",
+    "DARKORCHID": "#9932cc",
+    "Darkorchid": "#9932cc",
+    "darkred": "#8b0000",
+    "DARKRED": "#8b0000",
+    "Darkred": "#8b0000",
+    "darksalmon": "#e9967a",
+    "DARKSALMON": "#e9967a",
+    "Darksalmon": "#e9967a",
+    "darkseagreen": "#8fbc8f",
+    "DARKSEAGREEN": "#8fbc8f",
+    "Darkseagreen": "#8fbc8f",
+    "darkslateblue": "#483d8b",
+    "DARKSLATEBLUE": "#483d8b",
+    "Darkslateblue": "#483d8b",
+    "darkslategray": "#2f4f4f",
+    "DARKSLATEGRAY": "#2f4f4f",
+    "Darkslategray": "#2f4f4f",
+    "darkslategrey": "#2f4f4f",
+    "DARKSLATEGREY": "#2f4f4f",
+    "Darkslategrey": "#2f4f4f",
+    "darkturquoise": "#00ced1",
+    "DARKTURQUOISE": "#00ced1",
+    "Darkturquoise": "#00ced1",
+    "darkviolet": "#9400d3",
+    "DARKVIOLET": "#9400d3",
+    "Darkviolet": "#9400d3",
+    "deeppink": "#ff1493",
+    "DEEPPINK": "#ff1493",
+    "Deeppink": "#ff1493",
+    "deepskyblue": "#00bfff",
+    "DEEPSKYBLUE": "#00bfff",
+    "Deepskyblue": "#00bfff",
+    "dimgray": "#696969",
+    "DIMGRAY": "#696969",
+    "Dimgray": "#696969",
+    "dimgrey": "#696969",
+    "DIMGREY": "#696969",
+    "Dimgrey": "#696969",
+    "dodgerblue": "#1e90ff",
+    "DODGERBLUE": "#1e90ff",
+    "Dodgerblue": "#1e90ff",
+    "firebrick": "#b22222",
+    "FIREBRICK": "#b22222",
+    "Firebrick": "#b22222",
+    "floralwhite": "#fffaf0",
+    "FLORALWHITE": "#fffaf0",
+    "Floralwhite": "#fffaf0",
+    "forestgreen": "#228b22",
+    "FORESTGREEN": "#228b22",
+    "Forestgreen": "#228b22",
+    "fuchsia": "#ff00ff",
+    "FUCHSIA": "#ff00ff",
+    "Fuchsia": "#ff00ff",
+    "gainsboro": "#dcdcdc",
+    "GAINSBORO": "#dcdcdc",
+    "Gainsboro": "#dcdcdc",
+    "ghostwhite": "#f8f8ff",
+    "GHOSTWHITE": "#f8f8ff",
+    "Ghostwhite": "#f8f8ff",
+    "gold": "#ffd700",
+    "GOLD": "#ffd700",
+    "Gold": "#ffd700",
+    "goldenrod": "#daa520",
+    "GOLDENROD": "#daa520",
+    "Goldenrod": "#daa520",
+    "gray": "#808080",
+    "GRAY": "#808080",
+    "Gray": "#808080",
+    "grey": "#808080",
+    "GREY": "#808080",
+    "Grey": "#808080",
+    "green": "#008000",
+    "GREEN": "#008000",
+    "Green": "#008000",
+    "greenyellow": "#adff2f",
+    "GREENYELLOW": "#adff2f",
+    "Greenyellow": "#adff2f",
+    "honeydew": "#f0fff0",
+    "HONEYDEW": "#f0fff0",
+    "Honeydew": "#f0fff0",
+    "hotpink": "#ff69b4",
+    "HOTPINK": "#ff69b4",
+    "Hotpink": "#ff69b4",
+    "indianred": "#cd5c5c",
+    "INDIANRED": "#cd5c5c",
+    "Indianred": "#cd5c5c",
+    "indigo": "#4b0082",
+    "INDIGO": "#4b0082",
+    "Indigo": "#4b0082",
+    "ivory": "#fffff0",
+    "IVORY": "#fffff0",
+    "Ivory": "#fffff0",
+    "khaki": "#f0e68c",
+    "KHAKI": "#f0e68c",
+    "Khaki": "#f0e68c",
+    "lavender": "#e6e6fa",
+    "LAVENDER": "#e6e6fa",
+    "Lavender": "#e6e6fa",
+    "lavenderblush": "#fff0f5",
+    "LAVENDERBLUSH": "#fff0f5",
+    "Lavenderblush": "#fff0f5",
+    "lawngreen": "#7cfc00",
+    "LAWNGREEN": "#7cfc00",
+    "Lawngreen": "#7cfc00",
+    "lemonchiffon": "#fffacd",
+    "LEMONCHIFFON": "#fffacd",
+    "Lemonchiffon": "#fffacd",
+    "lightblue": "#add8e6",
+    "LIGHTBLUE": "#add8e6",
+    "Lightblue": "#add8e6",
+    "lightcoral": "#f08080",
+    "LIGHTCORAL": "#f08080",
+    "Lightcoral": "#f08080",
+    "lightcyan": "#e0ffff",
+    "LIGHTCYAN": "#e0ffff",
+    "Lightcyan": "#e0ffff",
+    "lightgoldenrodyellow": "#fafad2",
+    "LIGHTGOLDENRODYELLOW": "#fafad2",
+    "Lightgoldenrodyellow": "#fafad2",
+    "lightgray": "#d3d3d3",
+    "LIGHTGRAY": "#d3d3d3",
+    "Lightgray": "#d3d3d3",
+    "lightgrey": "#d3d3d3",
+    "LIGHTGREY": "#d3d3d3",
+    "Lightgrey": "#d3d3d3",
+    "lightgreen": "#90ee90",
+    "LIGHTGREEN": "#90ee90",
+    "Lightgreen": "#90ee90",
+    "lightpink": "#ffb6c1",
+    "LIGHTPINK": "#ffb6c1",
+    "Lightpink": "#ffb6c1",
+    "lightsalmon": "#ffa07a",
+    "LIGHTSALMON": "#ffa07a",
+    "Lightsalmon": "#ffa07a",
+    "lightseagreen": "#20b2aa",
+    "LIGHTSEAGREEN": "#20b2aa",
+    "Lightseagreen": "#20b2aa",
+    "lightskyblue": "#87cefa",
+    "LIGHTSKYBLUE": "#87cefa",
+    "Lightskyblue": "#87cefa",
+    "lightslategray": "#778899",
+    "LIGHTSLATEGRAY": "#778899",
+    "Lightslategray": "#778899",
+    "lightslategrey": "#778899",
+    "LIGHTSLATEGREY": "#778899",
+    "Lightslategrey": "#778899",
+    "lightsteelblue": "#b0c4de",
+    "LIGHTSTEELBLUE": "#b0c4de",
+    "Lightsteelblue": "#b0c4de",
+    "lightyellow": "#ffffe0",
+    "LIGHTYELLOW": "#ffffe0",
+    "Lightyellow": "#ffffe0",
+    "lime": "#00ff00",
+    "LIME": "#00ff00",
+    "Lime": "#00ff00",
+    "limegreen": "#32cd32",
+    "LIMEGREEN": "#32cd32",
+    "Limegreen": "#32cd32",
+    "linen": "#faf0e6",
+    "LINEN": "#faf0e6",
+    "Linen": "#faf0e6",
+    "magenta": "#ff00ff",
+    "MAGENTA": "#ff00ff",
+    "Magenta": "#ff00ff",
+    "maroon": "#800000",
+    "MAROON": "#800000",
+    "Maroon": "#800000",
+    "mediumaquamarine": "#66cdaa",
+    "MEDIUMAQUAMARINE": "#66cdaa",
+    "Mediumaquamarine": "#66cdaa",
+    "mediumblue": "#0000cd",
+    "MEDIUMBLUE": "#0000cd",
+    "Mediumblue": "#0000cd",
+    "mediumorchid": "#ba55d3",
+    "MEDIUMORCHID": "#ba55d3",
+    "Mediumorchid": "#ba55d3",
+    "mediumpurple": "#9370db",
+    "MEDIUMPURPLE": "#9370db",
+    "Mediumpurple": "#9370db",
+    "mediumseagreen": "#3cb371",
+    "MEDIUMSEAGREEN": "#3cb371",
+    "Mediumseagreen": "#3cb371",
+    "mediumslateblue": "#7b68ee",
+    "MEDIUMSLATEBLUE": "#7b68ee",
+    "Mediumslateblue": "#7b68ee",
+    "mediumspringgreen": "#00fa9a",
+    "MEDIUMSPRINGGREEN": "#00fa9a",
+    "Mediumspringgreen": "#00fa9a",
+    "mediumturquoise": "#48d1cc",
+    "MEDIUMTURQUOISE": "#48d1cc",
+    "Mediumturquoise": "#48d1cc",
+    "mediumvioletred": "#c71585",
+    "MEDIUMVIOLETRED": "#c71585",
+    "Mediumvioletred": "#c71585",
+    "midnightblue": "#191970",
+    "MIDNIGHTBLUE": "#191970",
+    "Midnightblue": "#191970",
+    "mintcream": "#f5fffa",
+    "MINTCREAM": "#f5fffa",
+    "Mintcream": "#f5fffa",
+    "mistyrose": "#ffe4e1",
+    "MISTYROSE": "#ffe4e1",
+    "Mistyrose": "#ffe4e1",
+    "moccasin": "#ffe4b5",
+    "MOCCASIN": "#ffe4b5",
+    "Moccasin": "#ffe4b5",
+    "navajowhite": "#ffdead",
+    "NAVAJOWHITE": "#ffdead",
+    "Navajowhite": "#ffdead",
+    "navy": "#000080",
+    "NAVY": "#000080",
+    "Navy": "#000080",
+    "oldlace": "#fdf5e6",
+    "OLDLACE": "#fdf5e6",
+    "Oldlace": "#fdf5e6",
+    "olive": "#808000",
+    "OLIVE": "#808000",
+    "Olive": "#808000",
+    "olivedrab": "#6b8e23",
+    "OLIVEDRAB": "#6b8e23",
+    "Olivedrab": "#6b8e23",
+    "orange": "#ffa500",
+    "ORANGE": "#ffa500",
+    "Orange": "#ffa500",
+    "orangered": "#ff4500",
+    "ORANGERED": "#ff4500",
+    "Orangered": "#ff4500",
+    "orchid": "#da70d6",
+    "ORCHID": "#da70d6",
+    "Orchid": "#da70d6",
+    "palegoldenrod": "#eee8aa",
+    "PALEGOLDENROD": "#eee8aa",
+    "Palegoldenrod": "#eee8aa",
+    "palegreen": "#98fb98",
+    "PALEGREEN": "#98fb98",
+    "Palegreen": "#98fb98",
+    "paleturquoise": "#afeeee",
+    "PALETURQUOISE": "#afeeee",
+    "Paleturquoise": "#afeeee",
+    "palevioletred": "#db7093",
+    "PALEVIOLETRED": "#db7093",
+    "Palevioletred": "#db7093",
+    "papayawhip": "#ffefd5",
+    "PAPAYAWHIP": "#ffefd5",
+    "Papayawhip": "#ffefd5",
+    "peachpuff": "#ffdab9",
+    "PEACHPUFF": "#ffdab9",
+    "Peachpuff": "#ffdab9",
+    "peru": "#cd853f",
+    "PERU": "#cd853f",
+    "Peru": "#cd853f",
+    "pink": "#ffc0cb",
+    "PINK": "#ffc0cb",
+    "Pink": "#ffc0cb",
+    "plum": "#dda0dd",
+    "PLUM": "#dda0dd",
+    "Plum": "#dda0dd",
+    "powderblue": "#b0e0e6",
+    "POWDERBLUE": "#b0e0e6",
+    "Powderblue": "#b0e0e6",
+    "purple": "#800080",
+    "PURPLE": "#800080",
+    "Purple": "#800080",
+    "red": "#ff0000",
+    "RED": "#ff0000",
+    "Red": "#ff0000",
+    "rosybrown": "#bc8f8f",
+    "ROSYBROWN": "#bc8f8f",
+    "Rosybrown": "#bc8f8f",
+    "royalblue": "#4169e1",
+    "ROYALBLUE": "#4169e1",
+    "Royalblue": "#4169e1",
+    "saddlebrown": "#8b4513",
+    "SADDLEBROWN": "#8b4513",
+    "Saddlebrown": "#8b4513",
+    "salmon": "#fa8072",
+    "SALMON": "#fa8072",
+    "Salmon": "#fa8072",
+    "sandybrown": "#f4a460",
+    "SANDYBROWN": "#f4a460",
+    "Sandybrown": "#f4a460",
+    "seagreen": "#2e8b57",
+    "SEAGREEN": "#2e8b57",
+    "Seagreen": "#2e8b57",
+    "seashell": "#fff5ee",
+    "SEASHELL": "#fff5ee",
+    "Seashell": "#fff5ee",
+    "sienna": "#a0522d",
+    "SIENNA": "#a0522d",
+    "Sienna": "#a0522d",
+    "silver": "#c0c0c0",
+    "SILVER": "#c0c0c0",
+    "Silver": "#c0c0c0",
+    "skyblue": "#87ceeb",
+    "SKYBLUE": "#87ceeb",
+    "Skyblue": "#87ceeb",
+    "slateblue": "#6a5acd",
+    "SLATEBLUE": "#6a5acd",
+    "Slateblue": "#6a5acd",
+    "slategray": "#708090",
+    "SLATEGRAY": "#708090",
+    "Slategray": "#708090",
+    "slategrey": "#708090",
+    "SLATEGREY": "#708090",
+    "Slategrey": "#708090",
+    "snow": "#fffafa",
+    "SNOW": "#fffafa",
+    "Snow": "#fffafa",
+    "springgreen": "#00ff7f",
+    "SPRINGGREEN": "#00ff7f",
+    "Springgreen": "#00ff7f",
+    "steelblue": "#4682b4",
+    "STEELBLUE": "#4682b4",
+    "Steelblue": "#4682b4",
+    "tan": "#d2b48c",
+    "TAN": "#d2b48c",
+    "Tan": "#d2b48c",
+    "teal": "#008080",
+    "TEAL": "#008080",
+    "Teal": "#008080",
+    "thistle": "#d8bfd8",
+    "THISTLE": "#d8bfd8",
+    "Thistle": "#d8bfd8",
+    "tomato": "#ff6347",
+    "TOMATO": "#ff6347",
+    "Tomato": "#ff6347",
+    "turquoise": "#40e0d0",
+    "TURQUOISE": "#40e0d0",
+    "Turquoise": "#40e0d0",
+    "violet": "#ee82ee",
+    "VIOLET": "#ee82ee",
+    "Violet": "#ee82ee",
+    "wheat": "#f5deb3",
+    "WHEAT": "#f5deb3",
+    "Wheat": "#f5deb3",
+    "white": "#ffffff",
+    "WHITE": "#ffffff",
+    "White": "#ffffff",
+    "whitesmoke": "#f5f5f5",
+    "WHITESMOKE": "#f5f5f5",
+    "Whitesmoke": "#f5f5f5",
+    "yellow": "#ffff00",
+    "YELLOW": "#ffff00",
+    "Yellow": "#ffff00",
+    "yellowgreen": "#9acd32",
+    "YELLOWGREEN": "#9acd32",
+    "Yellowgreen": "#9acd32",
+}
+
+_CSS3_PACKED_TO_NAMES = {
+    0xF0F8FF: "aliceblue",
+    0xFAEBD7: "antiquewhite",
+    0x00FFFF: "cyan",
+    0x7FFFD4: "aquamarine",
+    0xF0FFFF: "azure",
+    0xF5F5DC: "beige",
+    0xFFE4C4: "bisque",
+    0x000000: "black",
+    0xFFEBCD: "blanchedalmond",
+    0x0000FF: "blue",
+    0x8A2BE2: "blueviolet",
+    0xA52A2A: "brown",
+    0xDEB887: "burlywood",
+    0x5F9EA0: "cadetblue",
+    0x7FFF00: "chartreuse",
+    0xD2691E: "chocolate",
+    0xFF7F50: "coral",
+    0x6495ED: "cornflowerblue",
+    0xFFF8DC: "cornsilk",
+    0xDC143C: "crimson",
+    0x00008B: "darkblue",
+    0x008B8B: "darkcyan",
+    0xB8860B: "darkgoldenrod",
+    0xA9A9A9: "darkgray",
+    0x006400: "darkgreen",
+    0xBDB76B: "darkkhaki",
+    0x8B008B: "darkmagenta",
+    0x556B2F: "darkolivegreen",
+    0xFF8C00: "darkorange",
+    0x9932CC: "darkorchid",
+    0x8B0000: "darkred",
+    0xE9967A: "darksalmon",
+    0x8FBC8F: "darkseagreen",
+    0x483D8B: "darkslateblue",
+    0x2F4F4F: "darkslategray",
+    0x00CED1: "darkturquoise",
+    0x9400D3: "darkviolet",
+    0xFF1493: "deeppink",
+    0x00BFFF: "deepskyblue",
+    0x696969: "dimgray",
+    0x1E90FF: "dodgerblue",
+    0xB22222: "firebrick",
+    0xFFFAF0: "floralwhite",
+    0x228B22: "forestgreen",
+    0xFF00FF: "magenta",
+    0xDCDCDC: "gainsboro",
+    0xF8F8FF: "ghostwhite",
+    0xFFD700: "gold",
+    0xDAA520: "goldenrod",
+    0x808080: "gray",
+    0x008000: "green",
+    0xADFF2F: "greenyellow",
+    0xF0FFF0: "honeydew",
+    0xFF69B4: "hotpink",
+    0xCD5C5C: "indianred",
+    0x4B0082: "indigo",
+    0xFFFFF0: "ivory",
+    0xF0E68C: "khaki",
+    0xE6E6FA: "lavender",
+    0xFFF0F5: "lavenderblush",
+    0x7CFC00: "lawngreen",
+    0xFFFACD: "lemonchiffon",
+    0xADD8E6: "lightblue",
+    0xF08080: "lightcoral",
+    0xE0FFFF: "lightcyan",
+    0xFAFAD2: "lightgoldenrodyellow",
+    0xD3D3D3: "lightgray",
+    0x90EE90: "lightgreen",
+    0xFFB6C1: "lightpink",
+    0xFFA07A: "lightsalmon",
+    0x20B2AA: "lightseagreen",
+    0x87CEFA: "lightskyblue",
+    0x778899: "lightslategray",
+    0xB0C4DE: "lightsteelblue",
+    0xFFFFE0: "lightyellow",
+    0x00FF00: "lime",
+    0x32CD32: "limegreen",
+    0xFAF0E6: "linen",
+    0x800000: "maroon",
+    0x66CDAA: "mediumaquamarine",
+    0x0000CD: "mediumblue",
+    0xBA55D3: "mediumorchid",
+    0x9370DB: "mediumpurple",
+    0x3CB371: "mediumseagreen",
+    0x7B68EE: "mediumslateblue",
+    0x00FA9A: "mediumspringgreen",
+    0x48D1CC: "mediumturquoise",
+    0xC71585: "mediumvioletred",
+    0x191970: "midnightblue",
+    0xF5FFFA: "mintcream",
+    0xFFE4E1: "mistyrose",
+    0xFFE4B5: "moccasin",
+    0xFFDEAD: "navajowhite",
+    0x000080: "navy",
+    0xFDF5E6: "oldlace",
+    0x808000: "olive",
+    0x6B8E23: "olivedrab",
+    0xFFA500: "orange",
+    0xFF4500: "orangered",
+    0xDA70D6: "orchid",
+    0xEEE8AA: "palegoldenrod",
+    0x98FB98: "palegreen",
+    0xAFEEEE: "paleturquoise",
+    0xDB7093: "palevioletred",
+    0xFFEFD5: "papayawhip",
+    0xFFDAB9: "peachpuff",
+    0xCD853F: "peru",
+    0xFFC0CB: "pink",
+    0xDDA0DD: "plum",
+    0xB0E0E6: "powderblue",
+    0x800080: "purple",
+    0xFF0000: "red",
+    0xBC8F8F: "rosybrown",
+    0x4169E1: "royalblue",
+    0x8B4513: "saddlebrown",
+    0xFA8072: "salmon",
+    0xF4A460: "sandybrown",
+    0x2E8B57: "seagreen",
+    0xFFF5EE: "seashell",
+    0xA0522D: "sienna",
+    0xC0C0C0: "silver",
+    0x87CEEB: "skyblue",
+    0x6A5ACD: "slateblue",
+    0x708090: "slategray",
+    0xFFFAFA: "snow",
+    0x00FF7F: "springgreen",
+    0x4682B4: "steelblue",
+    0xD2B48C: "tan",
+    0x008080: "teal",
+    0xD8BFD8: "thistle",
+    0xFF6347: "tomato",
+    0x40E0D0: "turquoise",
+    0xEE82EE: "violet",
+    0xF5DEB3: "wheat",
+    0xFFFFFF: "white",
+    0xF5F5F5: "whitesmoke",
+    0xFFFF00: "yellow",
+    0x9ACD32: "yellowgreen",
+}
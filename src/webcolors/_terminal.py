@@ -0,0 +1,321 @@
+"""
+Conversion between colors and the indexes of the 16- and 256-color palettes of xterm
+and compatible terminals.
+
+"""
+
+# SPDX-License-Identifier: BSD-3-Clause
+
+from ._nearest import _name_indexes, _shape_indexes
+from ._normalization import _as_byte_view, normalize_integer_triplet
+from ._types import IntegerRGB, IntTuple
+
+# The default colors of xterm's 16 system colors: the eight normal colors, followed by
+# their eight bright variants.
+_SYSTEM_COLORS = (
+    (0, 0, 0),
+    (205, 0, 0),
+    (0, 205, 0),
+    (205, 205, 0),
+    (0, 0, 238),
+    (205, 0, 205),
+    (0, 205, 205),
+    (229, 229, 229),
+    (127, 127, 127),
+    (255, 0, 0),
+    (0, 255, 0),
+    (255, 255, 0),
+    (92, 92, 255),
+    (255, 0, 255),
+    (0, 255, 255),
+    (255, 255, 255),
+)
+
+# Indexes 16-231 form a 6x6x6 color cube with these levels per channel, and indexes
+# 232-255 a ramp of 24 grays, from 8 to 238 in steps of 10.
+_CUBE_LEVELS = (0, 95, 135, 175, 215, 255)
+_CUBE_START = 16
+_GRAY_START = 232
+_GRAY_COUNT = 24
+
+
+def _gray_level(step: int) -> int:
+    """
+    Internal helper returning the channel value of the given step of the gray ramp.
+
+    """
+    return 8 + 10 * step
+
+
+# The full palette, as integer rgb() triplets and as hexadecimal color values.
+_XTERM_COLORS = tuple(
+    IntegerRGB(*triplet)
+    for triplet in _SYSTEM_COLORS
+    + tuple(
+        (red, green, blue)
+        for red in _CUBE_LEVELS
+        for green in _CUBE_LEVELS
+        for blue in _CUBE_LEVELS
+    )
+    + tuple((_gray_level(step),) * 3 for step in range(_GRAY_COUNT))
+)
+_XTERM_HEX = tuple(
+    f"#{red:02x}{green:02x}{blue:02x}" for red, green, blue in _XTERM_COLORS
+)
+_XTERM_BYTES = tuple(bytes(color) for color in _XTERM_COLORS)
+
+# Since the color cube is the product of its per-channel levels, the nearest cube
+# color to any color is made of the nearest level to each of its channels; these are
+# the offsets in the cube of the nearest level to each channel value, with ties going
+# to the lower level.
+_CUBE_RED = tuple(
+    36 * min(range(6), key=lambda level: abs(value - _CUBE_LEVELS[level]))
+    for value in range(256)
+)
+_CUBE_GREEN = tuple(offset // 6 for offset in _CUBE_RED)
+_CUBE_BLUE = tuple(offset // 36 for offset in _CUBE_RED)
+
+# The squared distance of each channel value from its nearest cube level.
+_CUBE_ERROR = tuple(
+    (value - _CUBE_LEVELS[offset // 36]) ** 2 for value, offset in enumerate(_CUBE_RED)
+)
+
+# The nearest gray to any color is the one nearest to the mean of its channels; these
+# are the steps of the ramp nearest to each possible sum of the three channels, with
+# ties going to the lower step.
+_GRAY_STEPS = tuple(
+    min(range(_GRAY_COUNT), key=lambda step: abs(3 * _gray_level(step) - total))
+    for total in range(3 * 255 + 1)
+)
+
+# For each channel and each channel value, the squared distance of the value from the
+# corresponding channel of each of the system colors.
+_SYSTEM_ERRORS = tuple(
+    tuple(
+        tuple((value - color[channel]) ** 2 for color in _SYSTEM_COLORS)
+        for value in range(256)
+    )
+    for channel in range(3)
+)
+
+
+def _xterm256_index(red: int, green: int, blue: int) -> int:
+    """
+    Internal helper returning the index of the nearest of the colors of the color cube
+    and gray ramp of the 256-color palette to the given color.
+
+    """
+    cube_distance = _CUBE_ERROR[red] + _CUBE_ERROR[green] + _CUBE_ERROR[blue]
+    step = _GRAY_STEPS[red + green + blue]
+    level = _gray_level(step)
+    gray_distance = (red - level) ** 2 + (green - level) ** 2 + (blue - level) ** 2
+    if gray_distance < cube_distance:
+        return _GRAY_START + step
+    return _CUBE_START + _CUBE_RED[red] + _CUBE_GREEN[green] + _CUBE_BLUE[blue]
+
+
+def _xterm16_index(red: int, green: int, blue: int) -> int:
+    """
+    Internal helper returning the index of the nearest of the 16 system colors to the
+    given color.
+
+    """
+    distances = [
+        first + second + third
+        for first, second, third in zip(
+            _SYSTEM_ERRORS[0][red], _SYSTEM_ERRORS[1][green], _SYSTEM_ERRORS[2][blue]
+        )
+    ]
+    return distances.index(min(distances))
+
+
+def rgb_to_xterm256(rgb_triplet: IntTuple) -> int:
+    """
+    Convert a 3-:class:`tuple` of :class:`int`, suitable for use in an ``rgb()``
+    color triplet, to the index of the nearest color in the 256-color palette of xterm
+    and compatible terminals, for use in escape sequences such as ``ESC[38;5;<n>m``.
+
+    The result is drawn from the 6x6x6 color cube (indexes 16-231) and the ramp of
+    grays (indexes 232-255) of the palette. The 16 system colors (indexes 0-15) are
+    never chosen, since terminals commonly let users redefine them; use
+    :func:`rgb_to_xterm16` to convert to those.
+
+    Distance between colors is Euclidean distance in RGB space, and when two colors
+    are equally near, the one with the lower index is chosen. The conversion is made
+    from precomputed per-channel tables, without searching the palette.
+
+    Examples:
+
+    .. doctest::
+
+        >>> rgb_to_xterm256((255, 0, 0))
+        196
+        >>> rgb_to_xterm256(hex_to_rgb("#daa520"))
+        178
+        >>> rgb_to_xterm256((128, 128, 128))
+        244
+
+    :param rgb_triplet: The ``rgb()`` triplet.
+
+    """
+    return _xterm256_index(*normalize_integer_triplet(rgb_triplet))
+
+
+def rgb_to_xterm16(rgb_triplet: IntTuple) -> int:
+    """
+    Convert a 3-:class:`tuple` of :class:`int`, suitable for use in an ``rgb()``
+    color triplet, to the index of the nearest of the 16 system colors of xterm and
+    compatible terminals, taking those to have xterm's default values.
+
+    Indexes 0-7 are the normal colors, used in escape sequences such as
+    ``ESC[30m``-``ESC[37m``, and indexes 8-15 their bright variants, used in
+    ``ESC[90m``-``ESC[97m``. Distance and ties are as for :func:`rgb_to_xterm256`.
+
+    Examples:
+
+    .. doctest::
+
+        >>> rgb_to_xterm16((255, 0, 0))
+        9
+        >>> rgb_to_xterm16(hex_to_rgb("#000080"))
+        4
+
+    :param rgb_triplet: The ``rgb()`` triplet.
+
+    """
+    return _xterm16_index(*normalize_integer_triplet(rgb_triplet))
+
+
+def _check_xterm_index(index: int) -> None:
+    """
+    Internal helper checking that an index is within the 256-color palette.
+
+    :raises ValueError: when the index is not between 0 and 255 inclusive.
+
+    """
+    if not 0 <= index < len(_XTERM_COLORS):
+        raise ValueError(
+            f"{index} is not a valid xterm color index; indexes are between 0 and 255."
+        )
+
+
+def xterm_to_hex(index: int) -> str:
+    """
+    Convert an index of the 256-color palette of xterm and compatible terminals to a
+    normalized hexadecimal color value, taking the 16 system colors to have xterm's
+    default values.
+
+    Examples:
+
+    .. doctest::
+
+        >>> xterm_to_hex(196)
+        '#ff0000'
+        >>> xterm_to_hex(244)
+        '#808080'
+        >>> xterm_to_hex(4)
+        '#0000ee'
+
+    :param index: The index of the color.
+    :raises ValueError: when the index is not between 0 and 255 inclusive.
+
+    """
+    _check_xterm_index(index)
+    return _XTERM_HEX[index]
+
+
+def xterm_to_rgb(index: int) -> IntegerRGB:
+    """
+    Convert an index of the 256-color palette of xterm and compatible terminals to its
+    equivalent 3-:class:`tuple` of :class:`int`, suitable for use in an ``rgb()``
+    triplet, as for :func:`xterm_to_hex`.
+
+    Examples:
+
+    .. doctest::
+
+        >>> xterm_to_rgb(178)
+        IntegerRGB(red=215, green=175, blue=0)
+
+    :param index: The index of the color.
+    :raises ValueError: when the index is not between 0 and 255 inclusive.
+
+    """
+    _check_xterm_index(index)
+    return _XTERM_COLORS[index]
+
+
+def rgb_buffer_to_xterm256(rgb_buffer, channels: int = 3) -> memoryview:
+    """
+    Convert every pixel of a buffer of packed 8-bit RGB or RGBA colors to the index of
+    the nearest color in the 256-color palette, as chosen by :func:`rgb_to_xterm256`.
+
+    The input is read in place, and the result shaped, as described for
+    :func:`rgb_buffer_to_name_indexes`.
+
+    Examples:
+
+    .. doctest::
+
+        >>> rgb_buffer_to_xterm256(bytes([255, 0, 0, 128, 128, 128])).tolist()
+        [196, 244]
+
+    :param rgb_buffer: The buffer of colors.
+    :param channels: The number of bytes per pixel: 3 for RGB, or 4 for RGBA. Default
+       is 3.
+    :raises ValueError: when the buffer is not a contiguous buffer of bytes whose
+       length is a multiple of ``channels``, or when ``channels`` is not 3 or 4.
+
+    """
+    return _shape_indexes(
+        _name_indexes(rgb_buffer, _xterm256_index, channels), rgb_buffer, channels
+    )
+
+
+def rgb_buffer_to_xterm16(rgb_buffer, channels: int = 3) -> memoryview:
+    """
+    Convert every pixel of a buffer of packed 8-bit RGB or RGBA colors to the index of
+    the nearest of the 16 system colors, as chosen by :func:`rgb_to_xterm16`.
+
+    The input is read in place, and the result shaped, as described for
+    :func:`rgb_buffer_to_name_indexes`.
+
+    Examples:
+
+    .. doctest::
+
+        >>> rgb_buffer_to_xterm16(bytes([255, 0, 0, 0, 0, 128])).tolist()
+        [9, 4]
+
+    :param rgb_buffer: The buffer of colors.
+    :param channels: The number of bytes per pixel: 3 for RGB, or 4 for RGBA. Default
+       is 3.
+    :raises ValueError: when the buffer is not a contiguous buffer of bytes whose
+       length is a multiple of ``channels``, or when ``channels`` is not 3 or 4.
+
+    """
+    return _shape_indexes(
+        _name_indexes(rgb_buffer, _xterm16_index, channels), rgb_buffer, channels
+    )
+
+
+def xterm_buffer_to_rgb(index_buffer) -> bytearray:
+    """
+    Convert every index of a buffer of indexes of the 256-color palette, one byte
+    each, to its color, as for :func:`xterm_to_rgb`, returning a :class:`bytearray` of
+    packed 8-bit RGB colors, three bytes per color.
+
+    Examples:
+
+    .. doctest::
+
+        >>> list(xterm_buffer_to_rgb(bytes([196, 4])))
+        [255, 0, 0, 0, 0, 238]
+
+    :param index_buffer: The buffer of indexes.
+    :raises ValueError: when the buffer is not a contiguous buffer of bytes.
+
+    """
+    return bytearray(
+        b"".join(map(_XTERM_BYTES.__getitem__, _as_byte_view(index_buffer, 1)))
+    )
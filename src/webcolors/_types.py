@@ -6,6 +6,7 @@ Types and type aliases used to represent colors in various formats.
 # SPDX-License-Identifier: BSD-3-Clause
 
 import typing
+from array import array
 
 
 class IntegerRGB(typing.NamedTuple):
@@ -84,8 +85,292 @@ class HTML5SimpleColor(typing.NamedTuple):
     blue: int
 
 
+class HSL(typing.NamedTuple):
+    """
+    :class:`~typing.NamedTuple` representing a color in the HSL (hue, saturation,
+    lightness) form used by the CSS ``hsl()`` function.
+
+    Has three fields, each of type :class:`float`:
+
+    .. attribute:: hue
+
+       The hue angle of the color, in degrees, in the range 0-360 (exclusive of 360).
+
+    .. attribute:: saturation
+
+       The saturation of the color, as a percentage in the range 0-100 inclusive.
+
+    .. attribute:: lightness
+
+       The lightness of the color, as a percentage in the range 0-100 inclusive.
+
+    """
+
+    hue: float
+    saturation: float
+    lightness: float
+
+
+class HWB(typing.NamedTuple):
+    """
+    :class:`~typing.NamedTuple` representing a color in the HWB (hue, whiteness,
+    blackness) form used by the CSS ``hwb()`` function.
+
+    Has three fields, each of type :class:`float`:
+
+    .. attribute:: hue
+
+       The hue angle of the color, in degrees, in the range 0-360 (exclusive of 360).
+
+    .. attribute:: whiteness
+
+       The amount of white mixed into the color, as a percentage in the range 0-100
+       inclusive.
+
+    .. attribute:: blackness
+
+       The amount of black mixed into the color, as a percentage in the range 0-100
+       inclusive.
+
+    """
+
+    hue: float
+    whiteness: float
+    blackness: float
+
+
+class NameCount(typing.NamedTuple):
+    """
+    :class:`~typing.NamedTuple` representing the number of times a named color was
+    counted.
+
+    .. attribute:: name
+
+       The normalized name of the color, as a :class:`str`.
+
+    .. attribute:: hex
+
+       The normalized hexadecimal value of the color, as a :class:`str`.
+
+    .. attribute:: count
+
+       The number of times the color was counted, as an :class:`int`.
+
+    """
+
+    name: str
+    hex: str
+    count: int
+
+
+class NameDistance(typing.NamedTuple):
+    """
+    :class:`~typing.NamedTuple` representing a named color and its distance from some
+    other color.
+
+    .. attribute:: name
+
+       The normalized name of the color, as a :class:`str`.
+
+    .. attribute:: distance
+
+       The distance between the named color and the other color, as a :class:`float`.
+
+    """
+
+    name: str
+    distance: float
+
+
+class ColorBuffers(typing.NamedTuple):
+    """
+    :class:`~typing.NamedTuple` representing a column of converted colors as raw
+    buffers, in the layout of an Apache Arrow array.
+
+    .. attribute:: values
+
+       The buffer of converted values, with one entry per row of the column.
+
+    .. attribute:: validity
+
+       The validity bitmap of the column, as a :class:`bytearray` in which bit ``i``
+       (counting from the least-significant bit of the first byte) is set when row
+       ``i`` holds a valid color.
+
+    .. attribute:: null_count
+
+       The number of rows which do not hold a valid color, as an :class:`int`.
+
+    """
+
+    values: typing.Union[bytearray, array]
+    validity: bytearray
+    null_count: int
+
+
+class DecodedRecords(typing.NamedTuple):
+    """
+    :class:`~typing.NamedTuple` representing the colors decoded from a sequence of
+    fixed-width records of hexadecimal color values.
+
+    .. attribute:: values
+
+       The decoded colors, as a :class:`bytearray` of packed 8-bit RGB colors, three
+       bytes per record. Records which do not hold a valid color are decoded as black.
+
+    .. attribute:: invalid
+
+       The positions of the records which do not hold a valid color, in ascending
+       order, as an :class:`array.array` of unsigned 64-bit integers (typecode
+       ``"Q"``). The byte offset of a record is its position multiplied by the record
+       size.
+
+    """
+
+    values: bytearray
+    invalid: array
+
+
+class Factorized(typing.NamedTuple):
+    """
+    :class:`~typing.NamedTuple` representing a column of values factorized into its
+    distinct values and codes, as returned by :func:`factorize`.
+
+    .. attribute:: uniques
+
+       The distinct values of the column, in order of first appearance, as a
+       :class:`list`.
+
+    .. attribute:: codes
+
+       The position among :attr:`uniques` of the value of each row of the column, as
+       an :class:`array.array` of unsigned 32-bit integers (typecode ``"I"``).
+
+    """
+
+    uniques: list
+    codes: array
+
+
+class ConversionErrors(typing.NamedTuple):
+    """
+    :class:`~typing.NamedTuple` representing the values which failed to convert in a
+    batch conversion, such as :func:`hex_to_rgb_batch`.
+
+    Each error is described by the entries at the same position of the three
+    sequences below. Its message -- the message of the :exc:`ValueError` which
+    converting the value alone would have raised -- is only formatted on request, by
+    :meth:`message` or :meth:`messages`.
+
+    .. attribute:: indexes
+
+       The positions within the batch of the values which failed to convert, in
+       ascending order, as an :class:`array.array` of unsigned 64-bit integers
+       (typecode ``"Q"``).
+
+    .. attribute:: codes
+
+       The code of each error, as a :class:`bytes` holding one of the codes below per
+       error.
+
+    .. attribute:: values
+
+       The value which failed to convert, for each error, as a :class:`list`.
+
+    .. attribute:: spec
+
+       The specification from which color names were drawn, or :data:`None` if the
+       conversion did not involve color names.
+
+    .. attribute:: INVALID_HEX
+
+       The code of a value which is not a valid hexadecimal color value.
+
+    .. attribute:: UNDEFINED_NAME
+
+       The code of a name which is not defined as a named color in the specification.
+
+    .. attribute:: NO_NAME
+
+       The code of a color which has no defined name in the specification.
+
+    .. attribute:: NOT_A_STRING
+
+       The code of a value which is not a :class:`str`, such as :data:`None` or a
+       floating-point NaN marking a missing value.
+
+    """
+
+    indexes: array
+    codes: bytes
+    values: list
+    spec: typing.Optional[str]
+
+    INVALID_HEX = 1
+    UNDEFINED_NAME = 2
+    NO_NAME = 3
+    NOT_A_STRING = 4
+
+    def message(self, position: int) -> str:
+        """
+        Format the message of the error at the given position among the errors (not
+        within the batch).
+
+        """
+        return _ERROR_MESSAGES[self.codes[position]].format(
+            value=self.values[position], spec=self.spec
+        )
+
+    def messages(self) -> typing.Iterator[typing.Tuple[int, str]]:
+        """
+        Lazily format the message of each error in turn, yielding the position within
+        the batch of the value which failed to convert, and the message.
+
+        """
+        for position, index in enumerate(self.indexes):
+            yield index, self.message(position)
+
+
+# The message of each code of ConversionErrors, matching the messages of the
+# exceptions raised by the functions converting single values.
+_ERROR_MESSAGES = {
+    ConversionErrors.INVALID_HEX: '"{value}" is not a valid hexadecimal color value.',
+    ConversionErrors.UNDEFINED_NAME: (
+        '"{value}" is not defined as a named color in {spec}'
+    ),
+    ConversionErrors.NO_NAME: '"{value}" has no defined color name in {spec}.',
+    ConversionErrors.NOT_A_STRING: "{value!r} is not a string.",
+}
+
+
+class BatchResult(typing.NamedTuple):
+    """
+    :class:`~typing.NamedTuple` representing the results of a batch conversion which
+    collects errors rather than raising them, such as :func:`hex_to_rgb_batch`.
+
+    .. attribute:: values
+
+       The converted values, as a :class:`list` with one entry per value of the
+       batch, which is :data:`None` for values which failed to convert.
+
+    .. attribute:: errors
+
+       The values which failed to convert, as :class:`ConversionErrors`.
+
+    """
+
+    values: list
+    errors: ConversionErrors
+
+
 # Union type representing the possible types of an integer RGB tuple.
 IntTuple = typing.Union[IntegerRGB, HTML5SimpleColor, typing.Tuple[int, int, int]]
 
 # Union type representing the possible types of a percentage RGB tuple.
 PercentTuple = typing.Union[PercentRGB, typing.Tuple[str, str, str]]
+
+# Union type representing the possible types of an HSL tuple.
+HSLTuple = typing.Union[HSL, typing.Tuple[float, float, float]]
+
+# Union type representing the possible types of an HWB tuple.
+HWBTuple = typing.Union[HWB, typing.Tuple[float, float, float]]
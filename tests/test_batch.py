@@ -0,0 +1,506 @@
+"""
+Test the conversions of whole columns of color values.
+
+"""
+
+# SPDX-License-Identifier: BSD-3-Clause
+
+import itertools
+import os
+import tempfile
+import unittest
+from array import array
+from unittest import mock
+
+import webcolors
+
+
+class ColumnConversionTests(unittest.TestCase):
+    """
+    Test the functions which convert columns of hexadecimal color values.
+
+    """
+
+    hex_values = ["#fff", "#000080", "#DAA520", "#fff", "#0099cc", "#000080"]
+
+    def test_hex_to_packed_array(self):
+        """
+        Conversion to packed integers matches conversion of each value with
+        :func:`webcolors.hex_to_rgb`.
+
+        """
+        result = webcolors.hex_to_packed_array(self.hex_values)
+        assert isinstance(result, array)
+        assert "I" == result.typecode
+        expected = []
+        for hex_value in self.hex_values:
+            red, green, blue = webcolors.hex_to_rgb(hex_value)
+            expected.append(red << 16 | green << 8 | blue)
+        assert expected == result.tolist()
+
+    def test_hex_to_rgb_columns(self):
+        """
+        Conversion to columns of components matches conversion of each value with
+        :func:`webcolors.hex_to_rgb`.
+
+        """
+        columns = webcolors.hex_to_rgb_columns(iter(self.hex_values))
+        for column in columns:
+            assert isinstance(column, array)
+            assert "B" == column.typecode
+        assert [webcolors.hex_to_rgb(value) for value in self.hex_values] == list(
+            zip(*columns)
+        )
+
+    def test_empty(self):
+        """
+        Converting an empty column produces empty arrays.
+
+        """
+        assert array("I") == webcolors.hex_to_packed_array([])
+        assert (array("B"),) * 3 == webcolors.hex_to_rgb_columns([])
+
+    def test_invalid_values(self):
+        """
+        A column containing an invalid value raises ValueError.
+
+        """
+        for function in (webcolors.hex_to_packed_array, webcolors.hex_to_rgb_columns):
+            with self.subTest(function=function.__name__):
+                with self.assertRaises(ValueError):
+                    function(["#fff", "#0099gg"])
+
+
+def arrow_buffers(values, large=False):
+    """
+    Return the offsets, data and validity buffers of an Arrow string array holding
+    the given values, of which None is null.
+
+    """
+    offsets = array("q" if large else "i", [0])
+    data = b""
+    validity = 0
+    for row, value in enumerate(values):
+        if value is not None:
+            data += value.encode("utf-8")
+            validity |= 1 << row
+        offsets.append(len(data))
+    return offsets, data, validity.to_bytes((len(values) + 7) // 8, "little")
+
+
+class ArrowBufferConversionTests(unittest.TestCase):
+    """
+    Test the functions which convert the buffers of Arrow string arrays.
+
+    """
+
+    def assert_converted(self, values, result_rgb, result_packed):
+        """
+        Assert that the given results are the conversions of the given values, with
+        invalid and null values marked as null.
+
+        """
+        expected = []
+        for value in values:
+            try:
+                expected.append(webcolors.hex_to_rgb(value))
+            except (TypeError, ValueError):
+                expected.append(None)
+        null_count = expected.count(None)
+        validity = sum(
+            1 << row for row, triplet in enumerate(expected) if triplet is not None
+        ).to_bytes((len(values) + 7) // 8, "little")
+        for result in (result_rgb, result_packed):
+            assert validity == result.validity
+            assert null_count == result.null_count
+        triplets = [triplet or (0, 0, 0) for triplet in expected]
+        assert bytes(sum(triplets, ())) == result_rgb.values
+        assert "I" == result_packed.values.typecode
+        assert [
+            red << 16 | green << 8 | blue for red, green, blue in triplets
+        ] == result_packed.values.tolist()
+
+    def test_conversions(self):
+        """
+        Columns of valid, invalid and null values are converted to the same colors as
+        :func:`webcolors.hex_to_rgb`, with invalid and null values marked as null.
+
+        """
+        test_columns = (
+            ["#000080", "#DAA520", "#ffffff", "#0099cc"] * 3,
+            ["#000080", "#fff", None, "#daa520", "#0099gg", "", "navy", "#000080"],
+            ["#gggggg", "#000080"],
+            ["#12345#", "#000080"],
+            ["#1#2345", "#000080"],
+            ["#12 34 "],
+            ["#ééé"],
+            [None, None, None],
+            [],
+        )
+        for values in test_columns:
+            for large in (False, True):
+                with self.subTest(values=values, large=large):
+                    offsets, data, validity = arrow_buffers(values, large)
+                    self.assert_converted(
+                        values,
+                        webcolors.hex_buffers_to_rgb(
+                            offsets, data, validity, large=large
+                        ),
+                        webcolors.hex_buffers_to_packed(
+                            offsets, data, validity, large=large
+                        ),
+                    )
+
+    def test_without_validity(self):
+        """
+        Columns without a validity bitmap are treated as having no nulls.
+
+        """
+        values = ["#000080", "#fff", "#0099gg"]
+        offsets, data, _ = arrow_buffers(values)
+        self.assert_converted(
+            values,
+            webcolors.hex_buffers_to_rgb(offsets, data),
+            webcolors.hex_buffers_to_packed(offsets, data),
+        )
+
+    def test_slices(self):
+        """
+        Columns which are slices of their buffers are converted from their offset,
+        for their length.
+
+        """
+        values = ["#000080", None, "#fff", "#daa520", "#0099gg", "#000000"] * 3
+        offsets, data, validity = arrow_buffers(values)
+        for offset, length in ((0, 18), (1, 4), (7, 9), (9, 3), (17, 1), (18, 0)):
+            with self.subTest(offset=offset, length=length):
+                self.assert_converted(
+                    values[offset : offset + length],
+                    webcolors.hex_buffers_to_rgb(
+                        offsets, data, validity, offset=offset, length=length
+                    ),
+                    webcolors.hex_buffers_to_packed(
+                        offsets, data, validity, offset=offset, length=length
+                    ),
+                )
+
+    def test_offsets_too_short(self):
+        """
+        Offsets buffers too short to hold the requested rows raise ValueError.
+
+        """
+        offsets, data, validity = arrow_buffers(["#000080", "#fff"])
+        for function in (webcolors.hex_buffers_to_rgb, webcolors.hex_buffers_to_packed):
+            with self.subTest(function=function.__name__):
+                with self.assertRaises(ValueError):
+                    function(offsets, data, validity, offset=1, length=2)
+
+
+class HexRecordConversionTests(unittest.TestCase):
+    """
+    Test the functions which decode fixed-width records of hexadecimal color values.
+
+    """
+
+    records = [
+        "#000080",
+        "#DAA520",
+        "#0099cc",
+        "000080#",
+        "#00g080",
+        "#00008",
+        "#fff   ",
+        "#ffffff",
+        "#-12345",
+    ]
+
+    def encode(self, separator, final=True):
+        """
+        Return the test records as bytes, each padded to seven bytes and followed by
+        the given separator, optionally omitting the final separator.
+
+        """
+        data = separator.join(record.ljust(7) for record in self.records)
+        return (data + (separator if final else "")).encode("ascii")
+
+    def assert_decoded(self, result):
+        """
+        Assert that a decoding of the test records matches the decoding of each
+        record by :func:`webcolors.hex_to_rgb`.
+
+        """
+        expected_values = []
+        expected_invalid = []
+        for position, record in enumerate(self.records):
+            try:
+                if len(record) != 7:
+                    raise ValueError(record)
+                expected_values.append(webcolors.hex_to_rgb(record))
+            except ValueError:
+                expected_values.append((0, 0, 0))
+                expected_invalid.append(position)
+        assert bytes(itertools.chain.from_iterable(expected_values)) == result.values
+        assert array("Q", expected_invalid) == result.invalid
+
+    def test_separators(self):
+        """
+        Records are decoded with and without separators, and with or without a final
+        separator.
+
+        """
+        for separator, final in (
+            ("", True),
+            ("\n", True),
+            ("\n", False),
+            ("\r\n", True),
+        ):
+            with self.subTest(separator=separator, final=final):
+                self.assert_decoded(
+                    webcolors.hex_records_to_rgb(
+                        self.encode(separator, final), record_size=7 + len(separator)
+                    )
+                )
+
+    def test_chunks(self):
+        """
+        Records are decoded identically when decoded in several chunks.
+
+        """
+        for chunk_size in (1, 2, 4):
+            with self.subTest(chunk_size=chunk_size):
+                with mock.patch("webcolors._batch._RECORDS_PER_CHUNK", chunk_size):
+                    self.assert_decoded(
+                        webcolors.hex_records_to_rgb(self.encode("\n"), record_size=8)
+                    )
+
+    def test_file(self):
+        """
+        Records are decoded from memory-mapped files, including empty files.
+
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "records.txt")
+            with open(path, "wb") as record_file:
+                record_file.write(self.encode("\n"))
+            self.assert_decoded(webcolors.hex_record_file_to_rgb(path, record_size=8))
+            with open(path, "wb"):
+                pass
+            result = webcolors.hex_record_file_to_rgb(path, record_size=8)
+            assert (bytearray(), array("Q")) == result
+
+    def test_invalid_sizes(self):
+        """
+        Record sizes too small to hold a color, and buffers which are not a whole
+        number of records, raise ValueError.
+
+        """
+        for data, record_size in (
+            (b"#000080", 6),
+            (b"#000080#", 7),
+            (b"#000080\n#", 8),
+        ):
+            with self.subTest(data=data, record_size=record_size):
+                with self.assertRaises(ValueError):
+                    webcolors.hex_records_to_rgb(data, record_size=record_size)
+
+
+class CollectingConversionTests(unittest.TestCase):
+    """
+    Test the batch conversions which collect errors rather than raising them.
+
+    """
+
+    hex_values = ["#fff", "#nope", "#000080", "#123456", "#nope", "navy", "#DAA520"]
+    names = ["navy", "Goldenrod", "octarine", "GRAY", "octarine", "#000080"]
+
+    def check(self, convert, function, values, **kwargs):
+        """
+        Check that a batch conversion gives the results of a single-value function,
+        reporting the values for which it raises ValueError, with the same messages.
+
+        """
+        result = convert(values, **kwargs)
+        expected_values, expected_errors = [], []
+        for index, value in enumerate(values):
+            try:
+                expected_values.append(function(value, **kwargs))
+            except ValueError as error:
+                expected_values.append(None)
+                expected_errors.append((index, str(error)))
+        assert expected_values == result.values
+        assert expected_errors == list(result.errors.messages())
+        assert [index for index, _ in expected_errors] == list(result.errors.indexes)
+        assert len(expected_errors) == len(result.errors.codes)
+
+    def test_matches_functions(self):
+        """
+        Each batch conversion gives the results and messages of the function it
+        corresponds to.
+
+        """
+        self.check(webcolors.hex_to_rgb_batch, webcolors.hex_to_rgb, self.hex_values)
+        for spec in (webcolors.HTML4, webcolors.CSS3):
+            with self.subTest(spec=spec):
+                self.check(
+                    webcolors.name_to_hex_batch,
+                    webcolors.name_to_hex,
+                    self.names,
+                    spec=spec,
+                )
+                self.check(
+                    webcolors.hex_to_name_batch,
+                    webcolors.hex_to_name,
+                    self.hex_values,
+                    spec=spec,
+                )
+
+    def test_codes(self):
+        """
+        Each error is recorded with the code of its cause and the value which caused
+        it.
+
+        """
+        errors = webcolors.hex_to_name_batch(self.hex_values).errors
+        assert [1, 3, 4, 5] == list(errors.indexes)
+        invalid, no_name = errors.INVALID_HEX, errors.NO_NAME
+        assert bytes([invalid, no_name, invalid, invalid]) == errors.codes
+        assert ["#nope", "#123456", "#nope", "navy"] == errors.values
+        errors = webcolors.name_to_hex_batch(self.names).errors
+        assert bytes([errors.UNDEFINED_NAME] * 3) == errors.codes
+        assert "css3" == errors.spec
+        assert '"#000080" is not defined as a named color in css3' == errors.message(2)
+
+    def test_no_errors(self):
+        """
+        Batches in which every value converts, including empty batches, report no
+        errors.
+
+        """
+        for values in ([], ["#fff", "#000080"]):
+            with self.subTest(values=values):
+                result = webcolors.hex_to_rgb_batch(iter(values))
+                assert [
+                    webcolors.hex_to_rgb(value) for value in values
+                ] == result.values
+                assert 0 == len(result.errors.indexes)
+                assert [] == list(result.errors.messages())
+
+    def test_not_strings(self):
+        """
+        Values which are not strings, whether hashable or not, are reported as errors
+        rather than raising exceptions.
+
+        """
+        nan = float("nan")
+        for convert, valid in (
+            (webcolors.hex_to_rgb_batch, "#fff"),
+            (webcolors.name_to_hex_batch, "navy"),
+            (webcolors.hex_to_name_batch, "#fff"),
+        ):
+            for values in (
+                [valid, None, nan, valid, None],
+                [valid, None, nan, ["#fff"], valid, {}],
+            ):
+                with self.subTest(convert=convert.__name__, values=values):
+                    result = convert(values)
+                    failed = [
+                        index
+                        for index, value in enumerate(values)
+                        if not isinstance(value, str)
+                    ]
+                    assert failed == list(result.errors.indexes)
+                    assert [values[index] for index in failed] == result.errors.values
+                    assert (
+                        bytes([result.errors.NOT_A_STRING] * len(failed))
+                        == result.errors.codes
+                    )
+                    for index, value in enumerate(values):
+                        assert (index in failed) == (result.values[index] is None)
+        errors = webcolors.hex_to_rgb_batch([None, ["#fff"]]).errors
+        assert [(0, "None is not a string."), (1, "['#fff'] is not a string.")] == list(
+            errors.messages()
+        )
+
+    def test_invalid_spec(self):
+        """
+        Converting names with an unsupported spec raises ValueError.
+
+        """
+        with self.assertRaises(ValueError):
+            webcolors.name_to_hex_batch(["navy"], spec="css4")
+        with self.assertRaises(ValueError):
+            webcolors.hex_to_name_batch(["#000080"], spec="css4")
+
+
+class FactorizedConversionTests(unittest.TestCase):
+    """
+    Test the conversion of columns by any function, once per distinct value.
+
+    """
+
+    values = ["black", "#DAA520", "chucknorris", "black", "#daa520", "black"]
+
+    def test_factorize(self):
+        """
+        Factorizing gives the distinct values in order of first appearance, and the
+        position among them of each value.
+
+        """
+        uniques, codes = webcolors.factorize(iter(self.values))
+        assert ["black", "#DAA520", "chucknorris", "#daa520"] == uniques
+        assert array("I", [0, 1, 2, 0, 3, 0]) == codes
+        assert self.values == [uniques[code] for code in codes]
+        assert ([], array("I")) == webcolors.factorize([])
+
+    def test_matches_map(self):
+        """
+        Converting once per distinct value gives the results of converting every
+        value, for each of the conversions it is meant for.
+
+        """
+        names = ["navy", "Goldenrod", "navy", "GRAY", "navy"]
+        for function, values in (
+            (webcolors.html5_parse_legacy_color, self.values),
+            (webcolors.hex_to_rgb, ["#fff", "#000080", "#FFF", "#fff"]),
+            (webcolors.name_to_hex, names),
+        ):
+            with self.subTest(function=function.__name__):
+                expected = list(map(function, values))
+                assert expected == webcolors.map_unique(function, iter(values))
+                assert expected == webcolors.map_factorized(
+                    function, *webcolors.factorize(values)
+                )
+
+    def test_tolist(self):
+        """
+        Arrays with a ``tolist()`` method, such as NumPy arrays, are read with it
+        rather than by iterating over them.
+
+        """
+        values = mock.Mock(spec=["tolist"])
+        values.tolist.return_value = ["#fff", "black", "#fff"]
+        assert (["#fff", "black"], array("I", [0, 1, 0])) == webcolors.factorize(values)
+        assert [4, 5, 4] == webcolors.map_unique(len, values)
+        codes = mock.Mock(spec=["tolist"])
+        codes.tolist.return_value = [1, 0]
+        assert [5, 4] == webcolors.map_factorized(len, ["#fff", "black"], codes)
+
+    def test_calls_once(self):
+        """
+        The conversion function is called once per distinct value.
+
+        """
+        function = mock.Mock(side_effect=str.upper)
+        assert ["A", "B", "A", "A"] == webcolors.map_unique(function, "abaa")
+        assert [mock.call("a"), mock.call("b")] == function.call_args_list
+
+    def test_errors(self):
+        """
+        Exceptions raised by the conversion function propagate, and codes which are
+        not positions of distinct values raise IndexError.
+
+        """
+        with self.assertRaises(ValueError):
+            webcolors.map_unique(webcolors.hex_to_rgb, ["#fff", "navy"])
+        with self.assertRaises(IndexError):
+            webcolors.map_factorized(webcolors.hex_to_rgb, ["#fff"], [0, 1])
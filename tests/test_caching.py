@@ -0,0 +1,85 @@
+"""
+Test the thread-safe caching of lazily-built lookup structures.
+
+"""
+
+# SPDX-License-Identifier: BSD-3-Clause
+# pylint: disable=protected-access
+
+import concurrent.futures
+import threading
+import unittest
+from unittest import mock
+
+import webcolors
+
+
+class CachedTests(unittest.TestCase):
+    """
+    Test the helper which builds and caches lookup structures.
+
+    """
+
+    def test_builds_once(self):
+        """
+        A structure is built once, and the same object is returned afterward.
+
+        """
+        cache = {}
+        build = mock.Mock(side_effect=lambda spec: [spec])
+        first = webcolors._caching._cached(cache, build, "css3")
+        second = webcolors._caching._cached(cache, build, "css3")
+        assert ["css3"] == first
+        assert first is second
+        build.assert_called_once_with("css3")
+
+    def test_errors_not_cached(self):
+        """
+        When building a structure fails, the error propagates and nothing is cached.
+
+        """
+        cache = {}
+        build = mock.Mock(side_effect=ValueError)
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                webcolors._caching._cached(cache, build, "css4")
+        assert {} == cache
+        assert 2 == build.call_count
+
+    def test_concurrent_builds(self):
+        """
+        When many threads request the same uncached structures at once, each is built
+        exactly once, and every thread receives the same object.
+
+        """
+        threads = 8
+        barrier = threading.Barrier(threads)
+        getters = (
+            (webcolors._nearest._palettes, webcolors._nearest._get_palette, ("css3",)),
+            (
+                webcolors._nearest._neighbor_indexes,
+                webcolors._nearest._get_neighbor_index,
+                ("css3", "lab"),
+            ),
+            (
+                webcolors._lookup._name_indexes,
+                webcolors._lookup._get_name_index,
+                ("css3",),
+            ),
+        )
+
+        def task():
+            """
+            Wait for every thread to be ready, then build or fetch each cached value.
+
+            """
+            barrier.wait()
+            return [getter(*args) for _, getter, args in getters]
+
+        for cache, _, _ in getters:
+            cache.clear()
+        webcolors._nearest._distance_matrices.clear()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
+            results = list(executor.map(lambda _: task(), range(threads)))
+        for position in range(len(getters)):
+            assert 1 == len({id(result[position]) for result in results})
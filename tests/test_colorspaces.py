@@ -0,0 +1,234 @@
+"""
+Test the conversions between RGB and the HSL and HWB color models.
+
+"""
+
+# SPDX-License-Identifier: BSD-3-Clause
+
+import itertools
+import math
+import unittest
+from array import array
+
+import webcolors
+
+
+class HSLConversionTests(unittest.TestCase):
+    """
+    Test the functions which convert between integer RGB triplets and HSL.
+
+    """
+
+    def test_rgb_to_hsl(self):
+        """
+        Test conversion from integer RGB triplet to HSL.
+
+        """
+        test_pairs = (
+            ((255, 0, 0), (0.0, 100.0, 50.0)),
+            ((0, 255, 0), (120.0, 100.0, 50.0)),
+            ((0, 0, 255), (240.0, 100.0, 50.0)),
+            ((255, 0, 255), (300.0, 100.0, 50.0)),
+            ((255, 255, 255), (0.0, 0.0, 100.0)),
+            ((0, 0, 0), (0.0, 0.0, 0.0)),
+            ((128, 128, 128), (0.0, 0.0, 128 * 100 / 255)),
+        )
+        for triplet, hsl in test_pairs:
+            with self.subTest(triplet=triplet):
+                result = webcolors.rgb_to_hsl(triplet)
+                assert isinstance(result, webcolors.HSL)
+                for expected, actual in zip(hsl, result):
+                    self.assertAlmostEqual(expected, actual)
+
+    def test_hsl_to_rgb(self):
+        """
+        Test conversion from HSL to integer RGB triplet, including hue wrapping and
+        clipping of out-of-range percentages.
+
+        """
+        test_pairs = (
+            ((0, 100, 50), (255, 0, 0)),
+            ((120, 100, 50), (0, 255, 0)),
+            ((240, 100, 25), (0, 0, 128)),
+            ((-120, 100, 50), (0, 0, 255)),
+            ((480, 100, 50), (0, 255, 0)),
+            ((0, 150, -10), (0, 0, 0)),
+            ((0, -10, 110), (255, 255, 255)),
+            ((43, 74.4, 49), (218, 165, 32)),
+        )
+        for hsl, triplet in test_pairs:
+            with self.subTest(hsl=hsl):
+                result = webcolors.hsl_to_rgb(hsl)
+                assert isinstance(result, webcolors.IntegerRGB)
+                assert triplet == result
+
+    def test_round_trip(self):
+        """
+        Converting integer RGB triplets to HSL and back is lossless.
+
+        """
+        for triplet in itertools.product(range(0, 256, 15), repeat=3):
+            assert triplet == webcolors.hsl_to_rgb(webcolors.rgb_to_hsl(triplet))
+
+
+class HWBConversionTests(unittest.TestCase):
+    """
+    Test the functions which convert between integer RGB triplets and HWB.
+
+    """
+
+    def test_rgb_to_hwb(self):
+        """
+        Test conversion from integer RGB triplet to HWB.
+
+        """
+        test_pairs = (
+            ((255, 0, 0), (0.0, 0.0, 0.0)),
+            ((0, 0, 0), (0.0, 0.0, 100.0)),
+            ((255, 255, 255), (0.0, 100.0, 0.0)),
+            ((0, 128, 0), (120.0, 0.0, 127 * 100 / 255)),
+        )
+        for triplet, hwb in test_pairs:
+            with self.subTest(triplet=triplet):
+                result = webcolors.rgb_to_hwb(triplet)
+                assert isinstance(result, webcolors.HWB)
+                for expected, actual in zip(hwb, result):
+                    self.assertAlmostEqual(expected, actual)
+
+    def test_hwb_to_rgb(self):
+        """
+        Test conversion from HWB to integer RGB triplet, including the gray produced
+        when whiteness and blackness add up to 100% or more.
+
+        """
+        test_pairs = (
+            ((0, 0, 0), (255, 0, 0)),
+            ((120, 0, 50), (0, 128, 0)),
+            ((0, 60, 60), (128, 128, 128)),
+            ((0, 100, 0), (255, 255, 255)),
+            ((0, -10, 200), (0, 0, 0)),
+        )
+        for hwb, triplet in test_pairs:
+            with self.subTest(hwb=hwb):
+                result = webcolors.hwb_to_rgb(hwb)
+                assert isinstance(result, webcolors.IntegerRGB)
+                assert triplet == result
+
+    def test_round_trip(self):
+        """
+        Converting integer RGB triplets to HWB and back is lossless.
+
+        """
+        for triplet in itertools.product(range(0, 256, 15), repeat=3):
+            assert triplet == webcolors.hwb_to_rgb(webcolors.rgb_to_hwb(triplet))
+
+
+class ArrayConversionTests(unittest.TestCase):
+    """
+    Test the array forms of the HSL and HWB conversions.
+
+    """
+
+    def setUp(self):
+        """
+        Build a buffer of RGB colors to convert.
+
+        """
+        self.triplets = list(itertools.product(range(0, 256, 51), repeat=3))
+        self.buffer = bytes(itertools.chain.from_iterable(self.triplets))
+
+    def test_array_matches_scalar(self):
+        """
+        The array forms produce the same values as the scalar forms.
+
+        """
+        for to_array, to_scalar in (
+            (webcolors.rgb_to_hsl_array, webcolors.rgb_to_hsl),
+            (webcolors.rgb_to_hwb_array, webcolors.rgb_to_hwb),
+        ):
+            with self.subTest(function=to_array.__name__):
+                result = to_array(memoryview(self.buffer))
+                assert isinstance(result, array)
+                expected = itertools.chain.from_iterable(map(to_scalar, self.triplets))
+                assert list(expected) == result.tolist()
+
+    def test_array_reverse_matches_scalar(self):
+        """
+        The array forms of the conversions to RGB produce the same colors as the
+        scalar forms, including for fractional, negative and out-of-range values.
+
+        """
+        values = list(
+            itertools.product(
+                (-400.5, -120, 0, 17.25, 90, 359.9, 720),
+                (-10, 0, 12.5, 50, 87.5, 100, 150),
+                (0, 25.5, 50, 60, 99.9),
+            )
+        )
+        for to_array, to_scalar in (
+            (webcolors.hsl_to_rgb_array, webcolors.hsl_to_rgb),
+            (webcolors.hwb_to_rgb_array, webcolors.hwb_to_rgb),
+        ):
+            with self.subTest(function=to_array.__name__):
+                result = to_array(array("d", itertools.chain.from_iterable(values)))
+                expected = itertools.chain.from_iterable(map(to_scalar, values))
+                assert bytes(expected) == result
+
+    def test_non_finite_hue(self):
+        """
+        Converting a color whose hue is NaN or infinite to RGB raises ValueError, in
+        both the scalar and array forms, including for achromatic colors.
+
+        """
+        for hue in (math.nan, math.inf, -math.inf):
+            for triplet in ((hue, 50, 50), (hue, 0, 100), (hue, 60, 60)):
+                for function, argument in (
+                    (webcolors.hsl_to_rgb, triplet),
+                    (webcolors.hwb_to_rgb, triplet),
+                    (webcolors.hsl_to_rgb_array, array("d", triplet)),
+                    (webcolors.hwb_to_rgb_array, array("d", (0, 0, 0) + triplet)),
+                ):
+                    with self.subTest(function=function.__name__, triplet=triplet):
+                        with self.assertRaisesRegex(
+                            ValueError, "is not a finite hue angle.$"
+                        ):
+                            function(argument)
+
+    def test_array_round_trip(self):
+        """
+        Converting a buffer to HSL or HWB and back reproduces the original buffer.
+
+        """
+        for forward, backward in (
+            (webcolors.rgb_to_hsl_array, webcolors.hsl_to_rgb_array),
+            (webcolors.rgb_to_hwb_array, webcolors.hwb_to_rgb_array),
+        ):
+            with self.subTest(function=forward.__name__):
+                assert self.buffer == backward(forward(self.buffer))
+
+    def test_array_reverse_clips(self):
+        """
+        The array forms of the conversions to RGB clip out-of-range percentages.
+
+        """
+        values = array("d", [0, 150, -10, 0, -10, 200])
+        assert b"\x00\x00\x00\xff\xff\xff" == webcolors.hsl_to_rgb_array(values)
+        assert b"\xff\xff\xff\x00\x00\x00" == webcolors.hwb_to_rgb_array(values)
+
+    def test_invalid_buffers(self):
+        """
+        Buffers of the wrong item type, or of a length which is not a multiple of three,
+        raise ValueError.
+
+        """
+        for function, value in (
+            (webcolors.rgb_to_hsl_array, b"\x00\x00"),
+            (webcolors.rgb_to_hsl_array, array("d", [0.0, 0.0, 0.0])),
+            (webcolors.rgb_to_hwb_array, memoryview(b"\x00" * 6)[::2]),
+            (webcolors.hsl_to_rgb_array, b"\x00\x00\x00"),
+            (webcolors.hsl_to_rgb_array, array("d", [0.0, 0.0])),
+            (webcolors.hwb_to_rgb_array, array("q", [0, 0, 0])),
+        ):
+            with self.subTest(function=function.__name__, value=value):
+                with self.assertRaises(ValueError):
+                    function(value)
@@ -9,10 +9,14 @@ library), see the file ``definitions.py`` in this directory.
 """
 
 # SPDX-License-Identifier: BSD-3-Clause
+# pylint: disable=protected-access
 
+import pathlib
+import tempfile
 import unittest
 
 import webcolors
+import webcolors._tablegen
 
 # The mappings of color names to values below are used for conformance testing; while
 # the main webcolors module makes use of alphabetized, normalized mappings to hex
@@ -224,3 +228,89 @@ class ConformanceTests(unittest.TestCase):
         """
         for color, triplet in SVG_COLOR_DEFINITIONS.items():
             assert triplet == webcolors.name_to_rgb(color)
+
+
+class GeneratedTableTests(unittest.TestCase):
+    """
+    Test that the precomputed lookup tables generated from the color definitions are
+    up to date and correct.
+
+    """
+
+    def test_tables_up_to_date(self):
+        """
+        The generated tables module matches the output of the generator.
+
+        """
+        tables_path = webcolors._tablegen._TABLES_PATH
+        assert tables_path.read_text(encoding="utf-8") == webcolors._tablegen.generate()
+
+    def test_generator_writes_module(self):
+        """
+        The generator writes the module source to the requested path.
+
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = pathlib.Path(directory) / "_tables.py"
+            webcolors._tablegen.main(path)
+            assert webcolors._tablegen.generate() == path.read_text(encoding="utf-8")
+
+    def test_derived_tables(self):
+        """
+        The derived tables agree with the definitions of the named colors.
+
+        """
+        definitions = webcolors._definitions
+        for spec in definitions._SUPPORTED_SPECIFICATIONS:
+            with self.subTest(spec=spec):
+                names_to_hex = definitions._get_name_to_hex_map(spec)
+                hex_to_names = definitions._get_hex_to_name_map(spec)
+                names_to_packed = definitions._get_name_to_packed_map(spec)
+                cased = definitions._get_cased_name_to_hex_map(spec)
+                packed_to_names = definitions._get_packed_to_name_map(spec)
+                cased_rgb = definitions._get_cased_name_to_rgb_map(spec)
+                assert set(names_to_hex.values()) == set(hex_to_names)
+                assert names_to_packed.keys() == names_to_hex.keys()
+                assert cased_rgb.keys() == cased.keys()
+                assert {
+                    int(hex_value[1:], 16): name
+                    for hex_value, name in hex_to_names.items()
+                } == packed_to_names
+                for name, hex_value in names_to_hex.items():
+                    assert names_to_hex[hex_to_names[hex_value]] == hex_value
+                    assert int(hex_value[1:], 16) == names_to_packed[name]
+                    triplet = cased_rgb[hex_to_names[hex_value]]
+                    assert webcolors.hex_to_rgb(hex_value) == cased_rgb[name]
+                    for variant in (name, name.upper(), name.title()):
+                        # The common letter cases are looked up as they are.
+                        assert hex_value == cased[variant]
+                        # Every name of a color shares a single triplet.
+                        assert cased_rgb[variant] is triplet
+                        assert hex_value == webcolors.name_to_hex(variant, spec)
+                        assert triplet == webcolors.name_to_rgb(variant, spec)
+                    # Any other letter case falls back to the lower-case name.
+                    mixed = name[:-1] + name[-1].upper()
+                    assert mixed not in cased
+                    assert mixed not in cased_rgb
+                    assert hex_value == webcolors.name_to_hex(mixed, spec)
+                    assert triplet is webcolors.name_to_rgb(mixed, spec)
+                for hex_value, name in hex_to_names.items():
+                    assert "grey" not in name
+
+    def test_unsupported_spec(self):
+        """
+        Requesting any table for an unsupported specification raises ValueError.
+
+        """
+        definitions = webcolors._definitions
+        for getter in (
+            definitions._get_name_to_hex_map,
+            definitions._get_hex_to_name_map,
+            definitions._get_name_to_packed_map,
+            definitions._get_cased_name_to_hex_map,
+            definitions._get_packed_to_name_map,
+            definitions._get_cased_name_to_rgb_map,
+        ):
+            with self.subTest(getter=getter.__name__):
+                with self.assertRaises(ValueError):
+                    getter("css4")
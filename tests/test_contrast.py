@@ -0,0 +1,196 @@
+"""
+Test the relative luminance and contrast ratio functions.
+
+"""
+
+# SPDX-License-Identifier: BSD-3-Clause
+
+import itertools
+import unittest
+from array import array
+
+import webcolors
+
+
+def reference_luminance(rgb_triplet):
+    """
+    Compute relative luminance directly from the formula given in WCAG 2.
+
+    """
+    linear = []
+    for value in rgb_triplet:
+        value /= 255
+        linear.append(
+            value / 12.92 if value <= 0.03928 else ((value + 0.055) / 1.055) ** 2.4
+        )
+    return 0.2126 * linear[0] + 0.7152 * linear[1] + 0.0722 * linear[2]
+
+
+class LuminanceTests(unittest.TestCase):
+    """
+    Test the relative luminance and contrast ratio of colors.
+
+    """
+
+    def test_relative_luminance(self):
+        """
+        Relative luminance matches the formula of WCAG 2 for every channel value.
+
+        """
+        for value in range(256):
+            for triplet in ((value, 0, 0), (0, value, 0), (0, 0, value)):
+                self.assertAlmostEqual(
+                    reference_luminance(triplet),
+                    webcolors.relative_luminance(triplet),
+                    places=12,
+                )
+        assert 0.0 == webcolors.relative_luminance((0, 0, 0))
+        self.assertAlmostEqual(1.0, webcolors.relative_luminance((255, 255, 255)))
+
+    def test_contrast_ratio(self):
+        """
+        Contrast ratio matches the formula of WCAG 2, regardless of the order of the
+        colors.
+
+        """
+        test_pairs = (
+            ((0, 0, 0), (255, 255, 255)),
+            ((0, 0, 128), (218, 165, 32)),
+            ((119, 119, 119), (255, 255, 255)),
+            ((10, 20, 30), (10, 20, 30)),
+        )
+        for first, second in test_pairs:
+            with self.subTest(first=first, second=second):
+                lighter, darker = sorted(
+                    (reference_luminance(first), reference_luminance(second)),
+                    reverse=True,
+                )
+                expected = (lighter + 0.05) / (darker + 0.05)
+                self.assertAlmostEqual(
+                    expected, webcolors.contrast_ratio(first, second)
+                )
+                assert webcolors.contrast_ratio(
+                    first, second
+                ) == webcolors.contrast_ratio(second, first)
+        self.assertAlmostEqual(
+            21.0, webcolors.contrast_ratio((0, 0, 0), (255, 255, 255))
+        )
+        # The well-known boundary: #777 on white just fails WCAG AA for text.
+        assert webcolors.contrast_ratio((119, 119, 119), (255, 255, 255)) < 4.5
+
+
+class LuminanceArrayTests(unittest.TestCase):
+    """
+    Test the array forms of the relative luminance and contrast ratio functions.
+
+    """
+
+    def test_arrays_match_scalar(self):
+        """
+        The array forms produce the same values as the scalar forms.
+
+        """
+        triplets = list(itertools.product(range(0, 256, 51), repeat=3))
+        first = bytes(itertools.chain.from_iterable(triplets))
+        second = first[::-1]
+        luminances = webcolors.relative_luminance_array(first)
+        assert isinstance(luminances, array)
+        assert [
+            webcolors.relative_luminance(t) for t in triplets
+        ] == luminances.tolist()
+        ratios = webcolors.contrast_ratio_array(first, memoryview(second))
+        assert [
+            webcolors.contrast_ratio(first[i : i + 3], second[i : i + 3])
+            for i in range(0, len(first), 3)
+        ] == ratios.tolist()
+
+    def test_invalid_buffers(self):
+        """
+        Invalid buffers, and buffers of different numbers of colors, raise
+        ValueError.
+
+        """
+        for function, args in (
+            (webcolors.relative_luminance_array, (b"\x00\x00",)),
+            (webcolors.contrast_ratio_array, (b"\x00" * 3, b"\x00" * 4)),
+            (webcolors.contrast_ratio_array, (b"\x00" * 3, b"\x00" * 6)),
+        ):
+            with self.subTest(function=function.__name__, args=args):
+                with self.assertRaises(ValueError):
+                    function(*args)
+
+
+class NamesWithContrastTests(unittest.TestCase):
+    """
+    Test the search for named colors meeting a contrast ratio.
+
+    """
+
+    def test_matches_exhaustive_search(self):
+        """
+        The named colors found are exactly those whose contrast ratio, computed one
+        by one, meets the minimum.
+
+        """
+        for spec, triplet, min_ratio in itertools.product(
+            (webcolors.HTML4, webcolors.CSS3),
+            ((0, 0, 0), (128, 128, 128), (255, 255, 255), (0, 0, 128), (255, 0, 0)),
+            (0.5, 1, 1.5, 3, 4.5, 7, 21, 22),
+        ):
+            with self.subTest(spec=spec, triplet=triplet, min_ratio=min_ratio):
+                expected = [
+                    name
+                    for name in webcolors.names(spec)
+                    if webcolors.contrast_ratio(
+                        triplet, webcolors.name_to_rgb(name, spec=spec)
+                    )
+                    >= min_ratio
+                ]
+                assert expected == webcolors.names_with_contrast(
+                    triplet, min_ratio=min_ratio, spec=spec
+                )
+
+    def test_exact_ratios(self):
+        """
+        Names whose contrast ratio is exactly the minimum are found, as are all names
+        meeting it, whatever the rounding of the bounds of the search.
+
+        """
+        for spec in (webcolors.HTML4, webcolors.CSS3):
+            rgb_triplets = [
+                webcolors.name_to_rgb(name, spec=spec) for name in webcolors.names(spec)
+            ]
+            for triplet in ((0, 0, 0), (128, 128, 128), (23, 180, 77), (0, 0, 128)):
+                with self.subTest(spec=spec, triplet=triplet):
+                    ratios = [
+                        webcolors.contrast_ratio(triplet, other)
+                        for other in rgb_triplets
+                    ]
+                    for min_ratio in set(ratios):
+                        assert [
+                            name
+                            for name, ratio in zip(webcolors.names(spec), ratios)
+                            if ratio >= min_ratio
+                        ] == webcolors.names_with_contrast(
+                            triplet, min_ratio=min_ratio, spec=spec
+                        )
+
+    def test_unsupported_spec(self):
+        """
+        Unsupported specifications raise ValueError.
+
+        """
+        with self.assertRaises(ValueError):
+            webcolors.names_with_contrast((0, 0, 0), spec="css4")
+
+    def test_invalid_ratio(self):
+        """
+        Minimum ratios which are not greater than 0 raise ValueError.
+
+        """
+        for min_ratio in (0, -1.5, float("nan")):
+            with self.subTest(min_ratio=min_ratio):
+                with self.assertRaisesRegex(
+                    ValueError, "^min_ratio must be greater than 0"
+                ):
+                    webcolors.names_with_contrast((0, 0, 0), min_ratio=min_ratio)
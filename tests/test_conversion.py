@@ -6,7 +6,9 @@ Test the color-format conversion utilities.
 # SPDX-License-Identifier: BSD-3-Clause
 # pylint: disable=protected-access
 
+import contextlib
 import unittest
+from unittest import mock
 
 import webcolors
 
@@ -435,3 +437,112 @@ class ConversionTests(unittest.TestCase):
             with self.subTest(spec=spec):
                 with self.assertRaises(ValueError):
                     webcolors.names(spec)
+
+    def test_names_tuple(self):
+        """
+        names_tuple() returns the same names as names(), as one shared tuple per spec,
+        and names() returns a new list on each call.
+
+        """
+        for spec in (webcolors.HTML4, webcolors.CSS2, webcolors.CSS21, webcolors.CSS3):
+            with self.subTest(spec=spec):
+                result = webcolors.names_tuple(spec)
+                assert isinstance(result, tuple)
+                assert list(result) == webcolors.names(spec)
+                assert result is webcolors.names_tuple(spec)
+                assert webcolors.names(spec) is not webcolors.names(spec)
+
+    def test_mappings(self):
+        """
+        name_to_hex_mapping() and hex_to_name_mapping() return read-only views which
+        agree with name_to_hex() and hex_to_name().
+
+        """
+        for spec in (webcolors.HTML4, webcolors.CSS2, webcolors.CSS21, webcolors.CSS3):
+            with self.subTest(spec=spec):
+                name_to_hex = webcolors.name_to_hex_mapping(spec)
+                hex_to_name = webcolors.hex_to_name_mapping(spec)
+                assert sorted(name_to_hex) == webcolors.names(spec)
+                for name, hex_value in name_to_hex.items():
+                    assert webcolors.name_to_hex(name, spec=spec) == hex_value
+                    assert (
+                        webcolors.hex_to_name(hex_value, spec=spec)
+                        == hex_to_name[hex_value]
+                    )
+                assert name_to_hex is webcolors.name_to_hex_mapping(spec)
+                for mapping in (name_to_hex, hex_to_name):
+                    with self.assertRaises(TypeError):
+                        mapping["navy"] = "#000000"
+
+    def test_mappings_invalid(self):
+        """
+        The mapping and tuple functions raise ValueError when asked for an unsupported
+        spec.
+
+        """
+        for function in (
+            webcolors.names_tuple,
+            webcolors.name_to_hex_mapping,
+            webcolors.hex_to_name_mapping,
+        ):
+            for spec in ("CSS0", "HTML12", "random"):
+                with self.subTest(function=function, spec=spec):
+                    with self.assertRaises(ValueError):
+                        function(spec)
+
+
+class NormalizationCountTests(unittest.TestCase):
+    """
+    Test that chained conversions normalize their input only once.
+
+    """
+
+    def test_normalized_once(self):
+        """
+        Conversions which pass through several formats normalize their input once, on
+        entry, and give the same results as chaining the public conversions.
+
+        """
+        percent_triplet = ("85.49%", "64.71%", "12.5%")
+        for function, argument, chained in (
+            (
+                webcolors.rgb_percent_to_name,
+                percent_triplet,
+                lambda value: webcolors.rgb_to_name(
+                    webcolors.rgb_percent_to_rgb(value)
+                ),
+            ),
+            (
+                webcolors.rgb_percent_to_hex,
+                percent_triplet,
+                lambda value: webcolors.rgb_to_hex(webcolors.rgb_percent_to_rgb(value)),
+            ),
+            (
+                webcolors.rgb_to_name,
+                (218, 165, 32),
+                lambda value: webcolors.hex_to_name(webcolors.rgb_to_hex(value)),
+            ),
+            (
+                webcolors.hex_to_rgb_percent,
+                "#daa520",
+                lambda value: webcolors.rgb_to_rgb_percent(webcolors.hex_to_rgb(value)),
+            ),
+        ):
+            with self.subTest(function=function.__name__):
+                module = webcolors._conversion
+                with contextlib.ExitStack() as stack:
+                    percent, integer, hex_value = (
+                        stack.enter_context(
+                            mock.patch.object(module, name, wraps=getattr(module, name))
+                        )
+                        for name in (
+                            "normalize_percent_triplet",
+                            "normalize_integer_triplet",
+                            "normalize_hex",
+                        )
+                    )
+                    result = function(argument)
+                assert (
+                    1 == percent.call_count + integer.call_count + hex_value.call_count
+                )
+                assert chained(argument) == result
@@ -0,0 +1,119 @@
+"""
+Test the interpolation of gradients between colors.
+
+"""
+
+# SPDX-License-Identifier: BSD-3-Clause
+
+import itertools
+import unittest
+from array import array
+
+import webcolors
+
+
+class InterpolationTests(unittest.TestCase):
+    """
+    Test the function which interpolates gradients between colors.
+
+    """
+
+    spaces = ("rgb", "linear-rgb", "lab")
+
+    def test_stops_reproduced(self):
+        """
+        Steps which fall on a stop reproduce the stop exactly, in every space.
+
+        """
+        stops = ["navy", "#DAA520", (12, 200, 34), ("100%", "50%", "0%"), "white"]
+        expected = [
+            webcolors.rgb_to_hex(triplet)
+            for triplet in (
+                webcolors.name_to_rgb("navy"),
+                webcolors.hex_to_rgb("#DAA520"),
+                (12, 200, 34),
+                webcolors.rgb_percent_to_rgb(("100%", "50%", "0%")),
+                (255, 255, 255),
+            )
+        ]
+        for space in self.spaces:
+            with self.subTest(space=space):
+                result = webcolors.interpolate(stops, 4 * 3 + 1, space=space)
+                assert expected == result[::3]
+
+    def test_round_trip(self):
+        """
+        Interpolating between two identical colors reproduces the color, in every
+        space.
+
+        """
+        for triplet in itertools.product(range(0, 256, 17), repeat=3):
+            for space in self.spaces:
+                assert [webcolors.rgb_to_hex(triplet)] * 2 == webcolors.interpolate(
+                    [triplet, triplet], 2, space=space
+                )
+
+    def test_rgb_interpolation(self):
+        """
+        Interpolation in RGB space matches interpolating each channel and rounding.
+
+        """
+        start, end = (0, 100, 255), (255, 0, 10)
+        steps = 37
+        expected = []
+        for step in range(steps):
+            fraction = step / (steps - 1)
+            expected.append(
+                webcolors.rgb_to_hex(
+                    tuple(
+                        int(first + (last - first) * fraction + 0.5)
+                        for first, last in zip(start, end)
+                    )
+                )
+            )
+        assert expected == webcolors.interpolate([start, end], steps)
+
+    def test_spaces_differ(self):
+        """
+        The midpoint of a gradient depends on the space it is interpolated in.
+
+        """
+        midpoints = {
+            webcolors.interpolate(["red", "blue"], 3, space=space)[1]
+            for space in self.spaces
+        }
+        assert 3 == len(midpoints)
+
+    def test_outputs(self):
+        """
+        Each output form holds the same colors.
+
+        """
+        stops = ["navy", "red", "yellow"]
+        hex_values = webcolors.interpolate(stops, 50)
+        packed = webcolors.interpolate(stops, 50, output="packed")
+        rgb = webcolors.interpolate(stops, 50, output="rgb")
+        assert isinstance(packed, array)
+        assert "I" == packed.typecode
+        assert isinstance(rgb, bytearray)
+        assert [int(value[1:], 16) for value in hex_values] == packed.tolist()
+        assert bytes.fromhex("".join(value[1:] for value in hex_values)) == rgb
+
+    def test_invalid_arguments(self):
+        """
+        Invalid stops, steps, spaces, output forms and specs raise ValueError.
+
+        """
+        for args, kwargs in (
+            ((["red"], 5), {}),
+            (([], 5), {}),
+            ((["red", "blue"], 1), {}),
+            ((["red", "notacolor"], 5), {}),
+            ((["red", "#ggg"], 5), {}),
+            ((["red", "blue"], 5), {"space": "hsl"}),
+            ((["red", "blue"], 5), {"output": "name"}),
+            ((["red", "blue"], 5), {"spec": "css4"}),
+        ):
+            with self.subTest(args=args, kwargs=kwargs):
+                with self.assertRaises(ValueError):
+                    webcolors.interpolate(*args, **kwargs)
@@ -0,0 +1,109 @@
+"""
+Test the lookup of color names by prefix and by edit distance.
+
+"""
+
+# SPDX-License-Identifier: BSD-3-Clause
+# pylint: disable=protected-access
+
+import unittest
+
+import webcolors
+
+
+class CompleteNamesTests(unittest.TestCase):
+    """
+    Test completion of color names from a prefix.
+
+    """
+
+    def test_complete_names(self):
+        """
+        Completion returns every name beginning with the prefix, in order.
+
+        """
+        for spec in webcolors._definitions._SUPPORTED_SPECIFICATIONS:
+            spec_names = webcolors.names(spec)
+            for prefix in ("", "b", "dark", "Light", "GRAY", "navy", "navyx", "q"):
+                with self.subTest(spec=spec, prefix=prefix):
+                    expected = [
+                        name for name in spec_names if name.startswith(prefix.lower())
+                    ]
+                    assert expected == webcolors.complete_names(prefix, spec)
+
+    def test_limit(self):
+        """
+        Completion returns no more than the requested number of names.
+
+        """
+        assert ["darkblue", "darkcyan"] == webcolors.complete_names("dark", limit=2)
+        assert [] == webcolors.complete_names("dark", limit=0)
+
+    def test_invalid_spec(self):
+        """
+        Completion raises ValueError for an unsupported specification.
+
+        """
+        with self.assertRaises(ValueError):
+            webcolors.complete_names("red", spec="css4")
+
+
+class SuggestNamesTests(unittest.TestCase):
+    """
+    Test suggestion of color names for misspelled names.
+
+    """
+
+    def test_edit_distance(self):
+        """
+        The edit distance is the Levenshtein distance.
+
+        """
+        for first, second, distance in (
+            ("", "", 0),
+            ("", "red", 3),
+            ("red", "red", 0),
+            ("drkblue", "darkblue", 1),
+            ("kitten", "sitting", 3),
+            ("lime", "olive", 2),
+        ):
+            with self.subTest(first=first, second=second):
+                assert distance == webcolors._lookup._edit_distance(first, second)
+                assert distance == webcolors._lookup._edit_distance(second, first)
+
+    def test_suggest_names(self):
+        """
+        Suggestions are the names within the maximum distance, closest first, and
+        match an exhaustive search of the names.
+
+        """
+        edit_distance = webcolors._lookup._edit_distance
+        for query in ("drkblue", "lightgoldenrodyelow", "Gren", "purpel", "zzz"):
+            for max_distance in (0, 1, 2, 3):
+                with self.subTest(query=query, max_distance=max_distance):
+                    expected = sorted(
+                        (edit_distance(query.lower(), name), name)
+                        for name in webcolors.names()
+                    )
+                    assert [
+                        name for distance, name in expected if distance <= max_distance
+                    ] == webcolors.suggest_names(query, max_distance)
+
+    def test_examples(self):
+        """
+        Common misspellings are corrected.
+
+        """
+        assert ["darkblue"] == webcolors.suggest_names("drkblue")
+        assert ["lightgoldenrodyellow"] == webcolors.suggest_names(
+            "lightgoldenrodyelow"
+        )
+        assert ["red"] == webcolors.suggest_names("RED", 0, spec=webcolors.HTML4)
+
+    def test_invalid_spec(self):
+        """
+        Suggestion raises ValueError for an unsupported specification.
+
+        """
+        with self.assertRaises(ValueError):
+            webcolors.suggest_names("red", spec="css4")
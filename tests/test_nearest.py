@@ -0,0 +1,381 @@
+"""
+Test the mapping of colors onto the nearest named color.
+
+"""
+
+# SPDX-License-Identifier: BSD-3-Clause
+# pylint: disable=protected-access
+
+import itertools
+import pickle
+import unittest
+
+import webcolors
+
+
+class NameIndexBufferTests(unittest.TestCase):
+    """
+    Test the function which maps buffers of pixels to indexes of named colors.
+
+    """
+
+    def test_named_colors_map_to_themselves(self):
+        """
+        Every named color maps to the index of its normalized name.
+
+        """
+        for spec in webcolors._definitions._SUPPORTED_SPECIFICATIONS:
+            with self.subTest(spec=spec):
+                spec_names = webcolors.names(spec)
+                triplets = [webcolors.name_to_rgb(name, spec) for name in spec_names]
+                buffer = bytes(itertools.chain.from_iterable(triplets))
+                result = webcolors.rgb_buffer_to_name_indexes(buffer, spec=spec)
+                assert len(spec_names) == len(result)
+                for triplet, index in zip(triplets, result):
+                    assert webcolors.rgb_to_name(triplet, spec) == spec_names[index]
+
+    def test_nearest(self):
+        """
+        Colors without a name map to the nearest named color.
+
+        """
+        test_pairs = (
+            ((250, 250, 250), "snow"),
+            ((1, 1, 1), "black"),
+            ((0, 0, 130), "navy"),
+            ((128, 128, 129), "gray"),
+            ((200, 0, 0), "firebrick"),
+        )
+        buffer = bytes(itertools.chain.from_iterable(pair[0] for pair in test_pairs))
+        result = webcolors.rgb_buffer_to_name_indexes(buffer)
+        for (_, name), index in zip(test_pairs, result):
+            assert name == webcolors.names()[index]
+
+    def test_grid_matches_full_search(self):
+        """
+        Searching only the candidates of a color's grid cell finds the same named
+        color as searching the whole palette, including on the edges of cells.
+
+        """
+        values = sorted(
+            {0, 255} | {edge + d for edge in range(16, 256, 48) for d in (-1, 0)}
+        )
+        for spec in webcolors._definitions._SUPPORTED_SPECIFICATIONS:
+            palette = webcolors._nearest._get_palette(spec)
+            with self.subTest(spec=spec):
+                for red, green, blue in itertools.product(values, repeat=3):
+                    expected = min(
+                        palette.colors,
+                        key=lambda color: (
+                            (red - color[0]) ** 2
+                            + (green - color[1]) ** 2
+                            + (blue - color[2]) ** 2,
+                            color[3],
+                        ),
+                    )[3]
+                    assert expected == webcolors._nearest._nearest_index(
+                        palette, red, green, blue
+                    )
+
+    def test_ties(self):
+        """
+        When two named colors are equally near, the alphabetically-first wins.
+
+        """
+        # (0, 0, 64) is equally distant from black and navy.
+        result = webcolors.rgb_buffer_to_name_indexes(
+            bytes([0, 0, 64]), spec=webcolors.HTML4
+        )
+        assert "black" == webcolors.names(webcolors.HTML4)[result[0]]
+
+    def test_rgba(self):
+        """
+        RGBA buffers are accepted, and the alpha channel is ignored.
+
+        """
+        buffer = bytes([255, 0, 0, 0, 0, 0, 128, 255])
+        result = webcolors.rgb_buffer_to_name_indexes(
+            buffer, spec=webcolors.HTML4, channels=4
+        )
+        assert ["red", "navy"] == [
+            webcolors.names(webcolors.HTML4)[index] for index in result
+        ]
+
+    def test_shape(self):
+        """
+        The result has the shape of the input, minus the channel dimension.
+
+        """
+        for channels in (3, 4):
+            with self.subTest(channels=channels):
+                image = memoryview(bytearray(2 * 5 * channels)).cast(
+                    "B", (2, 5, channels)
+                )
+                result = webcolors.rgb_buffer_to_name_indexes(image, channels=channels)
+                assert (2, 5) == result.shape
+        flat = webcolors.rgb_buffer_to_name_indexes(bytearray(12))
+        assert (4,) == flat.shape
+
+    def test_invalid(self):
+        """
+        Invalid buffers, channel counts or specifications raise ValueError.
+
+        """
+        for buffer, kwargs in (
+            (b"\x00\x00", {}),
+            (bytes(6), {"channels": 4}),
+            (bytes(6), {"channels": 2}),
+            (memoryview(bytes(12))[::2], {}),
+            (bytes(3), {"spec": "css4"}),
+        ):
+            with self.subTest(buffer=buffer, kwargs=kwargs):
+                with self.assertRaises(ValueError):
+                    webcolors.rgb_buffer_to_name_indexes(buffer, **kwargs)
+
+
+class NameHistogramTests(unittest.TestCase):
+    """
+    Test the streaming histogram of nearest named colors.
+
+    """
+
+    def test_counts(self):
+        """
+        Pixels fed in several chunks are all counted against their nearest names,
+        and the results are ordered by count and then by name.
+
+        """
+        histogram = webcolors.NameHistogram()
+        histogram.update(bytes([255, 0, 0, 0, 0, 128, 250, 0, 0]))
+        histogram.update(memoryview(bytes([0, 0, 130, 0, 0, 0, 255, 255, 255])))
+        assert 6 == histogram.total
+        assert [
+            ("navy", "#000080", 2),
+            ("red", "#ff0000", 2),
+            ("black", "#000000", 1),
+            ("white", "#ffffff", 1),
+        ] == histogram.most_common()
+        assert [("navy", "#000080", 2)] == histogram.most_common(1)
+        assert isinstance(histogram.most_common()[0], webcolors.NameCount)
+
+    def test_rgba(self):
+        """
+        RGBA buffers are counted with their alpha channel ignored.
+
+        """
+        histogram = webcolors.NameHistogram(spec=webcolors.HTML4)
+        histogram.update(bytes([0, 0, 0, 255, 0, 0, 0, 0]), channels=4)
+        assert [("black", "#000000", 2)] == histogram.most_common()
+
+    def test_empty(self):
+        """
+        A histogram with nothing counted has no results.
+
+        """
+        histogram = webcolors.NameHistogram()
+        histogram.update(b"")
+        assert 0 == histogram.total
+        assert [] == histogram.most_common()
+
+    def test_merge(self):
+        """
+        Merging histograms adds their counts, and survives a pickle round trip as
+        used to send histograms between processes.
+
+        """
+        first = webcolors.NameHistogram()
+        first.update(bytes([255, 0, 0]))
+        second = webcolors.NameHistogram()
+        second.update(bytes([255, 0, 0, 0, 0, 0]))
+        first.merge(pickle.loads(pickle.dumps(second)))
+        assert [("red", "#ff0000", 2), ("black", "#000000", 1)] == first.most_common()
+        assert 2 == second.total
+
+    def test_partial_pixels(self):
+        """
+        Chunks which do not end on a pixel boundary have their incomplete pixel held
+        over, and counted once a later chunk completes it.
+
+        """
+        pixels = bytes([255, 0, 0, 0, 0, 128, 250, 0, 0, 0, 0, 0, 255, 255, 255])
+        for channels in (3, 4):
+            data = (
+                pixels
+                if channels == 3
+                else bytes(
+                    itertools.chain.from_iterable(
+                        pixels[start : start + 3] + b"\xff"
+                        for start in range(0, len(pixels), 3)
+                    )
+                )
+            )
+            expected = webcolors.NameHistogram()
+            expected.update(data, channels=channels)
+            for sizes in ((1, 1, 1, 1), (2, 5, 0, 7), (8, 2)):
+                with self.subTest(channels=channels, sizes=sizes):
+                    histogram = webcolors.NameHistogram()
+                    start = 0
+                    for size in sizes:
+                        histogram.update(data[start : start + size], channels=channels)
+                        start += size
+                        assert start % channels == histogram.pending
+                        assert start // channels == histogram.total
+                    histogram.update(data[start:], channels=channels)
+                    assert 0 == histogram.pending
+                    assert expected.most_common() == histogram.most_common()
+
+    def test_partial_pixel_errors(self):
+        """
+        An incomplete pixel can only be completed by a chunk with the same number of
+        channels, and a histogram holding one cannot be merged into another, though
+        one can be merged into a histogram holding one.
+
+        """
+        histogram = webcolors.NameHistogram()
+        histogram.update(bytes([255, 0, 0, 0, 0]), channels=4)
+        with self.assertRaisesRegex(ValueError, "must be 4 to complete the pixel"):
+            histogram.update(bytes([0, 0]), channels=3)
+        assert 1 == histogram.pending
+        other = webcolors.NameHistogram()
+        with self.assertRaisesRegex(ValueError, "holding 1 bytes"):
+            other.merge(histogram)
+        other.update(bytes([255, 0, 0]))
+        histogram.merge(other)
+        histogram.update(bytes([0, 128, 0]), channels=4)
+        assert [("red", "#ff0000", 2), ("navy", "#000080", 1)] == (
+            histogram.most_common()
+        )
+
+    def test_invalid(self):
+        """
+        Unsupported specifications, and merging histograms for different
+        specifications, raise ValueError.
+
+        """
+        with self.assertRaises(ValueError):
+            webcolors.NameHistogram(spec="css4")
+        with self.assertRaises(ValueError):
+            webcolors.NameHistogram().merge(webcolors.NameHistogram(webcolors.HTML4))
+        with self.assertRaises(ValueError):
+            webcolors.NameHistogram().update(bytes(5), channels=5)
+
+
+class NearestNamesTests(unittest.TestCase):
+    """
+    Test the distance matrix and nearest-name queries.
+
+    """
+
+    def test_distance_matrix(self):
+        """
+        The distance matrix is symmetric, has a zero diagonal, follows the order of
+        names(), and is only computed once.
+
+        """
+        for metric in ("rgb", "lab"):
+            with self.subTest(metric=metric):
+                matrix = webcolors.distance_matrix(metric=metric)
+                size = len(webcolors.names())
+                assert size == len(matrix)
+                for i in range(size):
+                    assert 0.0 == matrix[i][i]
+                    for j in range(i):
+                        assert matrix[i][j] == matrix[j][i]
+                assert matrix is webcolors.distance_matrix(metric=metric)
+
+    def test_distance_matrix_values(self):
+        """
+        Distances in the matrix are measured using the requested metric.
+
+        """
+        spec_names = webcolors.names(webcolors.HTML4)
+        black, white = spec_names.index("black"), spec_names.index("white")
+        rgb = webcolors.distance_matrix(webcolors.HTML4, "rgb")
+        lab = webcolors.distance_matrix(webcolors.HTML4, "lab")
+        self.assertAlmostEqual(255 * 3**0.5, rgb[black][white])
+        self.assertAlmostEqual(100.0, lab[black][white])
+
+    def test_k_nearest_names(self):
+        """
+        Nearest-name queries return the nearest normalized names, nearest first.
+
+        """
+        assert [("navy", 2.0), ("darkblue", 9.0)] == webcolors.k_nearest_names(
+            (0, 0, 130), k=2
+        )
+        assert [("black", 64.0), ("navy", 64.0)] == webcolors.k_nearest_names(
+            (0, 0, 64), k=2, spec=webcolors.HTML4
+        )
+        result = webcolors.k_nearest_names((255, 0, 0), k=3, metric="lab")
+        assert ["red", "orangered"] == [item.name for item in result[:2]]
+        assert all(isinstance(item, webcolors.NameDistance) for item in result)
+
+    def test_k_nearest_names_named(self):
+        """
+        Queries for named colors return the color itself first, use the "gray"
+        spelling, and agree with a full computation.
+
+        """
+        for metric in ("rgb", "lab"):
+            for name in ("gray", "grey", "navy", "goldenrod"):
+                with self.subTest(metric=metric, name=name):
+                    triplet = webcolors.name_to_rgb(name)
+                    result = webcolors.k_nearest_names(triplet, k=5, metric=metric)
+                    assert (webcolors.rgb_to_name(triplet), 0.0) == result[0]
+                    index = webcolors._nearest._get_neighbor_index("css3", metric)
+                    expected = webcolors._nearest._k_nearest(
+                        index._replace(neighbors={}), metric, triplet, 5
+                    )
+                    assert expected == result
+                    names = [item.name for item in result]
+                    assert "grey" not in names and "slategrey" not in names
+
+    def test_k_nearest_names_batch(self):
+        """
+        Batch queries return the same results as individual queries.
+
+        """
+        triplets = [(0, 0, 130), (255, 0, 0), (0, 0, 130), (10, 200, 30)]
+        for metric in ("rgb", "lab"):
+            with self.subTest(metric=metric):
+                results = webcolors.k_nearest_names_batch(triplets, 3, metric=metric)
+                assert [
+                    webcolors.k_nearest_names(triplet, 3, metric=metric)
+                    for triplet in triplets
+                ] == results
+                results[0].clear()
+                assert 3 == len(results[2])
+
+    def test_k_nearest_names_invalid_k(self):
+        """
+        Asking for fewer than one name raises ValueError, whether or not the color is
+        a named color.
+
+        """
+        for k in (0, -1):
+            for triplet in ((0, 0, 128), (0, 0, 130)):
+                with self.subTest(k=k, triplet=triplet):
+                    with self.assertRaisesRegex(
+                        ValueError, f"^k must be at least 1, not {k}.$"
+                    ):
+                        webcolors.k_nearest_names(triplet, k)
+                    with self.assertRaisesRegex(
+                        ValueError, f"^k must be at least 1, not {k}.$"
+                    ):
+                        webcolors.k_nearest_names_batch([triplet], k)
+
+    def test_invalid(self):
+        """
+        Unsupported specifications or metrics raise ValueError.
+
+        """
+        for function, args in (
+            (webcolors.distance_matrix, ("css4",)),
+            (webcolors.distance_matrix, ("css3", "hsl")),
+            (webcolors.k_nearest_names, ((0, 0, 0), 1, "css4")),
+            (webcolors.k_nearest_names, ((0, 0, 0), 1, "css3", "hsl")),
+            (webcolors.k_nearest_names_batch, ([(0, 0, 0)], 1, "css3", "hsl")),
+        ):
+            with self.subTest(function=function.__name__, args=args):
+                with self.assertRaises(ValueError):
+                    function(*args)
@@ -0,0 +1,132 @@
+"""
+Test the conversion of batches of color values by pools of processes.
+
+"""
+
+# SPDX-License-Identifier: BSD-3-Clause
+
+import itertools
+import unittest
+
+import webcolors
+
+
+class ParallelConversionTests(unittest.TestCase):
+    """
+    Test the conversion of batches of color values by pools of processes.
+
+    """
+
+    hex_values = ["#fff", "#000080", "#DAA520", "#fff", "#0099cc", "#000080"] * 20
+
+    def rgb(self, hex_values):
+        """
+        Return the given hexadecimal values converted serially, as packed 8-bit RGB
+        colors.
+
+        """
+        return bytearray(
+            itertools.chain.from_iterable(map(webcolors.hex_to_rgb, hex_values))
+        )
+
+    def test_matches_serial(self):
+        """
+        Converting in parallel gives the same results as converting serially, for
+        any chunk size.
+
+        """
+        long_values = [webcolors.normalize_hex(value) for value in self.hex_values]
+        for values, chunk_size in (
+            (self.hex_values, 7),
+            (long_values, 5),
+            (long_values, 1000),
+        ):
+            with self.subTest(values=values[:2], chunk_size=chunk_size):
+                assert self.rgb(values) == webcolors.hex_to_rgb_parallel(
+                    iter(values), workers=2, chunk_size=chunk_size
+                )
+                assert webcolors.hex_to_packed_array(
+                    values
+                ) == webcolors.hex_to_packed_parallel(
+                    values, workers=2, chunk_size=chunk_size
+                )
+
+    def test_spawn(self):
+        """
+        Worker processes can be started with the "spawn" start method.
+
+        """
+        assert self.rgb(self.hex_values) == webcolors.hex_to_rgb_parallel(
+            self.hex_values, workers=2, chunk_size=50, start_method="spawn"
+        )
+
+    def test_empty(self):
+        """
+        Converting no values gives an empty result.
+
+        """
+        assert bytearray() == webcolors.hex_to_rgb_parallel([], workers=1)
+
+    def test_invalid_value(self):
+        """
+        An invalid value raises ValueError, with the message normalize_hex() gives.
+
+        """
+        values = self.hex_values + ["#nope"] + self.hex_values
+        with self.assertRaisesRegex(
+            ValueError, '^"#nope" is not a valid hexadecimal color value.$'
+        ):
+            webcolors.hex_to_packed_parallel(values, workers=2, chunk_size=16)
+
+    def test_invalid_options(self):
+        """
+        Numbers of workers or chunk sizes less than 1, and unsupported start methods,
+        raise ValueError.
+
+        """
+        for options in (
+            {"workers": 0},
+            {"chunk_size": 0},
+            {"workers": 1, "start_method": "teleport"},
+        ):
+            with self.subTest(options=options):
+                with self.assertRaises(ValueError):
+                    webcolors.hex_to_rgb_parallel(self.hex_values, **options)
+
+    def test_chunks(self):
+        """
+        Chunks are encoded as fixed-width records when every value is in the long
+        form, and are converted by workers whatever their encoding.
+
+        """
+        for values, fixed_width in (
+            (["#000080", "#DAA520", "#ffffff"], True),
+            (["#000080", "#fff"], False),
+        ):
+            with self.subTest(values=values):
+                data, lengths = webcolors._parallel._encode_chunk(values)
+                assert fixed_width == (not lengths)
+                assert self.rgb(values) == webcolors._parallel._hex_chunk_to_rgb(
+                    data, lengths, False
+                )
+                assert webcolors.hex_to_packed_array(values).tobytes() == (
+                    webcolors._parallel._hex_chunk_to_rgb(data, lengths, True)
+                )
+
+    def test_invalid_chunks(self):
+        """
+        Workers raise ValueError for chunks holding invalid values, whatever their
+        encoding.
+
+        """
+        for values, fixed_width in (
+            (["#000080", "#nope!!"], True),
+            (["#000080", "#nope"], False),
+            # Seven characters, but not seven bytes.
+            (["#00008\u00e9", "#ffffff"], False),
+        ):
+            with self.subTest(values=values):
+                data, lengths = webcolors._parallel._encode_chunk(values)
+                assert fixed_width == (not lengths)
+                with self.assertRaisesRegex(ValueError, "is not a valid hexadecimal"):
+                    webcolors._parallel._hex_chunk_to_rgb(data, lengths, False)
@@ -0,0 +1,158 @@
+"""
+Test the lazy conversion pipelines.
+
+"""
+
+# SPDX-License-Identifier: BSD-3-Clause
+
+import itertools
+import unittest
+
+import webcolors
+
+
+class PipelineTests(unittest.TestCase):
+    """
+    Test the lazy conversion pipelines.
+
+    """
+
+    legacy_values = [
+        "black",
+        "#DAA520",
+        "chucknorris",
+        " navy ",
+        "#fff",
+        "LightGrey",
+        "#123456",
+        "crap",
+    ]
+
+    def test_matches_functions(self):
+        """
+        Pipelines give the same results as applying the conversion functions in turn.
+
+        """
+        parsed = [webcolors.html5_parse_legacy_color(v) for v in self.legacy_values]
+        serialized = [webcolors.html5_serialize_simple_color(v) for v in parsed]
+        colors = webcolors.pipeline(self.legacy_values)
+        assert parsed == list(colors.parse_legacy())
+        assert serialized == list(colors.parse_legacy().to_hex())
+        for spec in (webcolors.HTML4, webcolors.CSS2, webcolors.CSS21, webcolors.CSS3):
+            expected = []
+            for value in serialized:
+                try:
+                    expected.append(webcolors.hex_to_name(value, spec=spec))
+                except ValueError:
+                    expected.append(None)
+            with self.subTest(spec=spec):
+                assert expected == list(
+                    colors.parse_legacy().to_hex().to_name(spec=spec, default=None)
+                )
+                assert expected == list(
+                    webcolors.pipeline(serialized).to_name(spec=spec, default=None)
+                )
+
+    def test_unnormalized_hex(self):
+        """
+        Hexadecimal values read from the source are normalized before being named, and
+        simple colors read from the source are serialized.
+
+        """
+        assert ["navy", "white"] == list(
+            webcolors.pipeline(["#000080", "#FFF"]).to_name()
+        )
+        assert ["#000080"] == list(webcolors.pipeline([(0, 0, 128)]).to_hex())
+
+    def test_no_name(self):
+        """
+        Without a default, colors with no name raise ValueError as they are reached,
+        with the message :func:`hex_to_name` gives.
+
+        """
+        for colors in (
+            webcolors.pipeline(["navy", "#123456"]).parse_legacy().to_hex(),
+            webcolors.pipeline(["#000080", "#123456"]),
+        ):
+            names = iter(colors.to_name())
+            assert "navy" == next(names)
+            with self.assertRaisesRegex(
+                ValueError, '^"#123456" has no defined color name in css3.$'
+            ):
+                next(names)
+
+    def test_fused_invalid_simple_colors(self):
+        """
+        Fusing the serialization and naming stages changes no result, and no
+        exception, for values which are not valid simple colors.
+
+        """
+
+        def outcome(function, value):
+            """
+            Return the result of applying a function to a value, or the type and
+            message of the exception it raises.
+
+            """
+            try:
+                return function(value)
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                return type(error), str(error)
+
+        for value in (
+            (0, 0, 128),
+            (1, 2, 3),
+            (0, 256, 0),
+            (1, 0, 65536),
+            (-1, 0, 0),
+            (0.0, 0, 128),
+            (True, 0, 0),
+            ("0", 0, 128),
+            (0, 0),
+        ):
+            for default in (None, webcolors._pipeline._NO_DEFAULT):
+                with self.subTest(value=value, default=default):
+                    fused = (
+                        webcolors.pipeline([value]).to_hex().to_name(default=default)
+                    )
+                    assert outcome(lambda value: list(fused)[0], value) == outcome(
+                        lambda value: list(
+                            webcolors.pipeline(
+                                [webcolors.html5_serialize_simple_color(value)]
+                            ).to_name(default=default)
+                        )[0],
+                        value,
+                    )
+
+    def test_lazy(self):
+        """
+        Values are read from the source only as results are needed, and pipelines are
+        not changed by adding stages to them.
+
+        """
+        read = []
+
+        def source():
+            """
+            Yield an endless stream of values, recording each value read.
+
+            """
+            for value in itertools.cycle(self.legacy_values):
+                read.append(value)
+                yield value
+
+        colors = webcolors.pipeline(source())
+        names = colors.parse_legacy().to_hex().to_name(default=None)
+        assert [] == read
+        assert ["black", "goldenrod"] == list(itertools.islice(names, 2))
+        assert 2 == len(read)
+        assert "chucknorris" == next(iter(colors))
+
+    def test_invalid_spec(self):
+        """
+        Naming colors from an unsupported spec raises ValueError when the stage is
+        added.
+
+        """
+        with self.assertRaises(ValueError):
+            webcolors.pipeline([]).to_name(spec="css4")
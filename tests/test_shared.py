@@ -0,0 +1,334 @@
+"""
+Test the palette index which can be shared between processes.
+
+"""
+
+# SPDX-License-Identifier: BSD-3-Clause
+
+import itertools
+import mmap
+import pickle
+import tempfile
+import unittest
+from multiprocessing import shared_memory
+
+import webcolors
+
+
+class SharedPaletteIndexTests(unittest.TestCase):
+    """
+    Test the lookups and lifecycle of shared palette indexes.
+
+    """
+
+    def test_lookups_match_module_functions(self):
+        """
+        Lookups in a palette index give the same results as the module-level
+        functions, for every supported specification.
+
+        """
+        triplets = list(itertools.product(range(0, 256, 51), repeat=3))
+        pixels = bytes(itertools.chain.from_iterable(triplets))
+        for spec in (webcolors.HTML4, webcolors.CSS2, webcolors.CSS21, webcolors.CSS3):
+            with self.subTest(spec=spec):
+                index = webcolors.SharedPaletteIndex(
+                    webcolors.build_palette_index(spec)
+                )
+                assert spec == index.spec
+                assert webcolors.names(spec) == [
+                    index.index_to_name(position)
+                    for position in range(len(webcolors.names(spec)))
+                ]
+                expected = webcolors.rgb_buffer_to_name_indexes(pixels, spec=spec)
+                assert expected == index.rgb_buffer_to_name_indexes(pixels)
+                for triplet, position in zip(triplets, expected):
+                    assert webcolors.names(spec)[position] == index.nearest_name(
+                        triplet
+                    )
+                for name in webcolors.names(spec):
+                    rgb = webcolors.name_to_rgb(name, spec=spec)
+                    assert webcolors.rgb_to_name(rgb, spec=spec) == index.rgb_to_name(
+                        rgb
+                    )
+
+    def test_rgb_to_name_unnamed(self):
+        """
+        Exact lookups of colors with no name raise ValueError.
+
+        """
+        index = webcolors.SharedPaletteIndex(webcolors.build_palette_index())
+        for triplet in ((0, 0, 1), (255, 255, 254), (1, 2, 3)):
+            with self.subTest(triplet=triplet):
+                with self.assertRaises(ValueError):
+                    index.rgb_to_name(triplet)
+
+    def test_index_to_name_out_of_range(self):
+        """
+        Positions outside the list of names raise IndexError.
+
+        """
+        index = webcolors.SharedPaletteIndex(
+            webcolors.build_palette_index(webcolors.HTML4)
+        )
+        for position in (-1, 16):
+            with self.subTest(position=position):
+                with self.assertRaises(IndexError):
+                    index.index_to_name(position)
+
+    def test_buffer_shape(self):
+        """
+        Buffer lookups keep the shape of multidimensional input, like
+        :func:`webcolors.rgb_buffer_to_name_indexes`.
+
+        """
+        index = webcolors.SharedPaletteIndex(webcolors.build_palette_index())
+        pixels = memoryview(bytes(range(24))).cast("B", (2, 3, 4))
+        result = index.rgb_buffer_to_name_indexes(pixels, channels=4)
+        assert (2, 3) == result.shape
+        assert webcolors.rgb_buffer_to_name_indexes(pixels, channels=4) == result
+
+    def test_invalid_buffers(self):
+        """
+        Buffers which do not hold a palette index raise ValueError.
+
+        """
+        data = webcolors.build_palette_index()
+        for value in (
+            b"",
+            data[:15],
+            b"XXXX" + data[4:],
+            data[:4] + b"\x01\x00" + data[6:],
+            data[:-1],
+        ):
+            with self.subTest(value=value[:8]):
+                with self.assertRaises(ValueError):
+                    webcolors.SharedPaletteIndex(value)
+
+    def test_memory_mapped_file(self):
+        """
+        A palette index can be loaded in place from a memory-mapped file.
+
+        """
+        with tempfile.TemporaryFile() as index_file:
+            index_file.write(webcolors.build_palette_index())
+            index_file.flush()
+            with mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with webcolors.SharedPaletteIndex(mapped) as index:
+                    assert index.name is None
+                    assert "navy" == index.rgb_to_name((0, 0, 128))
+
+    def test_shared_memory(self):
+        """
+        A palette index created in shared memory can be attached to by name, and
+        pickles by name rather than by value.
+
+        """
+        created = webcolors.SharedPaletteIndex.create(webcolors.CSS21)
+        try:
+            with webcolors.SharedPaletteIndex.attach(created.name) as attached:
+                assert webcolors.CSS21 == attached.spec
+                assert "orange" == attached.rgb_to_name((255, 165, 0))
+                assert created.name == attached.name
+            pickled = pickle.dumps(created)
+            assert len(pickled) < 200
+            with pickle.loads(pickled) as unpickled:
+                assert created.name == unpickled.name
+                assert "orange" == unpickled.nearest_name((250, 160, 0))
+        finally:
+            created.close()
+            created.unlink()
+        with self.assertRaises(FileNotFoundError):
+            webcolors.SharedPaletteIndex.attach(created.name)
+
+    def test_pickle_by_value(self):
+        """
+        A palette index loaded from some other buffer pickles by value.
+
+        """
+        index = webcolors.SharedPaletteIndex(webcolors.build_palette_index())
+        unpickled = pickle.loads(pickle.dumps(index))
+        assert unpickled.name is None
+        assert "navy" == unpickled.rgb_to_name((0, 0, 128))
+
+    def test_attach_invalid(self):
+        """
+        Attaching to a shared memory block which does not hold a palette index raises
+        ValueError, and leaves the block intact.
+
+        """
+        block = shared_memory.SharedMemory(create=True, size=64)
+        try:
+            with self.assertRaises(ValueError):
+                webcolors.SharedPaletteIndex.attach(block.name)
+        finally:
+            block.close()
+            block.unlink()
+
+    def test_unlink_without_shared_memory(self):
+        """
+        Unlinking an index which is not held in shared memory raises ValueError.
+
+        """
+        index = webcolors.SharedPaletteIndex(webcolors.build_palette_index())
+        with self.assertRaises(ValueError):
+            index.unlink()
+
+
+class SharedLegacyColorCacheTests(unittest.TestCase):
+    """
+    Test the lookups and lifecycle of shared legacy color caches.
+
+    """
+
+    values = [
+        "chucknorris",
+        "#fff",
+        " navy ",
+        "Window",
+        "rgb(12, 200, 34)",
+        "#1234567890abcdef",
+        "\N{GREEK SMALL LETTER ALPHA}\N{GREEK SMALL LETTER BETA}",
+    ]
+
+    def test_results_match_parser(self):
+        """
+        Parsing through the cache gives the same results as parsing directly, and
+        caches them.
+
+        """
+        cache = webcolors.SharedLegacyColorCache(webcolors.build_legacy_color_cache())
+        for value in self.values:
+            with self.subTest(value=value):
+                assert cache.lookup(value) is None
+                expected = webcolors.html5_parse_legacy_color(value)
+                assert expected == cache.html5_parse_legacy_color(value)
+                assert expected == cache.lookup(value)
+                assert expected == cache.html5_parse_legacy_color(value)
+
+    def test_errors_not_cached(self):
+        """
+        Values rejected by the parser raise ValueError, and are not cached.
+
+        """
+        cache = webcolors.SharedLegacyColorCache(webcolors.build_legacy_color_cache())
+        for value in ("", "transparent", b"#fff"):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    cache.html5_parse_legacy_color(value)
+        assert webcolors.build_legacy_color_cache() == cache._view
+
+    def test_long_values(self):
+        """
+        Values longer than the maximum length are parsed, but not cached.
+
+        """
+        cache = webcolors.SharedLegacyColorCache(
+            webcolors.build_legacy_color_cache(max_length=8)
+        )
+        assert (192, 0, 0) == cache.html5_parse_legacy_color("chucknorris")
+        assert cache.lookup("chucknorris") is None
+        assert (255, 255, 255) == cache.html5_parse_legacy_color("#ffffff")
+        assert (255, 255, 255) == cache.lookup("#ffffff")
+
+    def test_eviction(self):
+        """
+        A full cache evicts entries to store new ones, and never holds more entries
+        than its size.
+
+        """
+        cache = webcolors.SharedLegacyColorCache(
+            webcolors.build_legacy_color_cache(entries=4)
+        )
+        for value in self.values:
+            cache.html5_parse_legacy_color(value)
+        cached = [value for value in self.values if cache.lookup(value) is not None]
+        assert self.values[-4:] == cached
+        for value in self.values:
+            with self.subTest(value=value):
+                assert webcolors.html5_parse_legacy_color(
+                    value
+                ) == cache.html5_parse_legacy_color(value)
+
+    def test_torn_entry(self):
+        """
+        An entry whose contents do not match its checksum, as when it is read while
+        being overwritten, is treated as a cache miss.
+
+        """
+        cache = webcolors.SharedLegacyColorCache(
+            webcolors.build_legacy_color_cache(entries=4)
+        )
+        cache.html5_parse_legacy_color("chucknorris")
+        # Corrupt the red channel of the only entry, which starts after the 12-byte
+        # header and the 4-byte checksum.
+        cache._view[16] ^= 0xFF
+        assert cache.lookup("chucknorris") is None
+        assert (192, 0, 0) == cache.html5_parse_legacy_color("chucknorris")
+        assert (192, 0, 0) == cache.lookup("chucknorris")
+
+    def test_shared_memory(self):
+        """
+        A cache created in shared memory is shared with caches attached to it by
+        name or by pickling.
+
+        """
+        created = webcolors.SharedLegacyColorCache.create(entries=64)
+        try:
+            with webcolors.SharedLegacyColorCache.attach(created.name) as attached:
+                attached.html5_parse_legacy_color("chucknorris")
+                assert created.name == attached.name
+            assert (192, 0, 0) == created.lookup("chucknorris")
+            with pickle.loads(pickle.dumps(created)) as unpickled:
+                assert (192, 0, 0) == unpickled.lookup("chucknorris")
+        finally:
+            created.close()
+            created.unlink()
+
+    def test_memory_mapped_file(self):
+        """
+        A cache can be held in a file memory-mapped for writing, and pickles by value
+        otherwise.
+
+        """
+        with tempfile.TemporaryFile() as cache_file:
+            cache_file.write(webcolors.build_legacy_color_cache(entries=64))
+            cache_file.flush()
+            with mmap.mmap(cache_file.fileno(), 0) as mapped:
+                with webcolors.SharedLegacyColorCache(mapped) as cache:
+                    assert cache.name is None
+                    cache.html5_parse_legacy_color("chucknorris")
+                    copy = pickle.loads(pickle.dumps(cache))
+            with mmap.mmap(cache_file.fileno(), 0) as mapped:
+                with webcolors.SharedLegacyColorCache(mapped) as cache:
+                    assert (192, 0, 0) == cache.lookup("chucknorris")
+        assert (192, 0, 0) == copy.lookup("chucknorris")
+        with self.assertRaises(ValueError):
+            copy.unlink()
+
+    def test_invalid_buffers(self):
+        """
+        Buffers which are read-only, or which do not hold a cache, raise ValueError.
+
+        """
+        data = webcolors.build_legacy_color_cache(entries=4)
+        for value in (
+            bytes(data),
+            bytearray(),
+            data[:15],
+            b"XXXX" + data[4:],
+            data[:4] + b"\x02\x00" + data[6:],
+            data[:-1],
+        ):
+            with self.subTest(value=bytes(value[:8])):
+                with self.assertRaises(ValueError):
+                    webcolors.SharedLegacyColorCache(value)
+
+    def test_invalid_sizes(self):
+        """
+        Caches with no entries, or too long a maximum length, cannot be built.
+
+        """
+        for entries, max_length in ((0, 54), (2**32, 54), (16, 0), (16, 2**16)):
+            with self.subTest(entries=entries, max_length=max_length):
+                with self.assertRaises(ValueError):
+                    webcolors.build_legacy_color_cache(entries, max_length)
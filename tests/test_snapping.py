@@ -0,0 +1,97 @@
+"""
+Test snapping of colors to grids.
+
+"""
+
+# SPDX-License-Identifier: BSD-3-Clause
+
+import itertools
+import unittest
+
+import webcolors
+
+
+class SnappingTests(unittest.TestCase):
+    """
+    Test snapping of colors to grids.
+
+    """
+
+    def test_web_safe(self):
+        """
+        With the default number of levels, every channel snaps to the nearest
+        multiple of 51.
+
+        """
+        for value in range(256):
+            with self.subTest(value=value):
+                expected = 51 * round(value / 51)
+                assert (expected, 0, 255) == webcolors.snap_rgb((value, 0, 255))
+
+    def test_nearest_level(self):
+        """
+        Every channel value snaps to the nearest level, with ties going to the lower
+        level, for every number of levels.
+
+        """
+        for levels in range(2, 257):
+            # Levels halfway between two integers round up.
+            grid = [int(level * 255 / (levels - 1) + 0.5) for level in range(levels)]
+            table = webcolors.snap_rgb_buffer(bytes(range(256)) * 3, levels=levels)
+            with self.subTest(levels=levels):
+                assert sorted(set(table)) == grid
+                for value in range(256):
+                    assert min(grid, key=lambda level: (abs(value - level), level)) == (
+                        table[value]
+                    )
+
+    def test_forms_agree(self):
+        """
+        Snapping triplets, hexadecimal values, packed integers and buffers gives the
+        same results.
+
+        """
+        triplets = list(itertools.product(range(0, 256, 15), repeat=3))
+        for levels in (2, 6, 17):
+            snapped = webcolors.snap_rgb_buffer(
+                bytes(itertools.chain.from_iterable(triplets)), levels=levels
+            )
+            for position, triplet in enumerate(triplets):
+                with self.subTest(levels=levels, triplet=triplet):
+                    expected = webcolors.snap_rgb(triplet, levels=levels)
+                    assert tuple(snapped[3 * position : 3 * position + 3]) == expected
+                    assert webcolors.rgb_to_hex(expected) == webcolors.snap_hex(
+                        webcolors.rgb_to_hex(triplet), levels=levels
+                    )
+                    packed = int(webcolors.rgb_to_hex(triplet)[1:], 16)
+                    assert int(webcolors.rgb_to_hex(expected)[1:], 16) == (
+                        webcolors.snap_packed(packed, levels=levels)
+                    )
+
+    def test_alpha_unchanged(self):
+        """
+        Snapping RGBA buffers leaves the alpha channel unchanged.
+
+        """
+        pixels = bytes([10, 20, 30, 40, 250, 240, 230, 220])
+        assert bytes([0, 0, 51, 40, 255, 255, 255, 220]) == webcolors.snap_rgb_buffer(
+            pixels, channels=4
+        )
+
+    def test_invalid(self):
+        """
+        Invalid numbers of levels, packed values and channel counts raise ValueError.
+
+        """
+        for levels in (-1, 0, 1, 257):
+            with self.subTest(levels=levels):
+                with self.assertRaises(ValueError):
+                    webcolors.snap_rgb((0, 0, 0), levels=levels)
+        for value in (-1, 0x1000000):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    webcolors.snap_packed(value)
+        with self.assertRaises(ValueError):
+            webcolors.snap_rgb_buffer(bytes(6), channels=2)
+        with self.assertRaises(ValueError):
+            webcolors.snap_hex("#ggg")
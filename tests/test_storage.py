@@ -0,0 +1,163 @@
+"""
+Test the color file format.
+
+"""
+
+# SPDX-License-Identifier: BSD-3-Clause
+
+import itertools
+import os
+import tempfile
+import unittest
+from array import array
+
+import webcolors
+
+
+class ColorFileTests(unittest.TestCase):
+    """
+    Test writing, reading and converting color files.
+
+    """
+
+    hex_values = ["#000080", "#daa520", "#ffffff", "#000000", "#daa520", "#123456"]
+
+    def setUp(self):
+        """
+        Create a directory to hold the files of each test.
+
+        """
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def path(self, name):
+        """
+        Return the path of a file in the test's directory.
+
+        """
+        return os.path.join(self.directory, name)
+
+    def rgb(self):
+        """
+        Return the test colors as packed 8-bit RGB colors.
+
+        """
+        return bytes(
+            itertools.chain.from_iterable(
+                webcolors.hex_to_rgb(value) for value in self.hex_values
+            )
+        )
+
+    def test_round_trip(self):
+        """
+        Colors written in either layout are read back unchanged.
+
+        """
+        packed = webcolors.hex_to_packed_array(self.hex_values)
+        for layout, values in (("packed", packed), ("rgb", self.rgb())):
+            with self.subTest(layout=layout):
+                path = self.path(f"{layout}.wcc")
+                assert len(self.hex_values) == webcolors.write_color_file(
+                    path, values, layout=layout
+                )
+                assert 16 + len(memoryview(values).cast("B")) == os.path.getsize(path)
+                with webcolors.read_color_file(path) as colors:
+                    assert layout == colors.layout
+                    assert len(self.hex_values) == len(colors)
+                    assert bytes(memoryview(values).cast("B")) == bytes(colors.values)
+                    assert self.rgb() == colors.to_rgb()
+
+    def test_buffer(self):
+        """
+        Color files can be read from any buffer holding their contents.
+
+        """
+        path = self.path("colors.wcc")
+        webcolors.write_color_file(path, self.rgb(), layout="rgb")
+        with open(path, "rb") as color_file:
+            colors = webcolors.ColorFile(color_file.read())
+        assert self.rgb() == bytes(colors.values)
+        colors.close()
+
+    def test_hex_file_round_trip(self):
+        """
+        Text files of hexadecimal values convert to color files and back, in chunks.
+
+        """
+        source = self.path("source.txt")
+        with open(source, "w", encoding="ascii") as hex_file:
+            hex_file.write(" #000080\n#DAA520\n\n#fff\n#000\n#daa520\n#123456")
+        for layout in ("packed", "rgb"):
+            for chunk_size in (1, 4, 100):
+                with self.subTest(layout=layout, chunk_size=chunk_size):
+                    color_path = self.path(f"{layout}-{chunk_size}.wcc")
+                    assert 6 == webcolors.hex_file_to_color_file(
+                        source, color_path, layout=layout, chunk_size=chunk_size
+                    )
+                    with webcolors.read_color_file(color_path) as colors:
+                        assert self.rgb() == colors.to_rgb()
+                    destination = self.path(f"{layout}-{chunk_size}.txt")
+                    assert 6 == webcolors.color_file_to_hex_file(
+                        color_path, destination, chunk_size=chunk_size
+                    )
+                    with open(destination, encoding="ascii") as hex_file:
+                        assert self.hex_values == hex_file.read().splitlines()
+
+    def test_empty(self):
+        """
+        Empty color files can be written, read and converted.
+
+        """
+        path = self.path("empty.wcc")
+        assert 0 == webcolors.write_color_file(path, array("I"))
+        with webcolors.read_color_file(path) as colors:
+            assert 0 == len(colors)
+        assert 0 == webcolors.color_file_to_hex_file(path, self.path("empty.txt"))
+
+    def test_invalid_values(self):
+        """
+        Writing invalid colors, or using an unsupported layout, raises ValueError.
+
+        """
+        path = self.path("invalid.wcc")
+        for values, layout in (
+            (array("I", [0x1000000]), "packed"),
+            (bytes(4), "rgb"),
+            (bytes(6), "bgr"),
+        ):
+            with self.subTest(values=values, layout=layout):
+                with self.assertRaises(ValueError):
+                    webcolors.write_color_file(path, values, layout=layout)
+        source = self.path("invalid.txt")
+        with open(source, "w", encoding="ascii") as hex_file:
+            hex_file.write("#000080\nnavy\n")
+        with self.assertRaises(ValueError):
+            webcolors.hex_file_to_color_file(source, path)
+        with self.assertRaises(ValueError):
+            webcolors.hex_file_to_color_file(source, path, layout="bgr")
+
+    def test_invalid_files(self):
+        """
+        Reading buffers or files which do not hold a color file raises ValueError.
+
+        """
+        path = self.path("colors.wcc")
+        webcolors.write_color_file(path, self.rgb(), layout="rgb")
+        with open(path, "rb") as color_file:
+            data = color_file.read()
+        for value in (
+            b"",
+            data[:15],
+            b"XXXX" + data[4:],
+            data[:4] + b"\x02\x00" + data[6:],
+            data[:6] + b"\x02" + data[7:],
+            data[:-1],
+        ):
+            with self.subTest(value=value[:8]):
+                with self.assertRaises(ValueError):
+                    webcolors.ColorFile(value)
+        with open(path, "wb") as color_file:
+            color_file.write(data[:-1])
+        with self.assertRaises(ValueError):
+            webcolors.read_color_file(path)
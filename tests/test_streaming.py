@@ -0,0 +1,282 @@
+"""
+Test the conversion of asynchronous streams of color values.
+
+"""
+
+# SPDX-License-Identifier: BSD-3-Clause
+
+import asyncio
+import concurrent.futures
+import pickle
+import threading
+import unittest
+
+import webcolors
+
+
+async def stream(values, delay=0):
+    """
+    Yield the given values, optionally sleeping before each.
+
+    """
+    for value in values:
+        if delay:
+            await asyncio.sleep(delay)
+        yield value
+
+
+class IteratorStream:
+    """
+    Asynchronous iterator over the given values, which has no ``aclose()`` method.
+
+    """
+
+    def __init__(self, values):
+        self.values = iter(values)
+
+    def __aiter__(self):
+        """
+        Return the iterator itself.
+
+        """
+        return self
+
+    async def __anext__(self):
+        """
+        Return the next value.
+
+        """
+        try:
+            return next(self.values)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+class StreamConversionTests(unittest.IsolatedAsyncioTestCase):
+    """
+    Test the conversion of asynchronous streams of color values.
+
+    """
+
+    hex_values = ["#fff", "#000080", "#DAA520", "#fff", "#0099cc", "#000080"] * 50
+
+    async def test_order(self):
+        """
+        Converted values are yielded in the order of the stream, for any batch size
+        and number of pending batches, with the default or a given executor.
+
+        """
+        expected = [webcolors.hex_to_rgb(value) for value in self.hex_values]
+        with concurrent.futures.ThreadPoolExecutor(2) as executor:
+            for batch_size, max_pending, pool in (
+                (1, 1, None),
+                (7, 2, None),
+                (1024, 3, executor),
+                (16, 4, executor),
+            ):
+                with self.subTest(batch_size=batch_size, max_pending=max_pending):
+                    result = [
+                        value
+                        async for value in webcolors.hex_to_rgb_stream(
+                            stream(self.hex_values),
+                            batch_size=batch_size,
+                            max_pending=max_pending,
+                            executor=pool,
+                        )
+                    ]
+                    assert expected == result
+
+    async def test_custom_conversion(self):
+        """
+        Any batch conversion function can be used.
+
+        """
+        result = [
+            value
+            async for value in webcolors.convert_stream(
+                stream(self.hex_values), webcolors.hex_to_packed_array, batch_size=10
+            )
+        ]
+        assert list(webcolors.hex_to_packed_array(self.hex_values)) == result
+
+    async def test_partial_batches(self):
+        """
+        A batch is converted once its delay has passed, even if it is not full.
+
+        """
+        received = asyncio.Event()
+
+        async def waiting_stream():
+            """
+            Yield one value, then wait until it has been converted before yielding
+            another.
+
+            """
+            yield "#fff"
+            await received.wait()
+            yield "#000"
+
+        results = []
+        async for value in webcolors.hex_to_rgb_stream(
+            waiting_stream(), batch_size=100, max_delay=0.001
+        ):
+            results.append(value)
+            received.set()
+        assert [(255, 255, 255), (0, 0, 0)] == results
+
+    async def test_backpressure(self):
+        """
+        A consumer which stops consuming stops the stream from being read further.
+
+        """
+        read = []
+
+        async def counted_stream():
+            """
+            Yield many values, recording each value read.
+
+            """
+            for value in self.hex_values:
+                read.append(value)
+                yield value
+
+        results = webcolors.hex_to_rgb_stream(
+            counted_stream(), batch_size=2, max_pending=2
+        )
+        assert (255, 255, 255) == await results.__anext__()
+        await asyncio.sleep(0.05)
+        # Two batches being converted, a full queue, and one value waiting to be
+        # put in the queue.
+        assert len(read) <= 7
+        await results.aclose()
+
+    async def test_early_stop(self):
+        """
+        A consumer which stops early, while the queue is full, leaves no task pending
+        and closes the stream.
+
+        """
+        closed = asyncio.Event()
+
+        async def closed_stream():
+            """
+            Yield many values, recording when the stream is closed.
+
+            """
+            try:
+                for value in self.hex_values:
+                    yield value
+            finally:
+                closed.set()
+
+        for source in (closed_stream(), IteratorStream(self.hex_values)):
+            with self.subTest(source=type(source).__name__):
+                before = asyncio.all_tasks()
+                results = webcolors.hex_to_rgb_stream(
+                    source, batch_size=4, max_pending=1
+                )
+                received = 0
+                async for _ in results:
+                    received += 1
+                    await asyncio.sleep(0.01)
+                    if received == 6:
+                        break
+                await results.aclose()
+                assert before == asyncio.all_tasks()
+        assert closed.is_set()
+
+    async def test_conversion_error(self):
+        """
+        An exception raised by converting a batch propagates once the results of the
+        preceding batches have been yielded.
+
+        """
+        results = []
+        with self.assertRaises(ValueError):
+            async for value in webcolors.hex_to_rgb_stream(
+                stream(["#fff", "#000", "nope", "#fff"]), batch_size=2
+            ):
+                results.append(value)
+        assert [(255, 255, 255), (0, 0, 0)] == results
+
+    async def test_conversion_error_with_pending_batches(self):
+        """
+        An exception raised by converting a batch propagates while later batches are
+        still pending.
+
+        """
+        later_batch_started = threading.Event()
+
+        def convert(batch):
+            """
+            Fail to convert the first batch, once the conversion of the next batch has
+            started.
+
+            """
+            if batch == ["nope"]:
+                later_batch_started.wait(5)
+                raise ValueError("Invalid batch.")
+            later_batch_started.set()
+            return batch
+
+        with concurrent.futures.ThreadPoolExecutor(2) as executor:
+            with self.assertRaises(ValueError):
+                async for _ in webcolors.convert_stream(
+                    stream(["nope", "#fff", "#000"]),
+                    convert,
+                    batch_size=1,
+                    max_pending=3,
+                    executor=executor,
+                ):
+                    pass  # pragma: no cover
+
+    async def test_stream_error(self):
+        """
+        An exception raised by reading the stream propagates once the results of the
+        values read before it have been yielded.
+
+        """
+
+        async def failing_stream():
+            """
+            Yield some values, then fail.
+
+            """
+            yield "#fff"
+            yield "#000"
+            raise RuntimeError("Stream failed.")
+
+        results = []
+        with self.assertRaises(RuntimeError):
+            async for value in webcolors.hex_to_rgb_stream(
+                failing_stream(), batch_size=100, max_delay=0.001
+            ):
+                results.append(value)
+        assert [(255, 255, 255), (0, 0, 0)] == results
+
+    async def test_empty(self):
+        """
+        An empty stream yields nothing.
+
+        """
+        assert [] == [value async for value in webcolors.hex_to_rgb_stream(stream([]))]
+
+    async def test_invalid_options(self):
+        """
+        Batch sizes and numbers of pending batches less than 1 raise ValueError.
+
+        """
+        for batch_size, max_pending in ((0, 2), (1024, 0)):
+            with self.subTest(batch_size=batch_size, max_pending=max_pending):
+                with self.assertRaises(ValueError):
+                    await webcolors.hex_to_rgb_stream(
+                        stream(["#fff"]), batch_size=batch_size, max_pending=max_pending
+                    ).__anext__()
+
+    def test_picklable(self):
+        """
+        The batch conversion of hexadecimal values can be sent to a process pool.
+
+        """
+        convert = pickle.loads(pickle.dumps(webcolors._streaming._hex_batch_to_rgb))
+        assert [(255, 255, 255)] == convert(["#fff"])
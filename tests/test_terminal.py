@@ -0,0 +1,123 @@
+"""
+Test the conversions between colors and xterm palette indexes.
+
+"""
+
+# SPDX-License-Identifier: BSD-3-Clause
+
+import itertools
+import unittest
+
+import webcolors
+
+
+def brute_force_nearest(triplet, indexes):
+    """
+    Return the nearest of the palette colors with the given indexes to the given
+    color, by searching all of them.
+
+    """
+    return min(
+        indexes,
+        key=lambda index: (
+            sum(
+                (value - other) ** 2
+                for value, other in zip(triplet, webcolors.xterm_to_rgb(index))
+            ),
+            index,
+        ),
+    )
+
+
+class TerminalTests(unittest.TestCase):
+    """
+    Test the conversions between colors and xterm palette indexes.
+
+    """
+
+    triplets = list(itertools.product(range(0, 256, 17), repeat=3)) + [
+        (115, 115, 115),
+        (47, 48, 47),
+        (233, 233, 234),
+        (100, 101, 102),
+    ]
+
+    def test_xterm256_matches_search(self):
+        """
+        rgb_to_xterm256() finds the nearest color of the color cube and gray ramp.
+
+        """
+        for triplet in self.triplets:
+            with self.subTest(triplet=triplet):
+                assert brute_force_nearest(
+                    triplet, range(16, 256)
+                ) == webcolors.rgb_to_xterm256(triplet)
+
+    def test_xterm16_matches_search(self):
+        """
+        rgb_to_xterm16() finds the nearest system color.
+
+        """
+        for triplet in self.triplets:
+            with self.subTest(triplet=triplet):
+                assert brute_force_nearest(
+                    triplet, range(16)
+                ) == webcolors.rgb_to_xterm16(triplet)
+
+    def test_palette_round_trip(self):
+        """
+        Every color of the cube and gray ramp converts back to its own index, and
+        xterm_to_hex() agrees with xterm_to_rgb().
+
+        """
+        for index in range(256):
+            with self.subTest(index=index):
+                rgb = webcolors.xterm_to_rgb(index)
+                assert webcolors.rgb_to_hex(rgb) == webcolors.xterm_to_hex(index)
+                if index >= 16:
+                    assert index == webcolors.rgb_to_xterm256(rgb)
+                else:
+                    assert index == webcolors.rgb_to_xterm16(rgb)
+
+    def test_invalid_index(self):
+        """
+        Indexes outside the palette raise ValueError.
+
+        """
+        for index in (-1, 256):
+            for function in (webcolors.xterm_to_hex, webcolors.xterm_to_rgb):
+                with self.subTest(index=index, function=function):
+                    with self.assertRaises(ValueError):
+                        function(index)
+
+    def test_buffers(self):
+        """
+        The buffer forms give the same results as converting each color.
+
+        """
+        pixels = bytes(itertools.chain.from_iterable(self.triplets))
+        indexes = webcolors.rgb_buffer_to_xterm256(pixels)
+        assert [
+            webcolors.rgb_to_xterm256(triplet) for triplet in self.triplets
+        ] == indexes.tolist()
+        assert [
+            webcolors.rgb_to_xterm16(triplet) for triplet in self.triplets
+        ] == webcolors.rgb_buffer_to_xterm16(pixels).tolist()
+        assert bytes(
+            itertools.chain.from_iterable(
+                webcolors.xterm_to_rgb(index) for index in indexes
+            )
+        ) == webcolors.xterm_buffer_to_rgb(indexes)
+
+    def test_buffer_shape(self):
+        """
+        The buffer forms keep the shape of multidimensional RGBA input.
+
+        """
+        pixels = memoryview(bytes(range(24))).cast("B", (2, 3, 4))
+        for function in (
+            webcolors.rgb_buffer_to_xterm256,
+            webcolors.rgb_buffer_to_xterm16,
+        ):
+            with self.subTest(function=function):
+                assert (2, 3) == function(pixels, channels=4).shape